@@ -7,18 +7,31 @@ for various data types used within the GATF framework.
 
 import json
 import pickle
+import threading
 import yaml
 import msgpack
 import datetime
 import uuid
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, Union, Optional, Type, Callable
+from typing import Any, Dict, Union, Optional, Type, Callable, Tuple
 from enum import Enum
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, asdict, is_dataclass
 
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional accelerator
+    simdjson = None
+
+
+# Payloads at or above this size are parsed with simdjson when it is installed;
+# below it the stdlib parser is faster once call overhead is accounted for.
+SIMDJSON_THRESHOLD = 64 * 1024
+
+_simdjson_local = threading.local()
+
 
 class SerializationError(Exception):
     """Raised when serialization/deserialization fails"""
@@ -168,8 +181,26 @@ def _serialize_json(data: Any, **kwargs) -> bytes:
     return json_str.encode('utf-8')
 
 
+def _get_simdjson_parser():
+    """Get the simdjson parser for the current thread (parsers are not thread-safe)"""
+    parser = getattr(_simdjson_local, 'parser', None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser
+
+
 def _deserialize_json(data: bytes, **kwargs) -> Any:
     """Deserialize from JSON"""
+    # simdjson validates UTF-8 and parses in a single SIMD pass; it does not
+    # support json.loads hooks, so only use it for plain large payloads.
+    if simdjson is not None and not kwargs and len(data) >= SIMDJSON_THRESHOLD:
+        try:
+            return _get_simdjson_parser().parse(bytes(data), recursive=True)
+        except ValueError:
+            # simdjson is strict JSON; NaN and Infinity, which json.dumps
+            # writes by default, need the stdlib parser
+            pass
+    
     json_str = data.decode('utf-8')
     return json.loads(json_str, **kwargs)
 
@@ -326,6 +357,8 @@ class DataSerializer:
     
     def __init__(self):
         self._type_handlers: Dict[Type, Tuple[Callable, Callable]] = {}
+        self._name_to_deser: Dict[str, Callable] = {}
+        self._bare_name_owners: Dict[str, Type] = {}
         self._register_default_handlers()
     
     def _register_default_handlers(self):
@@ -361,6 +394,17 @@ class DataSerializer:
             deserializer: Function to deserialize the type
         """
         self._type_handlers[type_class] = (serializer, deserializer)
+        
+        # Index both the qualified and bare type names so deserialize can
+        # resolve '_type' markers with a single lookup
+        self._name_to_deser[f"{type_class.__module__}.{type_class.__name__}"] = deserializer
+        
+        # The first type registered under a bare name keeps it, as when
+        # handlers were scanned in registration order; re-registering that
+        # same type still replaces its deserializer
+        bare_name = type_class.__name__
+        if self._bare_name_owners.setdefault(bare_name, type_class) is type_class:
+            self._name_to_deser[bare_name] = deserializer
     
     def serialize(self, data: Any) -> Dict[str, Any]:
         """
@@ -403,9 +447,9 @@ class DataSerializer:
                 type_name = data['_type']
                 
                 # Look for registered handler
-                for type_class, (_, deserializer) in self._type_handlers.items():
-                    if f"{type_class.__module__}.{type_class.__name__}" == type_name or type_class.__name__ == type_name:
-                        return deserializer(data)
+                deserializer = self._name_to_deser.get(type_name)
+                if deserializer is not None:
+                    return deserializer(data)
                 
                 # Handle dataclass
                 if type_name == 'dataclass':
@@ -6,24 +6,154 @@ It provides comprehensive quality assessment including accuracy, performance,
 consistency, and format validation.
 """
 
-from typing import Dict, Any, List, Optional, Union, Callable, Tuple
+from typing import Dict, Any, List, Optional, Union, Callable, Tuple, Deque
 from datetime import datetime, timedelta
+import copy
+import os
 import time
 import json
 import re
-from collections import Counter
-from statistics import mean, stdev
+import pickle
+import hashlib
+import threading
+import weakref
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import math
+from array import array
 import numpy as np
 from dataclasses import dataclass, field
 
+try:
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:  # pragma: no cover - optional accelerator
+    _rf_levenshtein = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional accelerator
+    SentenceTransformer = None
+
 from ...core.exceptions import ValidationError, MetricCalculationError
 from ...domains.base_domain import ValidationResult, ValidationSeverity
 from ...utils.logging import get_logger, log_performance
+from ...utils.caching import MemoryCache
 
 logger = get_logger(__name__)
 
+# Shared decoder for JSON format checks; avoids json.loads' per-call setup
+_JSON_DECODER = json.JSONDecoder()
+
+# Suggestions attached to failing results. Each result gets its own list copy,
+# since results are handed to callers and may be stored or extended.
+_ACCURACY_SUGGESTIONS = (
+    "Review the model's training data",
+    "Consider fine-tuning on domain-specific data",
+    "Check for data preprocessing issues"
+)
+_CONSISTENCY_SUGGESTIONS = (
+    "Check for non-deterministic behavior",
+    "Ensure consistent temperature settings",
+    "Verify random seed configuration"
+)
+
+# Number of recent accuracy scores used for historical averages and trends
+ACCURACY_WINDOW = 10
+
+# Longest pattern handled by the bit-parallel Levenshtein fallback (one machine word)
+BIT_PARALLEL_MAX_LENGTH = 64
+
+# Minimum number of string comparisons before the parallel batch kernel is used
+BATCH_LEVENSHTEIN_MIN_SIZE = 8
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True, nogil=True)
+    def _levenshtein_batch_kernel(query, corpus, offsets):
+        """Edit distance from ``query`` to each code point slice of ``corpus``."""
+        n = offsets.shape[0] - 1
+        m = query.shape[0]
+        distances = np.empty(n, dtype=np.int64)
+        for k in prange(n):
+            start = offsets[k]
+            length = offsets[k + 1] - start
+            row = np.empty(m + 1, dtype=np.int64)
+            for j in range(m + 1):
+                row[j] = j
+            for i in range(length):
+                c = corpus[start + i]
+                diagonal = row[0]
+                row[0] = i + 1
+                for j in range(m):
+                    above = row[j + 1]
+                    cost = diagonal + (1 if query[j] != c else 0)
+                    best = min(above + 1, row[j] + 1)
+                    row[j + 1] = min(best, cost)
+                    diagonal = above
+            distances[k] = row[m]
+        return distances
+else:
+    _levenshtein_batch_kernel = None
+
+
+# Sequence types eligible for the vectorized numeric accuracy path
+_SEQUENCE_TYPES = (list, tuple, np.ndarray)
+
+# Placeholder for dict keys that exist on only one side of an accuracy comparison
+_MISSING = object()
 
-@dataclass
+
+def _bit_parallel_levenshtein(pattern: str, text: str) -> int:
+    """
+    Levenshtein distance using Myers' bit-vector algorithm (Hyyrö's variant).
+    
+    Each DP column is encoded as vertical +1/-1 delta bit vectors over
+    ``pattern``, so a column costs a handful of integer operations instead of
+    ``len(pattern)`` Python-level steps.
+    """
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+    
+    # Match masks: bit i of peq[c] is set when pattern[i] == c
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+def _code_points(text: str) -> np.ndarray:
+    """View a string as an array of Unicode code points."""
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+@dataclass(slots=True)
 class QualityCheckConfig:
     """Configuration for quality checks."""
     accuracy_threshold: float = 0.8
@@ -31,9 +161,15 @@ class QualityCheckConfig:
     consistency_threshold: float = 0.9
     format_strict: bool = False
     custom_checks: Dict[str, Callable] = field(default_factory=dict)
+    result_cache_size: int = 0  # 0 disables result caching
+    max_workers: int = 1  # >1 runs independent checks in a thread pool
+    # Sentence-transformers model for semantic consistency on large string
+    # batches (e.g. "all-MiniLM-L6-v2"); None keeps edit-distance similarity
+    embedding_model: Optional[str] = None
+    embedding_batch_min_size: int = 32
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for validation."""
     response_time: float
@@ -48,6 +184,67 @@ class PerformanceMetrics:
         return self.response_time < 10.0 and self.throughput > 10.0
 
 
+class _RunningStats:
+    """Streaming mean and variance using Welford's algorithm."""
+    
+    __slots__ = ("count", "mean", "_m2")
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def push(self, value: float):
+        """Add a sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance of the values seen so far."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+
+class _PerformanceHistory:
+    """
+    Columnar (structure-of-arrays) store for performance metric history.
+    
+    Timing columns are float32: ample precision for seconds and tokens/s, at
+    half the memory and bandwidth of float64. Reductions accumulate in float64.
+    """
+    
+    __slots__ = ("size", "response_time", "throughput", "tokens_processed")
+    
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        self.response_time = np.empty(capacity, dtype=np.float32)
+        self.throughput = np.empty(capacity, dtype=np.float32)
+        self.tokens_processed = np.empty(capacity, dtype=np.int64)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def append(self, metrics: PerformanceMetrics):
+        """Record one set of performance metrics, growing the columns as needed."""
+        if self.size == self.response_time.shape[0]:
+            capacity = 2 * self.size
+            self.response_time = np.resize(self.response_time, capacity)
+            self.throughput = np.resize(self.throughput, capacity)
+            self.tokens_processed = np.resize(self.tokens_processed, capacity)
+        
+        i = self.size
+        self.response_time[i] = metrics.response_time
+        self.throughput[i] = metrics.throughput
+        self.tokens_processed[i] = metrics.tokens_processed
+        self.size = i + 1
+    
+    def recent(self, column: str, n: int) -> np.ndarray:
+        """View of the last ``n`` values of a column."""
+        return getattr(self, column)[max(0, self.size - n):self.size]
+
+
 class QualityValidator:
     """
     Implements core quality validation for AI agent outputs.
@@ -68,8 +265,34 @@ class QualityValidator:
             config: Quality check configuration
         """
         self.config = config or QualityCheckConfig()
-        self._performance_history: List[PerformanceMetrics] = []
-        self._accuracy_history: List[float] = []
+        self._performance_history = _PerformanceHistory()
+        self._accuracy_stats = _RunningStats()
+        self._recent_accuracy: Deque[float] = deque(maxlen=ACCURACY_WINDOW)
+        self._recent_accuracy_sum = 0.0
+        # Checks may run on pool threads; this guards the history above and
+        # the lazily loaded embedding model
+        self._state_lock = threading.Lock()
+        self._embedding_model = None
+        self._result_cache = (
+            MemoryCache(max_size=self.config.result_cache_size)
+            if self.config.result_cache_size > 0 else None
+        )
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=self.config.max_workers,
+                thread_name_prefix="quality-check"
+            )
+            if self.config.max_workers > 1 else None
+        )
+        if self._executor is not None:
+            # Release the pool threads if the validator is dropped without shutdown()
+            self._executor_finalizer = weakref.finalize(self, self._executor.shutdown, wait=False)
+        
+    def __enter__(self) -> "QualityValidator":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
         
     @log_performance
     def validate(
@@ -89,55 +312,162 @@ class QualityValidator:
         Returns:
             List of validation results
         """
-        results = []
         context = context or {}
         
+        # Serve repeated validations from the result cache. Hits return copies
+        # and still record the accuracy and performance history.
+        result_key = None
+        if self._result_cache is not None:
+            result_key = self._result_cache_key(output, expected, context)
+            if result_key is not None:
+                cached_results = self._result_cache.get(result_key)
+                if cached_results is not None:
+                    results = copy.deepcopy(cached_results)
+                    self._replay_history(results, context)
+                    return results
+        
+        checks: List[Callable[[], Optional[ValidationResult]]] = []
+        
         # Accuracy validation
         if expected is not None:
-            accuracy_result = self.validate_accuracy(output, expected, context)
-            results.append(accuracy_result)
+            checks.append(partial(self.validate_accuracy, output, expected, context))
         
         # Performance validation
         if "performance_metrics" in context:
-            performance_result = self.validate_performance(
-                context["performance_metrics"]
-            )
-            results.append(performance_result)
+            checks.append(partial(self.validate_performance, context["performance_metrics"]))
         
         # Consistency validation
         if "previous_outputs" in context:
-            consistency_result = self.validate_consistency(
-                output,
-                context["previous_outputs"]
-            )
-            results.append(consistency_result)
+            checks.append(partial(self.validate_consistency, output, context["previous_outputs"]))
+        
+        # Format and statistical checks share one string rendering of the output.
+        # If rendering fails, each check renders again inside its own error
+        # handling and reports the failure as its result.
+        try:
+            output_str = output if isinstance(output, str) else str(output)
+        except Exception:
+            output_str = None
         
         # Format validation
-        format_result = self.validate_format(output, context)
-        results.append(format_result)
+        checks.append(partial(self.validate_format, output, context, output_str=output_str))
         
         # Statistical validation
-        stats_result = self.validate_statistics(output, context)
-        results.append(stats_result)
+        checks.append(partial(self.validate_statistics, output, context, output_str=output_str))
         
         # Custom checks
         for check_name, check_func in self.config.custom_checks.items():
-            try:
-                custom_result = check_func(output, expected, context)
-                if isinstance(custom_result, ValidationResult):
-                    results.append(custom_result)
-            except Exception as e:
-                logger.error(f"Custom check '{check_name}' failed: {str(e)}")
-                results.append(ValidationResult(
-                    check_name=f"custom_{check_name}",
-                    passed=False,
-                    score=0.0,
-                    severity=ValidationSeverity.MEDIUM,
-                    message=f"Custom check failed: {str(e)}"
-                ))
+            checks.append(partial(
+                self._run_custom_check, check_name, check_func, output, expected, context
+            ))
+        
+        # The checks are independent, so fan them out when a pool is configured;
+        # results keep their submission order either way
+        if self._executor is not None:
+            futures = [self._executor.submit(check) for check in checks]
+            check_results = [future.result() for future in futures]
+        else:
+            check_results = [check() for check in checks]
+        
+        results = [result for result in check_results if result is not None]
+        
+        if result_key is not None:
+            self._result_cache.set(result_key, copy.deepcopy(results))
         
         return results
     
+    def _replay_history(self, results: List[ValidationResult], context: Dict[str, Any]):
+        """
+        Record the history updates a cache hit would have made on a miss.
+        
+        Args:
+            results: Copies of the cached results, updated in place
+            context: Context information of the validation
+        """
+        for result in results:
+            if result.check_name == "accuracy_validation" and "accuracy_score" in result.details:
+                result.details["historical_average"] = self._record_accuracy(result.score)
+        
+        if "performance_metrics" in context:
+            perf_metrics = self._to_performance_metrics(context["performance_metrics"])
+            with self._state_lock:
+                self._performance_history.append(perf_metrics)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached validation results."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get result cache statistics.
+        
+        Returns:
+            The MemoryCache statistics (hits, misses, size, hit rate, ...),
+            or an empty dict when result caching is disabled
+        """
+        if self._result_cache is None:
+            return {}
+        return self._result_cache.get_stats()
+    
+    def _run_custom_check(
+        self,
+        check_name: str,
+        check_func: Callable,
+        output: Any,
+        expected: Any,
+        context: Dict[str, Any]
+    ) -> Optional[ValidationResult]:
+        """
+        Run a user-supplied check, converting failures into a result.
+        
+        Args:
+            check_name: Name of the custom check
+            check_func: Check callable
+            output: The output to validate
+            expected: Optional expected output
+            context: Context information
+            
+        Returns:
+            The check's result, or None if it did not return a ValidationResult
+        """
+        try:
+            custom_result = check_func(output, expected, context)
+            if isinstance(custom_result, ValidationResult):
+                return custom_result
+            return None
+        except Exception as e:
+            logger.error(f"Custom check '{check_name}' failed: {str(e)}")
+            return ValidationResult(
+                check_name=f"custom_{check_name}",
+                passed=False,
+                score=0.0,
+                severity=ValidationSeverity.MEDIUM,
+                message=f"Custom check failed: {str(e)}"
+            )
+    
+    def _result_cache_key(
+        self,
+        output: Any,
+        expected: Any,
+        context: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Build a content hash for the validation inputs.
+        
+        Args:
+            output: The output to validate
+            expected: Optional expected output
+            context: Context information
+            
+        Returns:
+            Hex digest, or None if the inputs cannot be hashed
+        """
+        try:
+            payload = pickle.dumps((output, expected, context), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
     def validate_accuracy(
         self,
         output: Any,
@@ -157,7 +487,7 @@ class QualityValidator:
         """
         try:
             accuracy_score = self._calculate_accuracy(output, expected)
-            self._accuracy_history.append(accuracy_score)
+            historical_average = self._record_accuracy(accuracy_score)
             
             passed = accuracy_score >= self.config.accuracy_threshold
             
@@ -171,14 +501,6 @@ class QualityValidator:
             else:
                 severity = ValidationSeverity.HIGH
             
-            suggestions = []
-            if not passed:
-                suggestions.extend([
-                    "Review the model's training data",
-                    "Consider fine-tuning on domain-specific data",
-                    "Check for data preprocessing issues"
-                ])
-            
             return ValidationResult(
                 check_name="accuracy_validation",
                 passed=passed,
@@ -188,10 +510,9 @@ class QualityValidator:
                 details={
                     "accuracy_score": accuracy_score,
                     "threshold": self.config.accuracy_threshold,
-                    "historical_average": mean(self._accuracy_history[-10:])
-                    if len(self._accuracy_history) > 0 else None
+                    "historical_average": historical_average
                 },
-                suggestions=suggestions
+                suggestions=[] if passed else list(_ACCURACY_SUGGESTIONS)
             )
             
         except Exception as e:
@@ -204,6 +525,26 @@ class QualityValidator:
                 message=f"Accuracy validation error: {str(e)}"
             )
     
+    def _record_accuracy(self, accuracy_score: float) -> float:
+        """
+        Update streaming accuracy statistics with a new score.
+        
+        Args:
+            accuracy_score: Accuracy score to record
+            
+        Returns:
+            Average accuracy over the recent window, including this score
+        """
+        with self._state_lock:
+            self._accuracy_stats.push(accuracy_score)
+            
+            # Keep a running sum over the bounded window instead of re-summing it
+            if len(self._recent_accuracy) == self._recent_accuracy.maxlen:
+                self._recent_accuracy_sum -= self._recent_accuracy[0]
+            self._recent_accuracy.append(accuracy_score)
+            self._recent_accuracy_sum += accuracy_score
+            return self._recent_accuracy_sum / len(self._recent_accuracy)
+    
     def validate_performance(
         self,
         metrics: Union[Dict[str, Any], PerformanceMetrics]
@@ -218,19 +559,9 @@ class QualityValidator:
             Validation result for performance
         """
         try:
-            # Convert dict to PerformanceMetrics if needed
-            if isinstance(metrics, dict):
-                perf_metrics = PerformanceMetrics(
-                    response_time=metrics.get("response_time", 0.0),
-                    tokens_processed=metrics.get("tokens_processed", 0),
-                    throughput=metrics.get("throughput", 0.0),
-                    memory_usage=metrics.get("memory_usage"),
-                    cpu_usage=metrics.get("cpu_usage")
-                )
-            else:
-                perf_metrics = metrics
-            
-            self._performance_history.append(perf_metrics)
+            perf_metrics = self._to_performance_metrics(metrics)
+            with self._state_lock:
+                self._performance_history.append(perf_metrics)
             
             # Check performance thresholds
             passed = (
@@ -280,6 +611,21 @@ class QualityValidator:
                 message=f"Performance validation error: {str(e)}"
             )
     
+    @staticmethod
+    def _to_performance_metrics(
+        metrics: Union[Dict[str, Any], PerformanceMetrics]
+    ) -> PerformanceMetrics:
+        """Convert a metrics dict to PerformanceMetrics if needed."""
+        if isinstance(metrics, dict):
+            return PerformanceMetrics(
+                response_time=metrics.get("response_time", 0.0),
+                tokens_processed=metrics.get("tokens_processed", 0),
+                throughput=metrics.get("throughput", 0.0),
+                memory_usage=metrics.get("memory_usage"),
+                cpu_usage=metrics.get("cpu_usage")
+            )
+        return metrics
+    
     def validate_consistency(
         self,
         output: Any,
@@ -306,40 +652,37 @@ class QualityValidator:
                 )
             
             # Calculate consistency scores
-            consistency_scores = []
-            for prev_output in previous_outputs:
-                score = self._calculate_similarity(output, prev_output)
-                consistency_scores.append(score)
+            consistency_scores = self._embedding_similarity(output, previous_outputs)
+            if consistency_scores is None:
+                consistency_scores = self._batch_string_similarity(output, previous_outputs)
+            if consistency_scores is None:
+                consistency_scores = np.fromiter(
+                    (self._calculate_similarity(output, prev_output) for prev_output in previous_outputs),
+                    dtype=np.float64,
+                    count=len(previous_outputs)
+                )
             
-            avg_consistency = mean(consistency_scores)
-            consistency_std = stdev(consistency_scores) if len(consistency_scores) > 1 else 0
+            avg_consistency = float(consistency_scores.mean())
+            consistency_std = float(consistency_scores.std(ddof=1)) if consistency_scores.size > 1 else 0
             
             passed = avg_consistency >= self.config.consistency_threshold
             
             severity = ValidationSeverity.LOW if passed else ValidationSeverity.MEDIUM
             
-            suggestions = []
-            if not passed:
-                suggestions.extend([
-                    "Check for non-deterministic behavior",
-                    "Ensure consistent temperature settings",
-                    "Verify random seed configuration"
-                ])
-            
             return ValidationResult(
                 check_name="consistency_validation",
                 passed=passed,
                 score=avg_consistency,
                 severity=severity,
                 message=f"Average consistency: {avg_consistency:.2%} "
-                       f"(={consistency_std:.3f})",
+                       f"(σ={consistency_std:.3f})",
                 details={
                     "average_consistency": avg_consistency,
                     "consistency_std": consistency_std,
                     "threshold": self.config.consistency_threshold,
                     "num_comparisons": len(previous_outputs)
                 },
-                suggestions=suggestions
+                suggestions=[] if passed else list(_CONSISTENCY_SUGGESTIONS)
             )
             
         except Exception as e:
@@ -355,7 +698,9 @@ class QualityValidator:
     def validate_format(
         self,
         output: Any,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        *,
+        output_str: Optional[str] = None
     ) -> ValidationResult:
         """
         Validate output format and structure.
@@ -363,6 +708,7 @@ class QualityValidator:
         Args:
             output: Output to validate
             context: Optional context with format requirements
+            output_str: Precomputed ``str(output)``, if available
             
         Returns:
             Validation result for format
@@ -371,32 +717,40 @@ class QualityValidator:
             format_issues = []
             format_score = 1.0
             
-            # Check JSON validity if output should be JSON
-            if context and context.get("expected_format") == "json":
+            # Check JSON validity if output should be JSON; already-parsed
+            # containers need no further work
+            if (
+                context
+                and context.get("expected_format") == "json"
+                and not isinstance(output, (dict, list))
+            ):
                 if isinstance(output, str):
                     try:
-                        json.loads(output)
+                        _JSON_DECODER.decode(output)
                     except json.JSONDecodeError as e:
                         format_issues.append(f"Invalid JSON: {str(e)}")
                         format_score -= 0.5
-                elif not isinstance(output, (dict, list)):
+                else:
                     format_issues.append("Output is not JSON-serializable")
                     format_score -= 0.5
             
             # Check required fields
             if context and "required_fields" in context:
                 if isinstance(output, dict):
-                    missing_fields = set(context["required_fields"]) - set(output.keys())
+                    # Probe the dict directly rather than materializing its key set
+                    missing_fields = {f for f in context["required_fields"] if f not in output}
                     if missing_fields:
                         format_issues.append(f"Missing fields: {missing_fields}")
                         format_score -= 0.1 * len(missing_fields)
             
             # Check output length constraints
-            if context:
-                if "min_length" in context and len(str(output)) < context["min_length"]:
+            if context and ("min_length" in context or "max_length" in context):
+                if output_str is None:
+                    output_str = str(output)
+                if "min_length" in context and len(output_str) < context["min_length"]:
                     format_issues.append("Output too short")
                     format_score -= 0.2
-                if "max_length" in context and len(str(output)) > context["max_length"]:
+                if "max_length" in context and len(output_str) > context["max_length"]:
                     format_issues.append("Output too long")
                     format_score -= 0.2
             
@@ -433,7 +787,9 @@ class QualityValidator:
     def validate_statistics(
         self,
         output: Any,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        *,
+        output_str: Optional[str] = None
     ) -> ValidationResult:
         """
         Validate statistical properties of the output.
@@ -441,6 +797,7 @@ class QualityValidator:
         Args:
             output: Output to validate
             context: Optional context
+            output_str: Precomputed ``str(output)``, if available
             
         Returns:
             Validation result for statistics
@@ -450,20 +807,24 @@ class QualityValidator:
             stats_score = 1.0
             
             # Convert output to string for analysis
-            output_str = str(output)
+            if output_str is None:
+                output_str = str(output)
             
-            # Check for repetition
             words = output_str.split()
-            if len(words) > 10:
+            num_words = len(words)
+            if num_words > 0:
+                # Word frequencies feed both the repetition and diversity checks
                 word_counts = Counter(words)
-                repetition_ratio = max(word_counts.values()) / len(words)
-                if repetition_ratio > 0.1:  # More than 10% repetition
-                    stats_checks.append(f"High repetition detected ({repetition_ratio:.1%})")
-                    stats_score -= 0.3
-            
-            # Check for diversity (unique words ratio)
-            if len(words) > 0:
-                diversity_ratio = len(set(words)) / len(words)
+                
+                # Check for repetition
+                if num_words > 10:
+                    repetition_ratio = max(word_counts.values()) / num_words
+                    if repetition_ratio > 0.1:  # More than 10% repetition
+                        stats_checks.append(f"High repetition detected ({repetition_ratio:.1%})")
+                        stats_score -= 0.3
+                
+                # Check for diversity (unique words ratio)
+                diversity_ratio = len(word_counts) / num_words
                 if diversity_ratio < 0.5:  # Less than 50% unique words
                     stats_checks.append(f"Low diversity ({diversity_ratio:.1%} unique words)")
                     stats_score -= 0.2
@@ -471,14 +832,22 @@ class QualityValidator:
             # Check for anomalies in numeric outputs
             if isinstance(output, (list, np.ndarray)) and len(output) > 0:
                 try:
-                    numeric_values = [float(x) for x in output if isinstance(x, (int, float))]
-                    if numeric_values:
+                    if isinstance(output, np.ndarray) and output.dtype.kind in "biuf":
+                        numeric_values = output.astype(np.float64, copy=False).ravel()
+                    else:
+                        numeric_values = np.fromiter(
+                            (x for x in output if isinstance(x, (int, float))),
+                            dtype=np.float64
+                        )
+                    if numeric_values.size:
                         # Check for outliers using IQR
                         q1, q3 = np.percentile(numeric_values, [25, 75])
                         iqr = q3 - q1
-                        outliers = [x for x in numeric_values if x < q1 - 1.5*iqr or x > q3 + 1.5*iqr]
-                        if len(outliers) / len(numeric_values) > 0.1:  # More than 10% outliers
-                            stats_checks.append(f"{len(outliers)} outliers detected")
+                        num_outliers = np.count_nonzero(
+                            (numeric_values < q1 - 1.5*iqr) | (numeric_values > q3 + 1.5*iqr)
+                        )
+                        if num_outliers / numeric_values.size > 0.1:  # More than 10% outliers
+                            stats_checks.append(f"{num_outliers} outliers detected")
                             stats_score -= 0.2
                 except (ValueError, TypeError):
                     pass
@@ -497,7 +866,7 @@ class QualityValidator:
                 details={
                     "statistical_issues": stats_checks,
                     "output_length": len(output_str),
-                    "word_count": len(words) if isinstance(output, str) else None
+                    "word_count": num_words if isinstance(output, str) else None
                 },
                 suggestions=["Review output generation parameters"] if not passed else []
             )
@@ -516,6 +885,10 @@ class QualityValidator:
         """
         Calculate accuracy score between output and expected.
         
+        Nested lists and dicts are scored as the mean of their children. The
+        nesting is walked with an explicit stack rather than a Python call
+        frame per level.
+        
         Args:
             output: Actual output
             expected: Expected output
@@ -523,6 +896,55 @@ class QualityValidator:
         Returns:
             Accuracy score between 0 and 1
         """
+        step = self._accuracy_step(output, expected)
+        if not isinstance(step, list):
+            return step
+        
+        # Each frame holds a container's child pairs, the next child to visit
+        # and the scores collected so far
+        stack = [(step, iter(step), [])]
+        while True:
+            pairs, children, scores = stack[-1]
+            for child_output, child_expected in children:
+                child_step = self._accuracy_step(child_output, child_expected)
+                if isinstance(child_step, list):
+                    stack.append((child_step, iter(child_step), []))
+                    break
+                scores.append(child_step)
+            else:
+                stack.pop()
+                # Containers are usually small, where fsum beats a NumPy round-trip
+                score = math.fsum(scores) / len(scores)
+                if not stack:
+                    return score
+                stack[-1][2].append(score)
+    
+    def _accuracy_step(
+        self,
+        output: Any,
+        expected: Any
+    ) -> Union[float, List[Tuple[Any, Any]]]:
+        """
+        Score a single comparison, or expand a container into child pairs.
+        
+        Args:
+            output: Actual output
+            expected: Expected output
+            
+        Returns:
+            Accuracy score between 0 and 1, or the (output, expected) pairs
+            whose scores must be averaged
+        """
+        # Keys present on only one side of a dict comparison
+        if output is _MISSING:
+            return 0.0
+        
+        # Score numeric sequences in a single vectorized pass
+        if isinstance(output, _SEQUENCE_TYPES) and isinstance(expected, _SEQUENCE_TYPES):
+            numeric_score = self._numeric_sequence_accuracy(output, expected)
+            if numeric_score is not None:
+                return numeric_score
+        
         # Handle exact matches
         if output == expected:
             return 1.0
@@ -541,8 +963,21 @@ class QualityValidator:
             if longer == 0:
                 return 1.0
             
+            # An empty side can only match by inserting every character
+            if min(len(output_norm), len(expected_norm)) == 0:
+                return 0.0
+            
+            # A shared prefix or suffix never contributes to the edit distance
+            prefix = len(os.path.commonprefix((output_norm, expected_norm)))
+            output_core = output_norm[prefix:]
+            expected_core = expected_norm[prefix:]
+            suffix = len(os.path.commonprefix((output_core[::-1], expected_core[::-1])))
+            if suffix:
+                output_core = output_core[:-suffix]
+                expected_core = expected_core[:-suffix]
+            
             # Use Levenshtein distance
-            distance = self._levenshtein_distance(output_norm, expected_norm)
+            distance = self._levenshtein_distance(output_core, expected_core)
             return 1 - (distance / longer)
         
         # Handle numeric comparison
@@ -558,10 +993,7 @@ class QualityValidator:
             if len(output) == 0:
                 return 1.0
             
-            scores = []
-            for o, e in zip(output, expected):
-                scores.append(self._calculate_accuracy(o, e))
-            return mean(scores)
+            return list(zip(output, expected))
         
         # Handle dict comparison
         if isinstance(output, dict) and isinstance(expected, dict):
@@ -569,17 +1001,67 @@ class QualityValidator:
             if not all_keys:
                 return 1.0
             
-            scores = []
-            for key in all_keys:
-                if key in output and key in expected:
-                    scores.append(self._calculate_accuracy(output[key], expected[key]))
-                else:
-                    scores.append(0.0)
-            return mean(scores)
+            return [
+                (output[key], expected[key])
+                if key in output and key in expected else (_MISSING, None)
+                for key in all_keys
+            ]
         
         # Default: type mismatch
         return 0.0
     
+    def _numeric_sequence_accuracy(self, output: Any, expected: Any) -> Optional[float]:
+        """
+        Vectorized accuracy for same-shaped numeric sequences.
+        
+        Applies the scalar numeric rule elementwise and averages the result,
+        matching the per-element path without visiting each pair in Python.
+        
+        Args:
+            output: Actual output (list, tuple or ndarray)
+            expected: Expected output (list, tuple or ndarray)
+            
+        Returns:
+            Accuracy score between 0 and 1, or None if the inputs are not
+            numeric sequences of the same shape
+        """
+        # Cheap gate before converting Python sequences
+        for seq in (output, expected):
+            if not isinstance(seq, np.ndarray):
+                if not seq or not isinstance(seq[0], (int, float)):
+                    return None
+        
+        # Python sequence equality also honours identity (e.g. the same NaN object)
+        if not isinstance(output, np.ndarray) and not isinstance(expected, np.ndarray):
+            if output == expected:
+                return 1.0
+        
+        try:
+            output_arr = np.asarray(output)
+            expected_arr = np.asarray(expected)
+        except (ValueError, OverflowError):
+            return None
+        
+        if (
+            output_arr.dtype.kind not in "biuf"
+            or expected_arr.dtype.kind not in "biuf"
+            or output_arr.shape != expected_arr.shape
+            or output_arr.size == 0
+        ):
+            return None
+        
+        output_arr = output_arr.astype(np.float64, copy=False)
+        expected_arr = expected_arr.astype(np.float64, copy=False)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # fmin ignores NaN, matching the scalar path's min(1, nan) == 1
+            relative_error = np.fmin(1.0, np.abs(output_arr - expected_arr) / np.abs(expected_arr))
+        scores = np.where(
+            output_arr == expected_arr,
+            1.0,
+            np.where(expected_arr == 0, 0.0, 1.0 - relative_error)
+        )
+        return float(scores.mean())
+    
     def _calculate_similarity(self, output1: Any, output2: Any) -> float:
         """
         Calculate similarity between two outputs.
@@ -594,6 +1076,83 @@ class QualityValidator:
         # Reuse accuracy calculation for similarity
         return self._calculate_accuracy(output1, output2)
     
+    def _embedding_similarity(
+        self,
+        output: Any,
+        previous_outputs: List[Any]
+    ) -> Optional[np.ndarray]:
+        """
+        Score a string output against many previous strings by embedding similarity.
+        
+        Encodes all strings in one batch (on GPU when available) and uses the
+        cosine similarity of normalized embeddings, clipped to [0, 1].
+        
+        Args:
+            output: Current output
+            previous_outputs: List of previous outputs
+            
+        Returns:
+            Similarity scores, or None if the embedding path does not apply
+        """
+        if (
+            self.config.embedding_model is None
+            or SentenceTransformer is None
+            or len(previous_outputs) < self.config.embedding_batch_min_size
+            or not isinstance(output, str)
+            or not all(isinstance(prev, str) for prev in previous_outputs)
+        ):
+            return None
+        
+        if self._embedding_model is None:
+            with self._state_lock:
+                if self._embedding_model is None:
+                    self._embedding_model = SentenceTransformer(self.config.embedding_model)
+        
+        embeddings = self._embedding_model.encode(
+            [output, *previous_outputs],
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        return np.clip(embeddings[1:] @ embeddings[0], 0.0, 1.0).astype(np.float64)
+    
+    def _batch_string_similarity(
+        self,
+        output: Any,
+        previous_outputs: List[Any]
+    ) -> Optional[np.ndarray]:
+        """
+        Score a string output against many previous strings in parallel.
+        
+        Applies the same normalization as ``_calculate_accuracy`` and runs the
+        edit distances through the Numba kernel across all cores.
+        
+        Args:
+            output: Current output
+            previous_outputs: List of previous outputs
+            
+        Returns:
+            Similarity scores, or None if the batch path does not apply
+        """
+        if (
+            _levenshtein_batch_kernel is None
+            or len(previous_outputs) < BATCH_LEVENSHTEIN_MIN_SIZE
+            or not isinstance(output, str)
+            or not all(isinstance(prev, str) for prev in previous_outputs)
+        ):
+            return None
+        
+        query = output.lower().strip()
+        others = [prev.lower().strip() for prev in previous_outputs]
+        lengths = np.fromiter((len(o) for o in others), dtype=np.int64, count=len(others))
+        offsets = np.zeros(len(others) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        corpus = _code_points("".join(others))
+        
+        distances = _levenshtein_batch_kernel(_code_points(query), corpus, offsets)
+        longer = np.maximum(lengths, len(query))
+        scores = np.where(longer > 0, 1 - distances / np.maximum(longer, 1), 1.0)
+        return scores
+    
     def _levenshtein_distance(self, s1: str, s2: str) -> int:
         """
         Calculate Levenshtein distance between two strings.
@@ -605,23 +1164,34 @@ class QualityValidator:
         Returns:
             Edit distance
         """
+        if _rf_levenshtein is not None:
+            return _rf_levenshtein.distance(s1, s2)
+        
         if len(s1) < len(s2):
-            return self._levenshtein_distance(s2, s1)
+            s1, s2 = s2, s1
         
         if len(s2) == 0:
             return len(s1)
         
-        previous_row = range(len(s2) + 1)
+        if len(s2) <= BIT_PARALLEL_MAX_LENGTH:
+            return _bit_parallel_levenshtein(s2, s1)
+        
+        # Two preallocated rows are swapped each iteration instead of
+        # building a new list per row
+        n = len(s2)
+        previous_row = array('q', range(n + 1))
+        current_row = array('q', [0]) * (n + 1)
         for i, c1 in enumerate(s1):
-            current_row = [i + 1]
+            current_row[0] = left = i + 1
             for j, c2 in enumerate(s2):
                 insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
+                deletions = left + 1
                 substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
+                left = min(insertions, deletions, substitutions)
+                current_row[j + 1] = left
+            previous_row, current_row = current_row, previous_row
         
-        return previous_row[-1]
+        return previous_row[n]
     
     def get_summary_metrics(self) -> Dict[str, Any]:
         """
@@ -630,25 +1200,36 @@ class QualityValidator:
         Returns:
             Dictionary of summary metrics
         """
-        summary = {
-            "total_validations": len(self._accuracy_history),
-            "average_accuracy": mean(self._accuracy_history) if self._accuracy_history else None,
-            "accuracy_trend": "stable"
-        }
-        
-        # Calculate accuracy trend
-        if len(self._accuracy_history) >= 10:
-            recent = mean(self._accuracy_history[-5:])
-            older = mean(self._accuracy_history[-10:-5])
-            if recent > older + 0.05:
-                summary["accuracy_trend"] = "improving"
-            elif recent < older - 0.05:
-                summary["accuracy_trend"] = "degrading"
-        
-        # Performance summary
-        if self._performance_history:
-            recent_perf = self._performance_history[-10:]
-            summary["average_response_time"] = mean([p.response_time for p in recent_perf])
-            summary["average_throughput"] = mean([p.throughput for p in recent_perf])
-        
-        return summary
\ No newline at end of file
+        with self._state_lock:
+            summary = {
+                "total_validations": self._accuracy_stats.count,
+                "average_accuracy": self._accuracy_stats.mean if self._accuracy_stats.count else None,
+                "accuracy_trend": "stable"
+            }
+            
+            # Calculate accuracy trend
+            if len(self._recent_accuracy) >= 10:
+                window = np.fromiter(self._recent_accuracy, dtype=np.float64, count=len(self._recent_accuracy))
+                recent = window[-5:].mean()
+                older = window[-10:-5].mean()
+                if recent > older + 0.05:
+                    summary["accuracy_trend"] = "improving"
+                elif recent < older - 0.05:
+                    summary["accuracy_trend"] = "degrading"
+            
+            # Performance summary
+            if len(self._performance_history):
+                summary["average_response_time"] = float(
+                    self._performance_history.recent("response_time", 10).mean(dtype=np.float64)
+                )
+                summary["average_throughput"] = float(
+                    self._performance_history.recent("throughput", 10).mean(dtype=np.float64)
+                )
+        
+        return summary
+    
+    def shutdown(self) -> None:
+        """Shutdown the check thread pool, if one was created."""
+        if self._executor is not None:
+            self._executor_finalizer.detach()
+            self._executor.shutdown(wait=True)
\ No newline at end of file
@@ -6,20 +6,97 @@ validation scenario. These metrics provide a standardized way to measure
 agent performance across different domains.
 """
 
-from typing import Dict, Any, List, Optional, Union, Callable, Tuple
+from typing import Dict, Any, List, Optional, Callable, Tuple, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import numpy as np
+from functools import lru_cache, partial
+from operator import attrgetter
+from collections import OrderedDict, defaultdict
+import copy
+import hashlib
+import pickle
+import threading
+import math
+import re
+import time
+import sys
 from statistics import mean, stdev, median
-import json
 
-from ...core.exceptions import MetricCalculationError
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 from ...domains.base_domain import ValidationResult, ValidationSeverity
 from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Minimum number of metric values before aggregate_metrics uses the Numba kernel
+AGGREGATION_KERNEL_MIN_SIZE = 1024
+
+# Aggregation method codes understood by the aggregation kernel
+_AGGREGATION_CODES = {"mean": 0, "median": 1, "min": 2, "max": 3, "sum": 4}
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True, nogil=True)
+    def _aggregate_kernel(values, normalized, confidences, offsets, methods):
+        """
+        Aggregate each metric's segment of the flattened value arrays.
+        
+        Returns one row per metric: aggregated value, aggregated normalized
+        value, mean confidence, sample standard deviation, min and max.
+        """
+        num_groups = offsets.shape[0] - 1
+        out = np.empty((num_groups, 6), dtype=np.float64)
+        for k in prange(num_groups):
+            start = offsets[k]
+            stop = offsets[k + 1]
+            n = stop - start
+            group_values = values[start:stop]
+            group_normalized = normalized[start:stop]
+            
+            method = methods[k]
+            if method == 1:
+                out[k, 0] = np.median(group_values)
+                out[k, 1] = np.median(group_normalized)
+            elif method == 2:
+                out[k, 0] = group_values.min()
+                out[k, 1] = group_normalized.min()
+            elif method == 3:
+                out[k, 0] = group_values.max()
+                out[k, 1] = group_normalized.max()
+            elif method == 4:
+                out[k, 0] = group_values.sum()
+                out[k, 1] = min(1.0, group_normalized.sum())
+            else:
+                out[k, 0] = group_values.mean()
+                out[k, 1] = group_normalized.mean()
+            
+            out[k, 2] = confidences[start:stop].mean()
+            
+            if n > 1:
+                mean_value = group_values.mean()
+                squares = 0.0
+                for i in range(n):
+                    squares += (group_values[i] - mean_value) ** 2
+                out[k, 3] = math.sqrt(squares / (n - 1))
+            else:
+                out[k, 3] = 0.0
+            out[k, 4] = group_values.min()
+            out[k, 5] = group_values.max()
+        return out
+else:
+    _aggregate_kernel = None
+
 
 class MetricType(Enum):
     """Types of universal metrics."""
@@ -35,7 +112,7 @@ class MetricType(Enum):
     FAIRNESS = "fairness"
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricDefinition:
     """Definition of a universal metric."""
     metric_id: str
@@ -50,13 +127,16 @@ class MetricDefinition:
     
     def normalize_value(self, value: float) -> float:
         """Normalize value to 0-1 range."""
+        if self.range_min == 0.0 and self.range_max == 1.0:
+            # Default range: normalization is just the clip
+            return max(0.0, min(1.0, value))
         if self.range_min == self.range_max:
             return 0.0
         normalized = (value - self.range_min) / (self.range_max - self.range_min)
         return max(0.0, min(1.0, normalized))
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricResult:
     """Result of a metric calculation."""
     metric_id: str
@@ -65,10 +145,23 @@ class MetricResult:
     confidence: float = 1.0
     sample_size: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Creation time as a naive UTC datetime; when not passed in it is built
+    # from created_at on first access (see the property after the class)
+    timestamp: Optional[datetime] = None
+    # Creation time as a Unix timestamp
+    created_at: float = field(default_factory=time.time, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
+        """
+        Convert to dictionary.
+        
+        Formats the timestamp on every call; bulk exports should use
+        batch_to_json instead.
+        """
+        return self._fields(self.timestamp.isoformat())
+    
+    def _fields(self, timestamp: Any) -> Dict[str, Any]:
+        """Field dict with the given timestamp representation."""
         return {
             "metric_id": self.metric_id,
             "value": self.value,
@@ -76,8 +169,207 @@ class MetricResult:
             "confidence": self.confidence,
             "sample_size": self.sample_size,
             "metadata": self.metadata,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": timestamp
         }
+    
+    @staticmethod
+    def batch_to_json(results: Iterable["MetricResult"]) -> bytes:
+        """
+        Serialize metric results to a JSON array in one pass.
+        
+        Rows carry raw datetimes, so timestamps are formatted by the encoder
+        during the dump rather than per to_dict call. Uses orjson when
+        installed, which encodes datetimes natively.
+        
+        Args:
+            results: Metric results to serialize
+            
+        Returns:
+            UTF-8 encoded JSON, rows shaped like to_dict()
+        """
+        rows = [r._fields(r.timestamp) for r in results]
+        if orjson is not None:
+            return orjson.dumps(rows, option=orjson.OPT_SERIALIZE_NUMPY)
+        # The stdlib encoder is only needed without orjson, so import it here
+        import json
+        return json.dumps(rows, default=_json_default).encode("utf-8")
+
+
+# MetricResult.timestamp stays a regular dataclass field, so it is accepted by
+# __init__ and replace() and included in asdict(); this property wraps its slot
+# to defer building the datetime until it is first read
+_timestamp_slot = MetricResult.timestamp
+
+
+def _metric_timestamp(result: MetricResult) -> datetime:
+    """Return the result's timestamp, deriving it from created_at if unset."""
+    timestamp = _timestamp_slot.__get__(result, MetricResult)
+    if timestamp is None:
+        # Same conversion datetime.utcnow() applies to time.time()
+        timestamp = datetime.utcfromtimestamp(result.created_at)
+        _timestamp_slot.__set__(result, timestamp)
+    return timestamp
+
+
+MetricResult.timestamp = property(
+    _metric_timestamp, _timestamp_slot.__set__, doc="Creation time as a naive UTC datetime."
+)
+
+
+def _copy_metrics(metrics: Dict[str, MetricResult]) -> Dict[str, MetricResult]:
+    """Copy metric results with new timestamps, so cached and returned results never share state."""
+    return {
+        metric_id: MetricResult(
+            metric_id=result.metric_id,
+            value=result.value,
+            normalized_value=result.normalized_value,
+            confidence=result.confidence,
+            sample_size=result.sample_size,
+            metadata=copy.deepcopy(result.metadata)
+        )
+        for metric_id, result in metrics.items()
+    }
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib JSON fallback for values orjson would encode natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Field accessors for bulk extraction from MetricResult sequences
+_get_value = attrgetter("value")
+_get_normalized_value = attrgetter("normalized_value")
+_get_confidence = attrgetter("confidence")
+_get_sample_size = attrgetter("sample_size")
+
+# Interned check names; extracted names are interned too, so matching is an identity test
+_ACCURACY_CHECK = sys.intern("accuracy_validation")
+_CONSISTENCY_CHECK = sys.intern("consistency_validation")
+
+# Dense integer code per severity level, used to histogram result severities
+_SEVERITY_CODES = {severity: code for code, severity in enumerate(ValidationSeverity)}
+_CRITICAL_CODE = _SEVERITY_CODES[ValidationSeverity.CRITICAL]
+_HIGH_CODE = _SEVERITY_CODES[ValidationSeverity.HIGH]
+# Severity codes counted as errors, for a single fancy-indexed sum over the histogram
+_ERROR_SEVERITY_CODES = np.array([_HIGH_CODE, _CRITICAL_CODE], dtype=np.intp)
+
+# Outcome code bits recorded per validation result
+_PASSED = 1
+_LABEL_POSITIVE = 2
+_LABEL_NEGATIVE = 4
+
+# Marks results without an "expected_positive" classification label
+_NO_LABEL = object()
+
+# Keyword bits recorded per validation result; the first three come from the
+# check name, _KW_MISSING from the message
+_KW_COMPLETENESS = 1
+_KW_FORMAT = 2
+_KW_HALLUCINATION = 4
+_KW_MISSING = 8
+_KEYWORD_BITS = {
+    "completeness": _KW_COMPLETENESS,
+    "format": _KW_FORMAT,
+    "hallucination": _KW_HALLUCINATION,
+    "missing": _KW_MISSING,
+}
+_NAME_KEYWORDS = _KW_COMPLETENESS | _KW_FORMAT | _KW_HALLUCINATION
+# One alternation finds every keyword in a single scan of the lowercased text
+_KEYWORD_PATTERN = re.compile("|".join(_KEYWORD_BITS))
+
+
+# Metrics normalized on every calculate_metrics call, pre-bound to instance attributes
+_PREBOUND_NORMALIZERS = {
+    "response_time": "_normalize_response_time",
+    "throughput": "_normalize_throughput",
+    "error_rate": "_normalize_error_rate",
+    "hallucination_rate": "_normalize_hallucination_rate",
+}
+
+
+def _normalize_in_range(range_min: float, span: float, value: float) -> float:
+    """Clip (value - range_min) / span to 0-1, or 0.0 for an empty range."""
+    if span == 0:
+        return 0.0
+    normalized = (value - range_min) / span
+    return max(0.0, min(1.0, normalized))
+
+
+def _clip_unit(value: float) -> float:
+    """Normalize against the default 0-1 range, where only the clip remains."""
+    return max(0.0, min(1.0, value))
+
+
+def _bind_normalizer(range_min: float, span: float) -> Callable[[float], float]:
+    """Return a one-argument normalizer specialized for the given range."""
+    if range_min == 0.0 and span == 1.0:
+        return _clip_unit
+    return partial(_normalize_in_range, range_min, span)
+
+
+def _keyword_flags(text: str) -> int:
+    """OR together the _KEYWORD_BITS of every keyword found in lowercased text."""
+    flags = 0
+    for match in _KEYWORD_PATTERN.finditer(text):
+        flags |= _KEYWORD_BITS[match.group()]
+    return flags
+
+
+@lru_cache(maxsize=1024)
+def _check_name_flags(check_name: str) -> int:
+    """Keyword bits for a check name; names repeat across results, so cache them."""
+    return _keyword_flags(check_name.lower()) & _NAME_KEYWORDS
+
+
+class _ResultColumns:
+    """
+    Columnar (structure-of-arrays) view of validation results.
+    
+    Fields are extracted in a single pass so the metric calculators scan flat
+    lists instead of re-reading attributes off every result object.
+    """
+    
+    __slots__ = (
+        "size", "scores", "passed", "severity_codes", "severity_counts", "check_names",
+        "keyword_flags", "outcome_codes"
+    )
+    
+    def __init__(self, validation_results: List[ValidationResult]):
+        self.size = len(validation_results)
+        self.scores: List[float] = []
+        self.passed: List[bool] = []
+        self.severity_codes: List[int] = []
+        self.check_names: List[str] = []
+        # _KW_* bits per result
+        self.keyword_flags: List[int] = []
+        # _PASSED / _LABEL_POSITIVE / _LABEL_NEGATIVE bits per result
+        self.outcome_codes: List[int] = []
+        
+        for r in validation_results:
+            self.scores.append(r.score)
+            self.passed.append(r.passed)
+            self.severity_codes.append(_SEVERITY_CODES[r.severity])
+            check_name = sys.intern(r.check_name)
+            self.check_names.append(check_name)
+            self.keyword_flags.append(
+                _check_name_flags(check_name)
+                | (_keyword_flags(r.message.lower()) & _KW_MISSING)
+            )
+            # Classification labels: a missing key is neither positive nor negative
+            label = r.details.get("expected_positive", _NO_LABEL)
+            code = _PASSED if r.passed else 0
+            if label is not _NO_LABEL:
+                code |= _LABEL_POSITIVE if label else _LABEL_NEGATIVE
+            self.outcome_codes.append(code)
+        
+        # Per-severity result counts, shared by the reliability and safety metrics
+        self.severity_counts = np.bincount(self.severity_codes, minlength=len(_SEVERITY_CODES))
 
 
 class UniversalMetrics:
@@ -88,10 +380,22 @@ class UniversalMetrics:
     all domains to ensure consistent evaluation.
     """
     
-    def __init__(self):
-        """Initialize universal metrics."""
+    def __init__(self, cache_size: int = 0):
+        """
+        Initialize universal metrics.
+        
+        Args:
+            cache_size: Number of calculate_metrics results to memoize; off by
+                default. Cache hits return fresh copies of the stored results,
+                with a new timestamp and their own metadata.
+        """
         self._metric_definitions: Dict[str, MetricDefinition] = {}
+        # Flat metric_id -> (range_min, range_max - range_min) table for normalization
+        self._normalization_table: Dict[str, Tuple[float, float]] = {}
         self._custom_calculators: Dict[str, Callable] = {}
+        self._cache_size = cache_size
+        self._metrics_cache: "OrderedDict[str, Dict[str, MetricResult]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._initialize_standard_metrics()
         
     def _initialize_standard_metrics(self) -> None:
@@ -288,12 +592,42 @@ class UniversalMetrics:
         """
         Register a metric definition.
         
+        The definition's normalization range is captured at registration;
+        re-register the metric after changing it.
+        
         Args:
             metric_def: Metric definition to register
         """
         self._metric_definitions[metric_def.metric_id] = metric_def
+        self._normalization_table[metric_def.metric_id] = (
+            metric_def.range_min,
+            metric_def.range_max - metric_def.range_min
+        )
+        attr = _PREBOUND_NORMALIZERS.get(metric_def.metric_id)
+        if attr is not None:
+            setattr(self, attr, _bind_normalizer(
+                *self._normalization_table[metric_def.metric_id]
+            ))
+        self._clear_metrics_cache()
         logger.debug(f"Registered metric: {metric_def.name}")
     
+    def _normalize(self, metric_id: str, value: float) -> float:
+        """
+        Normalize a value using the registered metric's frozen range.
+        
+        Ranges are captured when the metric is registered, so this needs one
+        dict lookup and no attribute access on the definition.
+        
+        Args:
+            metric_id: ID of a registered metric
+            value: Raw metric value
+            
+        Returns:
+            Value normalized to the 0-1 range
+        """
+        range_min, span = self._normalization_table[metric_id]
+        return _normalize_in_range(range_min, span, value)
+    
     def register_custom_calculator(
         self,
         metric_id: str,
@@ -307,6 +641,7 @@ class UniversalMetrics:
             calculator: Function to calculate the metric
         """
         self._custom_calculators[metric_id] = calculator
+        self._clear_metrics_cache()
         logger.debug(f"Registered custom calculator for metric: {metric_id}")
     
     def calculate_metrics(
@@ -327,39 +662,53 @@ class UniversalMetrics:
         metrics = {}
         additional_data = additional_data or {}
         
+        # Extract result fields once for all calculators
+        columns = _ResultColumns(validation_results)
+        
+        # Serve repeated inputs from the cache. Custom calculators see the full
+        # result objects, so results are only cached when none are registered.
+        cache_key = None
+        if self._cache_size > 0 and not self._custom_calculators:
+            cache_key = self._metrics_cache_key(columns, additional_data)
+            if cache_key is not None:
+                with self._cache_lock:
+                    cached_metrics = self._metrics_cache.get(cache_key)
+                    if cached_metrics is not None:
+                        self._metrics_cache.move_to_end(cache_key)
+                        return _copy_metrics(cached_metrics)
+        
         # Calculate accuracy metrics
-        metrics.update(self._calculate_accuracy_metrics(validation_results))
+        metrics.update(self._calculate_accuracy_metrics(columns))
         
         # Calculate performance metrics
         if "performance_data" in additional_data:
             metrics.update(self._calculate_performance_metrics(
-                validation_results,
+                columns,
                 additional_data["performance_data"]
             ))
         
         # Calculate reliability metrics
-        metrics.update(self._calculate_reliability_metrics(validation_results))
+        metrics.update(self._calculate_reliability_metrics(columns))
         
         # Calculate consistency metrics
         if "consistency_data" in additional_data:
             metrics.update(self._calculate_consistency_metrics(
-                validation_results,
+                columns,
                 additional_data["consistency_data"]
             ))
         
         # Calculate completeness metrics
-        metrics.update(self._calculate_completeness_metrics(validation_results))
+        metrics.update(self._calculate_completeness_metrics(columns))
         
         # Calculate safety metrics
-        metrics.update(self._calculate_safety_metrics(validation_results))
+        metrics.update(self._calculate_safety_metrics(columns))
         
         # Calculate custom metrics
         for metric_id, calculator in self._custom_calculators.items():
             try:
                 value = calculator(validation_results, additional_data)
-                if metric_id in self._metric_definitions:
-                    metric_def = self._metric_definitions[metric_id]
-                    normalized_value = metric_def.normalize_value(value)
+                if metric_id in self._normalization_table:
+                    normalized_value = self._normalize(metric_id, value)
                 else:
                     normalized_value = value
                 
@@ -367,27 +716,77 @@ class UniversalMetrics:
                     metric_id=metric_id,
                     value=value,
                     normalized_value=normalized_value,
-                    sample_size=len(validation_results)
+                    sample_size=columns.size
                 )
             except Exception as e:
                 logger.error(f"Custom metric calculation failed for {metric_id}: {str(e)}")
         
+        if cache_key is not None:
+            with self._cache_lock:
+                self._metrics_cache[cache_key] = _copy_metrics(metrics)
+                if len(self._metrics_cache) > self._cache_size:
+                    self._metrics_cache.popitem(last=False)
+        
         return metrics
     
+    def _metrics_cache_key(
+        self,
+        columns: _ResultColumns,
+        additional_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Fingerprint the inputs that the built-in calculators read.
+        
+        Result timestamps and details other than the classification label are
+        not used by any calculator, so they are left out of the key.
+        
+        Args:
+            columns: Extracted validation result fields
+            additional_data: Additional data for calculations
+            
+        Returns:
+            Hex digest, or None if the inputs cannot be fingerprinted
+        """
+        try:
+            payload = pickle.dumps(
+                (
+                    columns.scores,
+                    columns.passed,
+                    columns.severity_codes,
+                    columns.check_names,
+                    columns.keyword_flags,
+                    columns.outcome_codes,
+                    additional_data
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except Exception:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _clear_metrics_cache(self) -> None:
+        """Drop memoized metrics after definitions or calculators change."""
+        with self._cache_lock:
+            self._metrics_cache.clear()
+    
     def _calculate_accuracy_metrics(
         self,
-        validation_results: List[ValidationResult]
+        columns: _ResultColumns
     ) -> Dict[str, MetricResult]:
         """Calculate accuracy-related metrics."""
         metrics = {}
         
-        if not validation_results:
+        n = columns.size
+        if n == 0:
             return metrics
         
         # Overall accuracy score
-        accuracy_scores = [r.score for r in validation_results if r.check_name == "accuracy_validation"]
+        accuracy_scores = [
+            score for score, name in zip(columns.scores, columns.check_names)
+            if name is _ACCURACY_CHECK
+        ]
         if accuracy_scores:
-            accuracy_value = mean(accuracy_scores) * 100
+            accuracy_value = float(np.mean(accuracy_scores)) * 100
             metrics["accuracy_score"] = MetricResult(
                 metric_id="accuracy_score",
                 value=accuracy_value,
@@ -397,9 +796,11 @@ class UniversalMetrics:
             )
         
         # Calculate precision/recall if classification data available
-        true_positives = sum(1 for r in validation_results if r.passed and r.details.get("expected_positive", False))
-        false_positives = sum(1 for r in validation_results if r.passed and not r.details.get("expected_positive", True))
-        false_negatives = sum(1 for r in validation_results if not r.passed and r.details.get("expected_positive", False))
+        # One histogram over the outcome codes yields all three counts
+        outcome_counts = np.bincount(columns.outcome_codes, minlength=8)
+        true_positives = int(outcome_counts[_PASSED | _LABEL_POSITIVE])
+        false_positives = int(outcome_counts[_PASSED | _LABEL_NEGATIVE])
+        false_negatives = int(outcome_counts[_LABEL_POSITIVE])
         
         if true_positives + false_positives > 0:
             precision = true_positives / (true_positives + false_positives)
@@ -407,7 +808,7 @@ class UniversalMetrics:
                 metric_id="precision",
                 value=precision,
                 normalized_value=precision,
-                sample_size=len(validation_results)
+                sample_size=n
             )
         
         if true_positives + false_negatives > 0:
@@ -416,7 +817,7 @@ class UniversalMetrics:
                 metric_id="recall",
                 value=recall,
                 normalized_value=recall,
-                sample_size=len(validation_results)
+                sample_size=n
             )
         
         # F1 score
@@ -429,14 +830,14 @@ class UniversalMetrics:
                     metric_id="f1_score",
                     value=f1,
                     normalized_value=f1,
-                    sample_size=len(validation_results)
+                    sample_size=n
                 )
         
         return metrics
     
     def _calculate_performance_metrics(
         self,
-        validation_results: List[ValidationResult],
+        columns: _ResultColumns,
         performance_data: Dict[str, Any]
     ) -> Dict[str, MetricResult]:
         """Calculate performance-related metrics."""
@@ -444,29 +845,28 @@ class UniversalMetrics:
         
         # Response time
         if "response_times" in performance_data:
-            response_times = performance_data["response_times"]
-            if response_times:
-                avg_response_time = mean(response_times)
-                metric_def = self._metric_definitions["response_time"]
+            response_times = np.asarray(performance_data["response_times"], dtype=np.float64)
+            if response_times.size:
+                avg_response_time = float(response_times.mean())
+                std_response_time = float(response_times.std(ddof=1)) if response_times.size > 1 else 0
                 metrics["response_time"] = MetricResult(
                     metric_id="response_time",
                     value=avg_response_time,
-                    normalized_value=metric_def.normalize_value(avg_response_time),
-                    sample_size=len(response_times),
-                    metadata={"std_dev": stdev(response_times) if len(response_times) > 1 else 0}
+                    normalized_value=self._normalize_response_time(avg_response_time),
+                    sample_size=int(response_times.size),
+                    metadata={"std_dev": std_response_time}
                 )
         
         # Throughput
         if "throughput_values" in performance_data:
-            throughput_values = performance_data["throughput_values"]
-            if throughput_values:
-                avg_throughput = mean(throughput_values)
-                metric_def = self._metric_definitions["throughput"]
+            throughput_values = np.asarray(performance_data["throughput_values"], dtype=np.float64)
+            if throughput_values.size:
+                avg_throughput = float(throughput_values.mean())
                 metrics["throughput"] = MetricResult(
                     metric_id="throughput",
                     value=avg_throughput,
-                    normalized_value=metric_def.normalize_value(avg_throughput),
-                    sample_size=len(throughput_values)
+                    normalized_value=self._normalize_throughput(avg_throughput),
+                    sample_size=int(throughput_values.size)
                 )
         
         # Resource efficiency
@@ -492,59 +892,62 @@ class UniversalMetrics:
     
     def _calculate_reliability_metrics(
         self,
-        validation_results: List[ValidationResult]
+        columns: _ResultColumns
     ) -> Dict[str, MetricResult]:
         """Calculate reliability-related metrics."""
         metrics = {}
         
-        if not validation_results:
+        n = columns.size
+        if n == 0:
             return metrics
         
         # Success rate
-        successful = sum(1 for r in validation_results if r.passed)
-        success_rate = (successful / len(validation_results)) * 100
+        successful = sum(1 for p in columns.passed if p)
+        success_rate = (successful / n) * 100
         
         metrics["success_rate"] = MetricResult(
             metric_id="success_rate",
             value=success_rate,
             normalized_value=success_rate / 100,
-            sample_size=len(validation_results)
+            sample_size=n
         )
         
         # Error rate
-        errors = sum(1 for r in validation_results if r.severity in [ValidationSeverity.HIGH, ValidationSeverity.CRITICAL])
-        error_rate = (errors / len(validation_results)) * 100
+        errors = int(columns.severity_counts[_ERROR_SEVERITY_CODES].sum())
+        error_rate = (errors / n) * 100
         
-        metric_def = self._metric_definitions["error_rate"]
         metrics["error_rate"] = MetricResult(
             metric_id="error_rate",
             value=error_rate,
-            normalized_value=metric_def.normalize_value(error_rate),
-            sample_size=len(validation_results)
+            normalized_value=self._normalize_error_rate(error_rate),
+            sample_size=n
         )
         
         return metrics
     
     def _calculate_consistency_metrics(
         self,
-        validation_results: List[ValidationResult],
+        columns: _ResultColumns,
         consistency_data: Dict[str, Any]
     ) -> Dict[str, MetricResult]:
         """Calculate consistency-related metrics."""
         metrics = {}
         
         # Consistency score from validation results
-        consistency_results = [r for r in validation_results if r.check_name == "consistency_validation"]
+        consistency_results = [
+            score for score, name in zip(columns.scores, columns.check_names)
+            if name is _CONSISTENCY_CHECK
+        ]
         if consistency_results:
-            consistency_scores = [r.score for r in consistency_results]
-            avg_consistency = mean(consistency_scores)
+            consistency_scores = np.array(consistency_results, dtype=np.float64)
+            avg_consistency = float(consistency_scores.mean())
             
             metrics["consistency_score"] = MetricResult(
                 metric_id="consistency_score",
                 value=avg_consistency,
                 normalized_value=avg_consistency,
                 sample_size=len(consistency_scores),
-                metadata={"std_dev": stdev(consistency_scores) if len(consistency_scores) > 1 else 0}
+                metadata={"std_dev": float(consistency_scores.std(ddof=1)) if len(consistency_scores) > 1 else 0}
             )
         
         # Determinism score
@@ -563,55 +966,63 @@ class UniversalMetrics:
     
     def _calculate_completeness_metrics(
         self,
-        validation_results: List[ValidationResult]
+        columns: _ResultColumns
     ) -> Dict[str, MetricResult]:
         """Calculate completeness-related metrics."""
         metrics = {}
         
-        if not validation_results:
+        n = columns.size
+        if n == 0:
             return metrics
         
         # Completeness score based on missing data/fields
-        completeness_checks = [r for r in validation_results if "completeness" in r.check_name.lower() or "missing" in r.message.lower()]
+        completeness_checks = [
+            score for score, flags in zip(columns.scores, columns.keyword_flags)
+            if flags & (_KW_COMPLETENESS | _KW_MISSING)
+        ]
         if completeness_checks:
-            completeness_score = mean([r.score for r in completeness_checks])
+            completeness_score = float(np.mean(completeness_checks))
         else:
             # If no specific completeness checks, use format validation as proxy
-            format_checks = [r for r in validation_results if "format" in r.check_name.lower()]
-            completeness_score = mean([r.score for r in format_checks]) if format_checks else 1.0
+            format_checks = [
+                score for score, flags in zip(columns.scores, columns.keyword_flags)
+                if flags & _KW_FORMAT
+            ]
+            completeness_score = float(np.mean(format_checks)) if format_checks else 1.0
         
         metrics["completeness_score"] = MetricResult(
             metric_id="completeness_score",
             value=completeness_score,
             normalized_value=completeness_score,
-            sample_size=len(validation_results)
+            sample_size=n
         )
         
         return metrics
     
     def _calculate_safety_metrics(
         self,
-        validation_results: List[ValidationResult]
+        columns: _ResultColumns
     ) -> Dict[str, MetricResult]:
         """Calculate safety-related metrics."""
         metrics = {}
         
-        if not validation_results:
+        n = columns.size
+        if n == 0:
             return metrics
         
         # Safety score based on critical issues
-        critical_issues = sum(1 for r in validation_results if r.severity == ValidationSeverity.CRITICAL)
-        high_issues = sum(1 for r in validation_results if r.severity == ValidationSeverity.HIGH)
+        critical_issues = int(columns.severity_counts[_CRITICAL_CODE])
+        high_issues = int(columns.severity_counts[_HIGH_CODE])
         
         # Safety score decreases with critical/high severity issues
-        safety_penalty = (critical_issues * 0.2 + high_issues * 0.1) / len(validation_results)
+        safety_penalty = (critical_issues * 0.2 + high_issues * 0.1) / n
         safety_score = max(0, 1 - safety_penalty)
         
         metrics["safety_score"] = MetricResult(
             metric_id="safety_score",
             value=safety_score,
             normalized_value=safety_score,
-            sample_size=len(validation_results),
+            sample_size=n,
             metadata={
                 "critical_issues": critical_issues,
                 "high_issues": high_issues
@@ -619,16 +1030,18 @@ class UniversalMetrics:
         )
         
         # Hallucination rate (if available)
-        hallucination_checks = [r for r in validation_results if "hallucination" in r.check_name.lower()]
+        hallucination_checks = [
+            p for p, flags in zip(columns.passed, columns.keyword_flags)
+            if flags & _KW_HALLUCINATION
+        ]
         if hallucination_checks:
-            hallucinations = sum(1 for r in hallucination_checks if not r.passed)
+            hallucinations = sum(1 for p in hallucination_checks if not p)
             hallucination_rate = (hallucinations / len(hallucination_checks)) * 100
             
-            metric_def = self._metric_definitions["hallucination_rate"]
             metrics["hallucination_rate"] = MetricResult(
                 metric_id="hallucination_rate",
                 value=hallucination_rate,
-                normalized_value=metric_def.normalize_value(hallucination_rate),
+                normalized_value=self._normalize_hallucination_rate(hallucination_rate),
                 sample_size=len(hallucination_checks)
             )
         
@@ -653,17 +1066,22 @@ class UniversalMetrics:
         aggregated = {}
         
         # Group results by metric ID
-        metric_groups = {}
+        metric_groups: Dict[str, List[MetricResult]] = defaultdict(list)
         for results in metric_results_list:
             for metric_id, result in results.items():
-                if metric_id not in metric_groups:
-                    metric_groups[metric_id] = []
                 metric_groups[metric_id].append(result)
         
+        # Large multi-run aggregations go through the compiled kernel
+        if (
+            _aggregate_kernel is not None
+            and sum(len(results) for results in metric_groups.values()) >= AGGREGATION_KERNEL_MIN_SIZE
+        ):
+            return self._aggregate_with_kernel(metric_groups)
+        
         # Aggregate each metric
         for metric_id, results in metric_groups.items():
-            values = [r.value for r in results]
-            normalized_values = [r.normalized_value for r in results]
+            values = list(map(_get_value, results))
+            normalized_values = list(map(_get_normalized_value, results))
             
             metric_def = self._metric_definitions.get(metric_id)
             if metric_def:
@@ -690,13 +1108,13 @@ class UniversalMetrics:
                 agg_value = mean(values)
                 agg_normalized = mean(normalized_values)
             
-            total_samples = sum(r.sample_size or 1 for r in results)
+            total_samples = sum(size or 1 for size in map(_get_sample_size, results))
             
             aggregated[metric_id] = MetricResult(
                 metric_id=metric_id,
                 value=agg_value,
                 normalized_value=agg_normalized,
-                confidence=mean([r.confidence for r in results]),
+                confidence=mean(map(_get_confidence, results)),
                 sample_size=total_samples,
                 metadata={
                     "num_runs": len(results),
@@ -708,6 +1126,61 @@ class UniversalMetrics:
         
         return aggregated
     
+    def _aggregate_with_kernel(
+        self,
+        metric_groups: Dict[str, List[MetricResult]]
+    ) -> Dict[str, MetricResult]:
+        """
+        Aggregate grouped metric results with the Numba kernel.
+        
+        Args:
+            metric_groups: Metric results grouped by metric ID
+            
+        Returns:
+            Aggregated metrics
+        """
+        metric_ids = list(metric_groups)
+        counts = np.fromiter(
+            (len(metric_groups[metric_id]) for metric_id in metric_ids),
+            dtype=np.int64,
+            count=len(metric_ids)
+        )
+        offsets = np.zeros(len(metric_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        total = int(offsets[-1])
+        
+        all_results = [r for metric_id in metric_ids for r in metric_groups[metric_id]]
+        values = np.fromiter(map(_get_value, all_results), dtype=np.float64, count=total)
+        normalized = np.fromiter(map(_get_normalized_value, all_results), dtype=np.float64, count=total)
+        confidences = np.fromiter(map(_get_confidence, all_results), dtype=np.float64, count=total)
+        
+        methods = np.empty(len(metric_ids), dtype=np.int64)
+        for k, metric_id in enumerate(metric_ids):
+            metric_def = self._metric_definitions.get(metric_id)
+            methods[k] = _AGGREGATION_CODES.get(metric_def.aggregation_method, 0) if metric_def else 0
+        
+        rows = _aggregate_kernel(values, normalized, confidences, offsets, methods)
+        
+        aggregated = {}
+        for k, metric_id in enumerate(metric_ids):
+            results = metric_groups[metric_id]
+            agg_value, agg_normalized, confidence, std_dev, min_value, max_value = rows[k].tolist()
+            aggregated[metric_id] = MetricResult(
+                metric_id=metric_id,
+                value=agg_value,
+                normalized_value=agg_normalized,
+                confidence=confidence,
+                sample_size=sum(size or 1 for size in map(_get_sample_size, results)),
+                metadata={
+                    "num_runs": len(results),
+                    "std_dev": std_dev,
+                    "min_value": min_value,
+                    "max_value": max_value
+                }
+            )
+        
+        return aggregated
+    
     def get_metric_definition(self, metric_id: str) -> Optional[MetricDefinition]:
         """Get metric definition by ID."""
         return self._metric_definitions.get(metric_id)
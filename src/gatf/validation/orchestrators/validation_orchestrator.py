@@ -8,13 +8,19 @@ tasks, resource allocation, result aggregation, and pipeline optimization.
 from typing import Dict, Any, List, Optional, Union, Callable, Tuple, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 from enum import Enum
 import asyncio
+import contextvars
+import copy
+import threading
 import time
-import json
 import uuid
-from collections import defaultdict
+import hashlib
+import itertools
+import os
+import pickle
+from collections import OrderedDict, defaultdict, deque
 
 from ...core.exceptions import (
     ValidationError,
@@ -30,6 +36,68 @@ from ...utils.caching import CacheManager
 
 logger = get_logger(__name__)
 
+# Upper bound on orchestrator worker threads regardless of the requested count
+MAX_POOL_WORKERS = 16
+
+# Delay before the first retry of a failed task; doubles on each further retry
+RETRY_BACKOFF_SECONDS = 0.01
+
+# Number of validation contexts kept in the in-process front cache
+INPROC_CACHE_SIZE = 256
+
+# Inputs of these types cannot change after validation, so the in-process
+# cache can key on the values themselves
+_IMMUTABLE_INPUT_TYPES = (str, bytes, int, float, complex, bool, type(None))
+
+# Options that change validation results and therefore take part in cache keys
+_CACHE_KEY_OPTIONS = ("strict_mode", "include_suggestions")
+
+# Stands in for an option that was not passed
+_NO_OPTION = object()
+
+
+class _HashWriter:
+    """File-like sink that feeds pickle output straight into a hasher."""
+    
+    __slots__ = ("write",)
+    
+    def __init__(self, hasher: Any):
+        self.write = hasher.update
+
+
+def _fingerprint(obj: Any) -> bytes:
+    """
+    Content hash of a validation input for cache keys.
+    
+    Strings and bytes are hashed directly; other values through their pickle,
+    streamed into the hasher frame by frame rather than materialized, falling
+    back to repr for unpicklable objects. Each form is tagged so e.g. the
+    string "1" and the integer 1 hash differently.
+    
+    Args:
+        obj: Value to fingerprint
+        
+    Returns:
+        16-byte digest
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(obj, str):
+        h.update(b"s:")
+        h.update(obj.encode("utf-8", "surrogatepass"))
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        h.update(b"b:")
+        h.update(obj)
+    else:
+        h.update(b"p:")
+        try:
+            pickle.Pickler(_HashWriter(h), protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+        except Exception:
+            # The partial pickle is already in the hasher; start over
+            h = hashlib.blake2b(digest_size=16)
+            h.update(b"r:")
+            h.update(repr(obj).encode("utf-8", "surrogatepass"))
+    return h.digest()
+
 
 class ValidationStage(Enum):
     """Stages in the validation pipeline."""
@@ -41,6 +109,10 @@ class ValidationStage(Enum):
     POST_VALIDATION = "post_validation"
     AGGREGATION = "aggregation"
     FINALIZATION = "finalization"
+    
+    # Members are singletons compared by identity, so the C-level identity hash
+    # is consistent and avoids Enum's Python-level __hash__ on set/dict lookups
+    __hash__ = object.__hash__
 
 
 class ValidationStatus(Enum):
@@ -51,12 +123,47 @@ class ValidationStatus(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
     SKIPPED = "skipped"
+    
+    # See ValidationStage.__hash__
+    __hash__ = object.__hash__
+
+
+# Wall-clock and perf-counter readings taken together, used to turn task
+# perf-counter timestamps into datetimes on demand
+_CLOCK_ANCHOR_NS = (time.time_ns(), time.perf_counter_ns())
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _perf_ns_to_datetime(perf_ns: int) -> datetime:
+    """Convert a time.perf_counter_ns() reading to a naive UTC datetime."""
+    wall_ns = _CLOCK_ANCHOR_NS[0] + (perf_ns - _CLOCK_ANCHOR_NS[1])
+    return _EPOCH + timedelta(microseconds=wall_ns // 1000)
+
 
+# Severity levels in definition order and each level's slot in a tally list
+_SEVERITIES = tuple(ValidationSeverity)
+_SEVERITY_INDEX = {severity: index for index, severity in enumerate(_SEVERITIES)}
 
-@dataclass
+# Guards ValidationContext result tallies; parallel stages add results from
+# worker threads. Module-level so contexts stay picklable for cache backends.
+_RESULTS_LOCK = threading.Lock()
+
+# Process-wide task ID sequence; task IDs only need to be unique within a context
+_task_ids = itertools.count()
+
+# Statuses after which a task will not run again
+_TERMINAL_STATUSES = frozenset({
+    ValidationStatus.COMPLETED,
+    ValidationStatus.FAILED,
+    ValidationStatus.CANCELLED,
+    ValidationStatus.SKIPPED
+})
+
+
+@dataclass(slots=True)
 class ValidationTask:
     """Represents a single validation task."""
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = field(default_factory=lambda: f"t{next(_task_ids)}")
     name: str = ""
     stage: ValidationStage = ValidationStage.INITIALIZATION
     status: ValidationStatus = ValidationStatus.PENDING
@@ -65,30 +172,42 @@ class ValidationTask:
     input_data: Dict[str, Any] = field(default_factory=dict)
     output_data: Optional[Any] = None
     error: Optional[Exception] = None
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    # time.perf_counter_ns() readings; datetimes are only built on access
+    start_ns: Optional[int] = None
+    end_ns: Optional[int] = None
     retry_count: int = 0
     max_retries: int = 3
+    # Dependencies not yet finished, maintained by the dispatcher
+    remaining: int = 0
+    
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Get task start time as a naive UTC datetime."""
+        if self.start_ns is None:
+            return None
+        return _perf_ns_to_datetime(self.start_ns)
+    
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Get task end time as a naive UTC datetime."""
+        if self.end_ns is None:
+            return None
+        return _perf_ns_to_datetime(self.end_ns)
     
     @property
     def duration(self) -> Optional[timedelta]:
         """Get task duration."""
-        if self.start_time and self.end_time:
-            return self.end_time - self.start_time
+        if self.start_ns is not None and self.end_ns is not None:
+            return timedelta(microseconds=(self.end_ns - self.start_ns) // 1000)
         return None
     
     @property
     def is_complete(self) -> bool:
         """Check if task is complete."""
-        return self.status in [
-            ValidationStatus.COMPLETED,
-            ValidationStatus.FAILED,
-            ValidationStatus.CANCELLED,
-            ValidationStatus.SKIPPED
-        ]
+        return self.status in _TERMINAL_STATUSES
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationPipeline:
     """Represents a validation pipeline configuration."""
     pipeline_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -98,6 +217,8 @@ class ValidationPipeline:
     stage_timeout: Dict[ValidationStage, float] = field(default_factory=dict)
     skip_conditions: Dict[ValidationStage, Callable] = field(default_factory=dict)
     cache_stages: Set[ValidationStage] = field(default_factory=set)
+    # Serialized description, built on first get_pipeline_info call
+    _info: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize default timeouts."""
@@ -116,7 +237,7 @@ class ValidationPipeline:
                 self.stage_timeout[stage] = timeout
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationContext:
     """Context for validation execution."""
     request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -129,16 +250,90 @@ class ValidationContext:
     metrics: Dict[str, MetricResult] = field(default_factory=dict)
     tasks: Dict[str, ValidationTask] = field(default_factory=dict)
     cache_enabled: bool = True
+    # Task IDs per stage, filled in as stage tasks are created
+    _stage_tasks: Dict[ValidationStage, List[str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Whether the (non-skipped) aggregation stage is part of this run
+    _aggregate: bool = field(default=False, init=False, repr=False)
+    # Running totals over finished tasks, maintained by the dispatcher thread
+    _total_task_ns: int = field(default=0, init=False, repr=False)
+    _n_timed_tasks: int = field(default=0, init=False, repr=False)
+    # Tallies over results added through add_result/add_results
+    _score_sum: float = field(default=0.0, init=False, repr=False)
+    _passed: int = field(default=0, init=False, repr=False)
+    _failed: int = field(default=0, init=False, repr=False)
+    # Result count per severity, indexed like _SEVERITIES
+    _severity_counts: List[int] = field(
+        default_factory=lambda: [0] * len(_SEVERITIES), init=False, repr=False
+    )
     
     def add_result(self, result: ValidationResult) -> None:
         """Add a validation result."""
-        self.results.append(result)
+        self.add_results((result,))
+    
+    def add_results(self, results: List[ValidationResult]) -> None:
+        """Add validation results, keeping the summary tallies current."""
+        with _RESULTS_LOCK:
+            for result in results:
+                self.results.append(result)
+                self._score_sum += result.score
+                if result.passed:
+                    self._passed += 1
+                else:
+                    self._failed += 1
+                self._severity_counts[_SEVERITY_INDEX[result.severity]] += 1
+    
+    def _retally(self) -> None:
+        """Recompute the tallies if results were added around add_results."""
+        with _RESULTS_LOCK:
+            if self._passed + self._failed == len(self.results):
+                return
+            self._score_sum = 0.0
+            self._passed = 0
+            self._failed = 0
+            self._severity_counts = [0] * len(_SEVERITIES)
+            for result in self.results:
+                self._score_sum += result.score
+                if result.passed:
+                    self._passed += 1
+                else:
+                    self._failed += 1
+                self._severity_counts[_SEVERITY_INDEX[result.severity]] += 1
     
     def add_metric(self, metric_id: str, metric: MetricResult) -> None:
         """Add a metric result."""
         self.metrics[metric_id] = metric
 
 
+def _copy_context(context: ValidationContext) -> ValidationContext:
+    """
+    Copy a cached validation context so callers cannot mutate the cache.
+    
+    Results, metrics, metadata and options are deep-copied. Tasks are copied
+    one level deep: their validator functions are bound to the orchestrator
+    and must not be copied.
+    """
+    clone = copy.copy(context)
+    clone.metadata = copy.deepcopy(context.metadata)
+    clone.options = copy.deepcopy(context.options)
+    clone.results = copy.deepcopy(context.results)
+    clone.metrics = copy.deepcopy(context.metrics)
+    clone.tasks = {task_id: _copy_task(task) for task_id, task in context.tasks.items()}
+    clone._stage_tasks = {stage: list(task_ids) for stage, task_ids in context._stage_tasks.items()}
+    clone._severity_counts = list(context._severity_counts)
+    return clone
+
+
+def _copy_task(task: ValidationTask) -> ValidationTask:
+    """Copy a finished task along with its inputs and outputs."""
+    clone = copy.copy(task)
+    clone.dependencies = set(task.dependencies)
+    clone.input_data = dict(task.input_data)
+    clone.output_data = copy.deepcopy(task.output_data)
+    return clone
+
+
 class ValidationOrchestrator:
     """
     Orchestrates the validation pipeline execution.
@@ -161,7 +356,8 @@ class ValidationOrchestrator:
         Initialize the validation orchestrator.
         
         Args:
-            max_workers: Maximum number of parallel workers
+            max_workers: Maximum number of parallel workers, capped at the CPU
+                count and MAX_POOL_WORKERS
             cache_enabled: Enable result caching
             cache_ttl: Cache time-to-live in seconds
         """
@@ -179,9 +375,18 @@ class ValidationOrchestrator:
         self._default_pipeline = self._create_default_pipeline()
         
         # Execution state
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        pool_size = max(1, min(max_workers, os.cpu_count() or 4, MAX_POOL_WORKERS))
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size,
+            thread_name_prefix="gatf-validator"
+        )
         self._running_contexts: Dict[str, ValidationContext] = {}
         
+        # In-process LRU in front of the cache manager, holding
+        # (monotonic expiry or None, context) pairs
+        self._inproc_cache: "OrderedDict[Tuple, Tuple[Optional[float], ValidationContext]]" = OrderedDict()
+        self._inproc_lock = threading.Lock()
+        
     def _create_default_pipeline(self) -> ValidationPipeline:
         """Create the default validation pipeline."""
         pipeline = ValidationPipeline(
@@ -205,9 +410,19 @@ class ValidationOrchestrator:
         Args:
             pipeline: Pipeline configuration
         """
+        pipeline._info = None
         self._pipelines[pipeline.name] = pipeline
+        # In-process entries are keyed by pipeline name and may belong to a
+        # pipeline this one replaces
+        self._clear_inproc()
         logger.info(f"Registered pipeline: {pipeline.name}")
     
+    def clear_cache(self) -> None:
+        """Clear cached validation results, in process and in the cache manager."""
+        if self.cache_manager:
+            self.cache_manager.clear()
+        self._clear_inproc()
+    
     @log_performance
     def validate(
         self,
@@ -232,31 +447,15 @@ class ValidationOrchestrator:
         Returns:
             Validation context with results
         """
-        # Create validation context
-        context = ValidationContext(
-            agent_output=agent_output,
-            expected_output=expected_output,
-            metadata=context_metadata or {},
-            options=options,
-            cache_enabled=self.cache_enabled and options.get("use_cache", True)
+        context = self._create_context(
+            agent_output, domain, expected_output, context_metadata, options
         )
-        
-        # Determine domain
-        if isinstance(domain, str):
-            context.domain_type = domain
-        elif isinstance(domain, BaseDomain):
-            context.domain_type = domain.domain_type.value
-        
-        # Get pipeline
         pipeline = self._get_pipeline(pipeline_name)
         
         # Check cache
-        cache_key = self._generate_cache_key(context, pipeline)
-        if context.cache_enabled and self.cache_manager:
-            cached_result = self.cache_manager.get(cache_key)
-            if cached_result:
-                logger.debug(f"Cache hit for validation {context.request_id}")
-                return cached_result
+        cached_result, cache_key, inproc_key = self._lookup_cached(context, pipeline)
+        if cached_result is not None:
+            return cached_result
         
         # Store running context
         self._running_contexts[context.request_id] = context
@@ -266,8 +465,7 @@ class ValidationOrchestrator:
             self._execute_pipeline(context, pipeline)
             
             # Cache results
-            if context.cache_enabled and self.cache_manager:
-                self.cache_manager.set(cache_key, context, ttl=self.cache_ttl)
+            self._store_cached(context, cache_key, inproc_key)
             
             return context
             
@@ -278,10 +476,202 @@ class ValidationOrchestrator:
             # Clean up
             self._running_contexts.pop(context.request_id, None)
     
+    async def avalidate(
+        self,
+        agent_output: Any,
+        domain: Optional[Union[str, BaseDomain]] = None,
+        expected_output: Optional[Any] = None,
+        pipeline_name: Optional[str] = None,
+        context_metadata: Optional[Dict[str, Any]] = None,
+        **options
+    ) -> ValidationContext:
+        """
+        Execute validation pipeline without blocking the event loop.
+        
+        Dependency resolution runs on the caller's event loop (uvloop works
+        if the application installed it); every task runs on the
+        orchestrator's thread pool, with parallel stages overlapping.
+        
+        Args:
+            agent_output: The agent output to validate
+            domain: Domain or domain type for validation
+            expected_output: Optional expected output
+            pipeline_name: Name of pipeline to use
+            context_metadata: Additional context metadata
+            **options: Additional validation options
+            
+        Returns:
+            Validation context with results
+        """
+        context = self._create_context(
+            agent_output, domain, expected_output, context_metadata, options
+        )
+        pipeline = self._get_pipeline(pipeline_name)
+        
+        cached_result, cache_key, inproc_key = self._lookup_cached(context, pipeline)
+        if cached_result is not None:
+            return cached_result
+        
+        self._running_contexts[context.request_id] = context
+        
+        try:
+            self._create_pipeline_tasks(context, pipeline)
+            schedule = self._build_schedule(context.tasks)
+            await self._aexecute_tasks(context, pipeline, schedule)
+            if context._aggregate:
+                self._aggregate_stage_results(context)
+            
+            self._store_cached(context, cache_key, inproc_key)
+            
+            return context
+            
+        except Exception as e:
+            logger.error(f"Validation pipeline failed: {str(e)}")
+            raise PipelineError(f"Validation failed: {str(e)}")
+        finally:
+            self._running_contexts.pop(context.request_id, None)
+    
+    def _create_context(
+        self,
+        agent_output: Any,
+        domain: Optional[Union[str, BaseDomain]],
+        expected_output: Optional[Any],
+        context_metadata: Optional[Dict[str, Any]],
+        options: Dict[str, Any]
+    ) -> ValidationContext:
+        """Create the validation context for a validate() call."""
+        context = ValidationContext(
+            agent_output=agent_output,
+            expected_output=expected_output,
+            metadata=context_metadata or {},
+            options=options,
+            cache_enabled=self.cache_enabled and options.get("use_cache", True)
+        )
+        
+        # Determine domain
+        if isinstance(domain, str):
+            context.domain_type = domain
+        elif isinstance(domain, BaseDomain):
+            context.domain_type = domain.domain_type.value
+        
+        return context
+    
+    def _lookup_cached(
+        self,
+        context: ValidationContext,
+        pipeline: ValidationPipeline
+    ) -> Tuple[Optional[ValidationContext], Optional[str], Optional[Tuple]]:
+        """
+        Look a validation up in the in-process cache, then the cache manager.
+        
+        Returns:
+            Tuple of (cached context or None, cache manager key, in-process
+            key); the keys are None when that cache does not apply
+        """
+        cache_key = None
+        inproc_key = None
+        if not context.cache_enabled:
+            return None, cache_key, inproc_key
+        
+        inproc_key = self._inproc_cache_key(context, pipeline)
+        if inproc_key is not None:
+            cached_context = None
+            with self._inproc_lock:
+                entry = self._inproc_cache.get(inproc_key)
+                if entry is not None:
+                    expires_at, cached_context = entry
+                    if expires_at is not None and time.monotonic() >= expires_at:
+                        del self._inproc_cache[inproc_key]
+                        cached_context = None
+                    else:
+                        self._inproc_cache.move_to_end(inproc_key)
+            if cached_context is not None:
+                logger.debug(f"In-process cache hit for validation {context.request_id}")
+                return _copy_context(cached_context), cache_key, inproc_key
+        
+        if self.cache_manager:
+            cache_key = self._generate_cache_key(context, pipeline)
+            cached_result = self.cache_manager.get(cache_key)
+            if cached_result:
+                logger.debug(f"Cache hit for validation {context.request_id}")
+                # Not copied into the in-process LRU: the entry's remaining
+                # TTL is unknown here and must not be extended
+                return _copy_context(cached_result), cache_key, inproc_key
+        
+        return None, cache_key, inproc_key
+    
+    def _store_cached(
+        self,
+        context: ValidationContext,
+        cache_key: Optional[str],
+        inproc_key: Optional[Tuple]
+    ) -> None:
+        """Store a finished validation under the keys from _lookup_cached."""
+        if cache_key is None and inproc_key is None:
+            return
+        # The caller keeps the original; the caches share one private copy
+        stored = _copy_context(context)
+        if cache_key is not None:
+            self.cache_manager.set(cache_key, stored, ttl=self.cache_ttl)
+        self._store_inproc(inproc_key, stored)
+    
+    def _inproc_cache_key(
+        self,
+        context: ValidationContext,
+        pipeline: ValidationPipeline
+    ) -> Optional[Tuple]:
+        """
+        Build the in-process cache key for a validation.
+        
+        Only immutable scalar inputs qualify: the key holds the values
+        themselves (with their types, so 1 and True differ), and str/bytes
+        cache their hash, so repeat validations of the same object cost no
+        rehash.
+        
+        Returns:
+            Hashable key, or None if the inputs are not eligible
+        """
+        if not (isinstance(context.agent_output, _IMMUTABLE_INPUT_TYPES) and
+                isinstance(context.expected_output, _IMMUTABLE_INPUT_TYPES)):
+            return None
+        key = (
+            pipeline.name,
+            context.domain_type,
+            type(context.agent_output),
+            context.agent_output,
+            type(context.expected_output),
+            context.expected_output,
+            tuple(context.options.get(opt, _NO_OPTION) for opt in _CACHE_KEY_OPTIONS)
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _store_inproc(self, key: Optional[Tuple], context: ValidationContext) -> None:
+        """
+        Store a context in the in-process LRU, evicting the oldest entry when
+        full. Entries expire after cache_ttl seconds, like the cache manager's.
+        """
+        if key is None:
+            return
+        expires_at = time.monotonic() + self.cache_ttl if self.cache_ttl is not None else None
+        with self._inproc_lock:
+            self._inproc_cache[key] = (expires_at, context)
+            self._inproc_cache.move_to_end(key)
+            if len(self._inproc_cache) > INPROC_CACHE_SIZE:
+                self._inproc_cache.popitem(last=False)
+    
+    def _clear_inproc(self) -> None:
+        """Drop every in-process cache entry."""
+        with self._inproc_lock:
+            self._inproc_cache.clear()
+    
     def _get_pipeline(self, pipeline_name: Optional[str]) -> ValidationPipeline:
         """Get pipeline by name or return default."""
-        if pipeline_name and pipeline_name in self._pipelines:
-            return self._pipelines[pipeline_name]
+        if pipeline_name:
+            return self._pipelines.get(pipeline_name, self._default_pipeline)
         return self._default_pipeline
     
     def _execute_pipeline(
@@ -296,7 +686,22 @@ class ValidationOrchestrator:
             context: Validation context
             pipeline: Pipeline configuration
         """
-        # Create tasks for each stage
+        self._create_pipeline_tasks(context, pipeline)
+        
+        # Execute tasks respecting dependencies
+        schedule = self._build_schedule(context.tasks)
+        self._execute_tasks(context, pipeline, schedule)
+        
+        # Aggregate results once every task has finished
+        if context._aggregate:
+            self._aggregate_stage_results(context)
+    
+    def _create_pipeline_tasks(
+        self,
+        context: ValidationContext,
+        pipeline: ValidationPipeline
+    ) -> None:
+        """Create the tasks for every non-skipped pipeline stage."""
         for stage in pipeline.stages:
             # Check skip condition
             if stage in pipeline.skip_conditions:
@@ -304,16 +709,16 @@ class ValidationOrchestrator:
                     logger.debug(f"Skipping stage {stage.value}")
                     continue
             
+            # Aggregation is a plain pass over the tallies after the run, not a task
+            if stage == ValidationStage.AGGREGATION:
+                context._aggregate = True
+                continue
+            
             # Create tasks for stage
             tasks = self._create_stage_tasks(stage, context, pipeline)
             for task in tasks:
                 context.tasks[task.task_id] = task
-        
-        # Execute tasks respecting dependencies
-        self._execute_tasks(context, pipeline)
-        
-        # Aggregate results
-        self._aggregate_results(context)
+                context._stage_tasks.setdefault(task.stage, []).append(task.task_id)
     
     def _create_stage_tasks(
         self,
@@ -362,9 +767,10 @@ class ValidationOrchestrator:
                 name="calculate_metrics",
                 stage=stage,
                 validator_func=lambda: self._calculate_metrics(context),
-                dependencies={t.task_id for t in context.tasks.values() 
-                            if t.stage in [ValidationStage.DOMAIN_VALIDATION, 
-                                         ValidationStage.QUALITY_VALIDATION]}
+                dependencies={
+                    *context._stage_tasks.get(ValidationStage.DOMAIN_VALIDATION, ()),
+                    *context._stage_tasks.get(ValidationStage.QUALITY_VALIDATION, ())
+                }
             )
             tasks.append(task)
             
@@ -373,18 +779,7 @@ class ValidationOrchestrator:
                 name="post_validation_processing",
                 stage=stage,
                 validator_func=lambda: self._post_validation_processing(context),
-                dependencies={t.task_id for t in context.tasks.values() 
-                            if t.stage == ValidationStage.METRIC_CALCULATION}
-            )
-            tasks.append(task)
-            
-        elif stage == ValidationStage.AGGREGATION:
-            task = ValidationTask(
-                name="aggregate_results",
-                stage=stage,
-                validator_func=lambda: self._aggregate_stage_results(context),
-                dependencies={t.task_id for t in context.tasks.values() 
-                            if t.stage == ValidationStage.POST_VALIDATION}
+                dependencies=set(context._stage_tasks.get(ValidationStage.METRIC_CALCULATION, ()))
             )
             tasks.append(task)
             
@@ -393,60 +788,202 @@ class ValidationOrchestrator:
                 name="finalize_validation",
                 stage=stage,
                 validator_func=lambda: self._finalize_validation(context),
-                dependencies={t.task_id for t in context.tasks.values() 
-                            if t.stage == ValidationStage.AGGREGATION}
+                dependencies=set(context._stage_tasks.get(ValidationStage.POST_VALIDATION, ()))
             )
             tasks.append(task)
         
         return tasks
     
+    def _build_schedule(
+        self,
+        tasks: Dict[str, ValidationTask]
+    ) -> Tuple[deque, Dict[str, List[str]]]:
+        """
+        Build the dependency schedule for a set of tasks.
+        
+        Sets each task's remaining counter to its number of dependencies.
+        
+        Args:
+            tasks: Tasks keyed by task ID
+            
+        Returns:
+            Tuple of (IDs of tasks with no dependencies, IDs of the tasks
+            depending on each task)
+            
+        Raises:
+            DependencyError: If the dependencies contain a cycle or reference
+                an unknown task
+        """
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for task_id, task in tasks.items():
+            task.remaining = len(task.dependencies)
+            for dependency in task.dependencies:
+                dependents[dependency].append(task_id)
+        ready = deque(task_id for task_id, task in tasks.items() if task.remaining == 0)
+        
+        # Kahn's algorithm on scratch counts: every task must be reachable
+        unmet = {task_id: task.remaining for task_id, task in tasks.items()}
+        frontier = list(ready)
+        ordered = 0
+        while frontier:
+            task_id = frontier.pop()
+            ordered += 1
+            for dependent_id in dependents.get(task_id, ()):
+                unmet[dependent_id] -= 1
+                if unmet[dependent_id] == 0:
+                    frontier.append(dependent_id)
+        if ordered < len(tasks):
+            raise DependencyError("Circular dependency detected in validation pipeline")
+        
+        return ready, dependents
+    
     def _execute_tasks(
         self,
         context: ValidationContext,
-        pipeline: ValidationPipeline
+        pipeline: ValidationPipeline,
+        schedule: Tuple[deque, Dict[str, List[str]]]
     ) -> None:
         """Execute tasks with dependency resolution."""
-        completed_tasks = set()
+        ready, dependents = schedule
         futures_to_tasks = {}
+        num_completed = 0
         
-        while len(completed_tasks) < len(context.tasks):
-            # Find tasks ready to run
-            ready_tasks = []
-            for task_id, task in context.tasks.items():
-                if (task_id not in completed_tasks and
-                    task.status == ValidationStatus.PENDING and
-                    task.dependencies.issubset(completed_tasks)):
-                    ready_tasks.append(task)
-            
-            if not ready_tasks and len(completed_tasks) < len(context.tasks):
-                # Deadlock or circular dependency
+        while num_completed < len(context.tasks):
+            if not ready and not futures_to_tasks:
+                # Nothing runnable and nothing in flight: deadlock or circular dependency
                 raise DependencyError("Circular dependency detected in validation pipeline")
             
+            # Take every task that became ready since the last pass
+            ready_tasks = [context.tasks[task_id] for task_id in ready]
+            ready.clear()
+            
             # Submit ready tasks
             for task in ready_tasks:
-                # Check if stage can run in parallel
-                if task.stage in pipeline.parallel_stages or len(ready_tasks) == 1:
-                    future = self._executor.submit(self._execute_task, task, context, pipeline)
-                    futures_to_tasks[future] = task
+                # Only parallel stages go through the pool; anything else, including
+                # a lone ready task, runs inline and skips the submit/wakeup round trip
+                if task.stage in pipeline.parallel_stages:
+                    # Mark before submitting so a fast worker's final status sticks
                     task.status = ValidationStatus.RUNNING
+                    future = self._submit(self._execute_task, task, context, pipeline)
+                    futures_to_tasks[future] = task
                 else:
                     # Execute sequentially
                     self._execute_task(task, context, pipeline)
-                    completed_tasks.add(task.task_id)
+                    num_completed += 1
+                    self._finish_task(context, task, ready, dependents)
             
-            # Wait for parallel tasks to complete
+            # Wake on the first finished task so newly unblocked tasks are scheduled promptly
             if futures_to_tasks:
-                done_futures, _ = as_completed(futures_to_tasks), set()
+                done_futures, _ = wait(futures_to_tasks, return_when=FIRST_COMPLETED)
                 for future in done_futures:
                     task = futures_to_tasks.pop(future)
                     try:
                         future.result()
-                        completed_tasks.add(task.task_id)
                     except Exception as e:
                         logger.error(f"Task {task.name} failed: {str(e)}")
                         task.status = ValidationStatus.FAILED
                         task.error = e
-                        completed_tasks.add(task.task_id)
+                    num_completed += 1
+                    self._finish_task(context, task, ready, dependents)
+    
+    async def _aexecute_tasks(
+        self,
+        context: ValidationContext,
+        pipeline: ValidationPipeline,
+        schedule: Tuple[deque, Dict[str, List[str]]]
+    ) -> None:
+        """Event-loop counterpart of _execute_tasks; task bodies run on the pool."""
+        loop = asyncio.get_running_loop()
+        ready, dependents = schedule
+        futures_to_tasks: Dict[asyncio.Future, ValidationTask] = {}
+        num_completed = 0
+        
+        while num_completed < len(context.tasks):
+            if not ready and not futures_to_tasks:
+                raise DependencyError("Circular dependency detected in validation pipeline")
+            
+            ready_tasks = [context.tasks[task_id] for task_id in ready]
+            ready.clear()
+            
+            for task in ready_tasks:
+                if task.stage in pipeline.parallel_stages:
+                    task.status = ValidationStatus.RUNNING
+                    future = self._run_in_executor(
+                        loop, self._execute_task, task, context, pipeline
+                    )
+                    futures_to_tasks[future] = task
+                else:
+                    # Sequential stages still run off-loop, one at a time
+                    await self._run_in_executor(
+                        loop, self._execute_task, task, context, pipeline
+                    )
+                    num_completed += 1
+                    self._finish_task(context, task, ready, dependents)
+            
+            if futures_to_tasks:
+                done_futures, _ = await asyncio.wait(
+                    futures_to_tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done_futures:
+                    task = futures_to_tasks.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Task {task.name} failed: {str(e)}")
+                        task.status = ValidationStatus.FAILED
+                        task.error = e
+                    num_completed += 1
+                    self._finish_task(context, task, ready, dependents)
+    
+    def _submit(self, fn: Callable, *args: Any) -> Future:
+        """
+        Submit work to the pool, carrying the caller's contextvars along.
+        
+        Worker threads do not inherit context variables (e.g. request-scoped
+        logging fields), so a non-empty context is run explicitly; the
+        common empty context skips the extra ctx.run frame.
+        """
+        ctx = contextvars.copy_context()
+        if not ctx:
+            return self._executor.submit(fn, *args)
+        return self._executor.submit(ctx.run, fn, *args)
+    
+    def _run_in_executor(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        fn: Callable,
+        *args: Any
+    ) -> asyncio.Future:
+        """Event-loop counterpart of _submit."""
+        ctx = contextvars.copy_context()
+        if not ctx:
+            return loop.run_in_executor(self._executor, fn, *args)
+        return loop.run_in_executor(self._executor, ctx.run, fn, *args)
+    
+    @staticmethod
+    def _finish_task(
+        context: ValidationContext,
+        task: ValidationTask,
+        ready: deque,
+        dependents: Dict[str, List[str]]
+    ) -> None:
+        """
+        Record a finished task: add its run time to the context totals and
+        queue dependents whose last dependency it was.
+        
+        Called only from the dispatcher, so the totals need no lock.
+        """
+        if task.start_ns is not None and task.end_ns is not None:
+            elapsed_ns = task.end_ns - task.start_ns
+            if elapsed_ns:
+                context._total_task_ns += elapsed_ns
+                context._n_timed_tasks += 1
+        
+        for dependent_id in dependents.get(task.task_id, ()):
+            dependent = context.tasks[dependent_id]
+            dependent.remaining -= 1
+            if dependent.remaining == 0:
+                ready.append(dependent_id)
     
     def _execute_task(
         self,
@@ -454,41 +991,55 @@ class ValidationOrchestrator:
         context: ValidationContext,
         pipeline: ValidationPipeline
     ) -> None:
-        """Execute a single validation task."""
-        task.start_time = datetime.utcnow()
+        """
+        Execute a single validation task.
+        
+        Failures are retried in place, up to task.max_retries times with
+        exponential backoff, before the task is marked FAILED. A timeout is
+        not retried: the validator ran to completion and may already have
+        recorded results.
+        """
+        task.start_ns = time.perf_counter_ns()
         
         try:
+            if not task.validator_func:
+                task.status = ValidationStatus.SKIPPED
+                return
+            
             # Get timeout for stage
             timeout = pipeline.stage_timeout.get(task.stage, 30.0)
             
-            # Execute with timeout
-            if task.validator_func:
-                # Simple timeout implementation
-                start_time = time.time()
-                result = task.validator_func()
-                elapsed = time.time() - start_time
+            while True:
+                attempt_start_ns = time.perf_counter_ns()
+                try:
+                    result = task.validator_func()
+                except Exception as e:
+                    logger.error(f"Task {task.name} failed: {str(e)}")
+                    task.error = e
+                    if task.retry_count >= task.max_retries:
+                        task.status = ValidationStatus.FAILED
+                        return
+                    task.retry_count += 1
+                    logger.info(f"Retrying task {task.name} (attempt {task.retry_count})")
+                    time.sleep(RETRY_BACKOFF_SECONDS * 2 ** (task.retry_count - 1))
+                    continue
                 
+                # Simple timeout implementation
+                elapsed = (time.perf_counter_ns() - attempt_start_ns) / 1e9
                 if elapsed > timeout:
-                    raise SchedulingError(f"Task {task.name} exceeded timeout ({timeout}s)")
+                    error = SchedulingError(f"Task {task.name} exceeded timeout ({timeout}s)")
+                    logger.error(f"Task {task.name} failed: {str(error)}")
+                    task.error = error
+                    task.status = ValidationStatus.FAILED
+                    return
                 
                 task.output_data = result
+                task.error = None
                 task.status = ValidationStatus.COMPLETED
-            else:
-                task.status = ValidationStatus.SKIPPED
+                return
                 
-        except Exception as e:
-            logger.error(f"Task {task.name} failed: {str(e)}")
-            task.error = e
-            task.status = ValidationStatus.FAILED
-            
-            # Retry logic
-            if task.retry_count < task.max_retries:
-                task.retry_count += 1
-                task.status = ValidationStatus.PENDING
-                logger.info(f"Retrying task {task.name} (attempt {task.retry_count})")
-            
         finally:
-            task.end_time = datetime.utcnow()
+            task.end_ns = time.perf_counter_ns()
     
     # Validation stage implementations
     def _initialize_validation(self, context: ValidationContext) -> None:
@@ -524,7 +1075,7 @@ class ValidationOrchestrator:
                 message="Expected output provided but agent output is None"
             ))
         
-        context.results.extend(results)
+        context.add_results(results)
         return results
     
     def _domain_validation(self, context: ValidationContext) -> List[ValidationResult]:
@@ -543,7 +1094,7 @@ class ValidationOrchestrator:
                 context.metadata
             )
             
-            context.results.extend(results)
+            context.add_results(results)
             return results
             
         except Exception as e:
@@ -555,7 +1106,7 @@ class ValidationOrchestrator:
                 severity=ValidationSeverity.HIGH,
                 message=f"Domain validation error: {str(e)}"
             )
-            context.results.append(error_result)
+            context.add_result(error_result)
             return [error_result]
     
     def _quality_validation(self, context: ValidationContext) -> List[ValidationResult]:
@@ -576,7 +1127,7 @@ class ValidationOrchestrator:
             quality_context
         )
         
-        context.results.extend(results)
+        context.add_results(results)
         return results
     
     def _calculate_metrics(self, context: ValidationContext) -> Dict[str, MetricResult]:
@@ -597,8 +1148,9 @@ class ValidationOrchestrator:
     
     def _post_validation_processing(self, context: ValidationContext) -> None:
         """Perform post-validation processing."""
-        # Add suggestions if enabled
-        if context.options.get("include_suggestions", True):
+        # Add suggestions if enabled; clean runs have nothing to annotate
+        context._retally()
+        if context._failed and context.options.get("include_suggestions", True):
             for result in context.results:
                 if not result.passed and not result.suggestions:
                     # Generate generic suggestions based on check type
@@ -611,38 +1163,32 @@ class ValidationOrchestrator:
     
     def _aggregate_stage_results(self, context: ValidationContext) -> None:
         """Aggregate results from all stages."""
-        # Group results by severity
-        severity_counts = defaultdict(int)
-        for result in context.results:
-            severity_counts[result.severity] += 1
-        
-        # Calculate overall validation score
-        total_score = sum(r.score for r in context.results)
+        # Tallies are maintained as results are added
+        context._retally()
         num_results = len(context.results)
-        overall_score = total_score / num_results if num_results > 0 else 0.0
+        overall_score = context._score_sum / num_results if num_results > 0 else 0.0
         
         # Add summary metadata
         context.metadata["validation_summary"] = {
             "total_checks": num_results,
-            "passed_checks": sum(1 for r in context.results if r.passed),
-            "failed_checks": sum(1 for r in context.results if not r.passed),
+            "passed_checks": context._passed,
+            "failed_checks": context._failed,
             "overall_score": overall_score,
-            "severity_distribution": dict(severity_counts),
+            "severity_distribution": {
+                _SEVERITIES[index]: count
+                for index, count in enumerate(context._severity_counts) if count
+            },
             "metrics_calculated": len(context.metrics)
         }
     
     def _finalize_validation(self, context: ValidationContext) -> None:
         """Finalize validation results."""
-        # Calculate total validation time
-        task_times = []
-        for task in context.tasks.values():
-            if task.duration:
-                task_times.append(task.duration.total_seconds())
-        
-        if task_times:
+        # Calculate total validation time from the dispatcher's running totals
+        if context._n_timed_tasks:
+            total_time = context._total_task_ns / 1e9
             context.metadata["validation_performance"] = {
-                "total_time": sum(task_times),
-                "average_task_time": sum(task_times) / len(task_times),
+                "total_time": total_time,
+                "average_task_time": total_time / context._n_timed_tasks,
                 "num_tasks": len(context.tasks),
                 "parallel_tasks": sum(1 for t in context.tasks.values() 
                                     if t.stage in self._default_pipeline.parallel_stages)
@@ -651,46 +1197,52 @@ class ValidationOrchestrator:
         logger.info(f"Validation {context.request_id} completed with "
                    f"{len(context.results)} results and {len(context.metrics)} metrics")
     
-    def _aggregate_results(self, context: ValidationContext) -> None:
-        """Final aggregation of all results."""
-        # This is called after pipeline execution
-        # The actual aggregation is done in _aggregate_stage_results
-        pass
-    
     def _generate_cache_key(
         self,
         context: ValidationContext,
         pipeline: ValidationPipeline
     ) -> str:
-        """Generate cache key for validation results."""
-        # Create a deterministic key based on inputs
-        key_parts = [
-            "validation",
-            pipeline.name,
-            context.domain_type or "none",
-            str(hash(json.dumps(str(context.agent_output), sort_keys=True))),
-            str(hash(json.dumps(str(context.expected_output), sort_keys=True)))
-        ]
+        """
+        Generate cache key for validation results.
+        
+        Every key component is fed into one blake2b hasher; variable-length
+        text is NUL-terminated and the input fingerprints are fixed-size, so
+        distinct inputs cannot run together.
+        """
+        h = hashlib.blake2b(digest_size=20)
+        h.update(pipeline.name.encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+        h.update((context.domain_type or "none").encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+        h.update(_fingerprint(context.agent_output))
+        h.update(_fingerprint(context.expected_output))
         
         # Add relevant options to key
-        for opt in ["strict_mode", "include_suggestions"]:
+        for opt in _CACHE_KEY_OPTIONS:
             if opt in context.options:
-                key_parts.append(f"{opt}_{context.options[opt]}")
+                h.update(f"{opt}_{context.options[opt]}\0".encode("utf-8", "surrogatepass"))
         
-        return ":".join(key_parts)
+        return "validation:" + h.hexdigest()
     
     def get_pipeline_info(self, pipeline_name: Optional[str] = None) -> Dict[str, Any]:
-        """Get information about a pipeline."""
+        """
+        Get information about a pipeline.
+        
+        The description is built once per pipeline and each call gets its own
+        copy. Re-register a pipeline after changing it.
+        """
         pipeline = self._get_pipeline(pipeline_name)
         
-        return {
-            "pipeline_id": pipeline.pipeline_id,
-            "name": pipeline.name,
-            "stages": [s.value for s in pipeline.stages],
-            "parallel_stages": [s.value for s in pipeline.parallel_stages],
-            "cached_stages": [s.value for s in pipeline.cache_stages],
-            "stage_timeouts": {s.value: t for s, t in pipeline.stage_timeout.items()}
-        }
+        if pipeline._info is None:
+            pipeline._info = {
+                "pipeline_id": pipeline.pipeline_id,
+                "name": pipeline.name,
+                "stages": [s.value for s in pipeline.stages],
+                "parallel_stages": [s.value for s in pipeline.parallel_stages],
+                "cached_stages": [s.value for s in pipeline.cache_stages],
+                "stage_timeouts": {s.value: t for s, t in pipeline.stage_timeout.items()}
+            }
+        return copy.deepcopy(pipeline._info)
     
     def get_validation_status(self, request_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a running validation."""
@@ -699,15 +1251,15 @@ class ValidationOrchestrator:
         
         context = self._running_contexts[request_id]
         
-        # Calculate task statistics
-        task_stats = defaultdict(int)
+        # Calculate task statistics; every status is reported, zero if unused
+        task_stats = {status.value: 0 for status in ValidationStatus}
         for task in context.tasks.values():
             task_stats[task.status.value] += 1
         
         return {
             "request_id": request_id,
             "status": "running",
-            "task_statistics": dict(task_stats),
+            "task_statistics": task_stats,
             "results_count": len(context.results),
             "metrics_count": len(context.metrics)
         }
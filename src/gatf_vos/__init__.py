@@ -23,7 +23,8 @@ from .vos_primitives import (
     HandoffPrimitive,
     WorkflowPrimitive,
     CompliancePrimitive,
-    BenchmarkPrimitive
+    BenchmarkPrimitive,
+    Memoizable
 )
 
 # Core orchestrator
@@ -80,6 +81,7 @@ __all__ = [
     "WorkflowPrimitive",
     "CompliancePrimitive",
     "BenchmarkPrimitive",
+    "Memoizable",
     
     # Core components
     "VOSOrchestrator",
@@ -6,11 +6,15 @@ the overall validation, monitoring, and correction pipeline.
 """
 
 import asyncio
+import contextvars
 import logging
-from typing import Dict, Any, List, Optional, Set, Tuple
+from collections import deque
+from typing import Dict, Any, Callable, Deque, List, Optional, Set, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
+import time
 import uuid
 
 from ..vos_primitives import (
@@ -24,6 +28,50 @@ from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum number of compiled plan templates kept per orchestrator
+PLAN_TEMPLATE_CACHE_SIZE = 256
+
+# Maximum number of orchestration results kept in the execution history
+EXECUTION_HISTORY_SIZE = 10_000
+
+# Base delay before the first retry of a failed primitive; doubles per attempt
+RETRY_BACKOFF_SECONDS = 0.01
+
+# Per-primitive timeout of real-time plans, and of conditional steps in
+# adaptive plans, when the plan sets no timeout_ms
+REAL_TIME_TIMEOUT_MS = 100
+
+# Seconds to wait for runtime components to shut down
+SHUTDOWN_TIMEOUT_SECONDS = 30.0
+
+# Timestamps taken within this many seconds of each other are shared
+NOW_CACHE_RESOLUTION = 0.001
+
+_now_cache: Dict[str, Any] = {"ts": float("-inf"), "dt": None, "iso": None}
+
+# (orchestrator id, agent id) pairs whose validate_agent call is running in
+# the current context; tasks spawned by that validation inherit it
+_validating_agents: contextvars.ContextVar[frozenset] = contextvars.ContextVar(
+    "gatf_vos_validating_agents", default=frozenset()
+)
+
+
+def _cached_now() -> datetime:
+    """Return datetime.utcnow(), reusing the value within a 1ms window."""
+    t = time.monotonic()
+    if t - _now_cache["ts"] > NOW_CACHE_RESOLUTION:
+        _now_cache.update(ts=t, dt=datetime.utcnow(), iso=None)
+    return _now_cache["dt"]
+
+
+def _cached_now_iso() -> str:
+    """Return the ISO-8601 form of _cached_now(), formatted once per window."""
+    now = _cached_now()
+    iso = _now_cache["iso"]
+    if iso is None:
+        iso = _now_cache["iso"] = now.isoformat()
+    return iso
+
 
 class OrchestrationMode(Enum):
     """Orchestration execution modes."""
@@ -43,9 +91,17 @@ class OrchestrationPlan:
     timeout_ms: Optional[int] = None
     retry_policy: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    levels: List[List[VOSPrimitive]] = field(default_factory=list)
+    # Adaptive mode only runs a guarded primitive if its predicate, called
+    # with the results gathered so far, returns True; guarded primitives run
+    # under the plan's timeout_ms (REAL_TIME_TIMEOUT_MS if unset)
+    conditions: Dict[str, Callable[['OrchestrationResult'], bool]] = field(default_factory=dict)
+    _prim_by_name: Dict[str, VOSPrimitive] = field(default_factory=dict, init=False, repr=False)
+    # Set when plan_created was deferred into a single plan_lifecycle event
+    _created_at: Optional[datetime] = field(default=None, init=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestrationResult:
     """Result of orchestration execution."""
     plan_id: str
@@ -65,6 +121,57 @@ class OrchestrationResult:
         return None
 
 
+def _build_levels(primitives: List[VOSPrimitive],
+                  dependencies: Dict[str, List[str]]) -> List[List[VOSPrimitive]]:
+    """
+    Layer primitives into dependency levels using Kahn's algorithm.
+    
+    Every primitive in a level depends only on primitives in earlier levels,
+    so each level can be executed as one parallel batch.
+    
+    Args:
+        primitives: Primitives in the plan
+        dependencies: Mapping of primitive name to the names it depends on
+        
+    Returns:
+        List of levels, each a list of primitives in plan order
+        
+    Raises:
+        ValidationError: If the dependencies contain a cycle or reference
+            a primitive that is not part of the plan
+    """
+    order = {p.name: i for i, p in enumerate(primitives)}
+    dep_count: Dict[str, int] = {}
+    children: Dict[str, List[VOSPrimitive]] = {}
+    for prim in primitives:
+        deps = dependencies.get(prim.name, ())
+        # Dependencies outside the plan are never satisfied
+        dep_count[prim.name] = len(deps)
+        for dep in deps:
+            if dep in order:
+                children.setdefault(dep, []).append(prim)
+                
+    levels = []
+    placed = 0
+    current = [p for p in primitives if dep_count[p.name] == 0]
+    while current:
+        levels.append(current)
+        placed += len(current)
+        ready = []
+        for prim in current:
+            for child in children.get(prim.name, ()):
+                dep_count[child.name] -= 1
+                if dep_count[child.name] == 0:
+                    ready.append(child)
+        ready.sort(key=lambda p: order[p.name])
+        current = ready
+        
+    if placed < len(primitives):
+        raise ValidationError("Circular dependency detected in orchestration plan")
+        
+    return levels
+    
+
 class VOSOrchestrator:
     """
     VOS Trust Framework Orchestrator
@@ -80,7 +187,8 @@ class VOSOrchestrator:
         # Component registries
         self._primitives: Dict[str, VOSPrimitive] = {}
         self._active_plans: Dict[str, OrchestrationPlan] = {}
-        self._execution_history: List[OrchestrationResult] = []
+        self._execution_history: Deque[OrchestrationResult] = deque(maxlen=EXECUTION_HISTORY_SIZE)
+        self._plan_template_cache: Dict[Tuple, Tuple[List[VOSPrimitive], List[List[VOSPrimitive]], Dict[str, VOSPrimitive]]] = {}
         
         # Runtime components
         self._runtime_monitor = None
@@ -90,9 +198,16 @@ class VOSOrchestrator:
         self._hitl_gateway = None
         self._learning_system = None
         
+        # Per-agent validation locks with their holder-plus-waiter counts; an
+        # entry is removed when its last caller leaves
+        self._agent_locks: Dict[str, List[Any]] = {}
+        
         # Event handling
         self._event_handlers: Dict[str, List[Any]] = {}
+        self._sync_handlers: Dict[str, List[Any]] = {}
+        self._async_handlers: Dict[str, List[Any]] = {}
         self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._event_signal = asyncio.Event()
         
         # State management
         self._initialized = False
@@ -167,6 +282,8 @@ class VOSOrchestrator:
     def register_primitive(self, primitive: VOSPrimitive):
         """Register a VOS primitive."""
         self._primitives[primitive.name] = primitive
+        # Compiled templates hold primitive objects, so drop them on any change
+        self._plan_template_cache.clear()
         self.logger.debug(f"Registered primitive: {primitive.name} (type: {primitive.primitive_type})")
         
     def get_primitive(self, name: str) -> Optional[VOSPrimitive]:
@@ -177,25 +294,44 @@ class VOSOrchestrator:
                          primitives: List[str],
                          mode: OrchestrationMode = OrchestrationMode.ADAPTIVE,
                          dependencies: Optional[Dict[str, List[str]]] = None,
+                         emit_created: bool = True,
                          **kwargs) -> OrchestrationPlan:
-        """Create an orchestration plan."""
-        # Validate primitives exist
-        primitive_objects = []
-        for prim_name in primitives:
-            prim = self.get_primitive(prim_name)
-            if not prim:
-                raise ValidationError(f"Unknown primitive: {prim_name}")
-            primitive_objects.append(prim)
+        """
+        Create an orchestration plan.
+        
+        With emit_created=False no plan_created event is sent; execute_plan
+        then reports the whole run as one plan_lifecycle event instead of
+        plan_completed.
+        """
+        dependencies = dependencies or {}
+        key = (
+            tuple(primitives),
+            mode,
+            tuple(sorted((k, tuple(v)) for k, v in dependencies.items()))
+        )
+        template = self._plan_template_cache.get(key)
+        if template is None:
+            template = self._compile_plan_template(primitives, mode, dependencies)
+            if len(self._plan_template_cache) >= PLAN_TEMPLATE_CACHE_SIZE:
+                self._plan_template_cache.pop(next(iter(self._plan_template_cache)))
+            self._plan_template_cache[key] = template
+        primitive_objects, levels, prim_by_name = template
             
         plan = OrchestrationPlan(
             mode=mode,
-            primitives=primitive_objects,
-            dependencies=dependencies or {},
+            primitives=list(primitive_objects),
+            dependencies=dependencies,
+            levels=levels,
             **kwargs
         )
+        plan._prim_by_name = prim_by_name
         
         self._active_plans[plan.id] = plan
         
+        if not emit_created:
+            plan._created_at = _cached_now()
+            return plan
+            
         await self._emit_event('plan_created', {
             'plan_id': plan.id,
             'mode': mode.value,
@@ -204,6 +340,37 @@ class VOSOrchestrator:
         
         return plan
         
+    def _compile_plan_template(self,
+                               primitives: List[str],
+                               mode: OrchestrationMode,
+                               dependencies: Dict[str, List[str]]) -> Tuple[List[VOSPrimitive], List[List[VOSPrimitive]], Dict[str, VOSPrimitive]]:
+        """Resolve primitive names and precompute execution levels and the name index for a plan."""
+        # Validate primitives exist
+        primitive_objects = []
+        for prim_name in primitives:
+            prim = self.get_primitive(prim_name)
+            if not prim:
+                raise ValidationError(f"Unknown primitive: {prim_name}")
+            primitive_objects.append(prim)
+            
+        # Reject dangling dependency references before anything executes
+        prim_by_name = {p.name: p for p in primitive_objects}
+        for prim_name, deps in dependencies.items():
+            if prim_name not in prim_by_name:
+                raise ValidationError(f"Dependencies declared for primitive not in plan: {prim_name}")
+            for dep in deps:
+                if dep not in prim_by_name:
+                    raise ValidationError(f"Primitive {prim_name} depends on {dep}, which is not in the plan")
+                    
+        levels = _build_levels(primitive_objects, dependencies)
+        if mode is OrchestrationMode.REAL_TIME and len(levels) > 1:
+            self.logger.warning(
+                f"Real-time plans run all primitives in one parallel batch; "
+                f"{len(levels)}-level dependency chain will not be enforced"
+            )
+            
+        return primitive_objects, levels, prim_by_name
+        
     async def execute_plan(self, plan: OrchestrationPlan, context: PrimitiveContext) -> OrchestrationResult:
         """Execute an orchestration plan."""
         self.logger.info(f"Executing orchestration plan: {plan.id} (mode: {plan.mode})")
@@ -214,13 +381,13 @@ class VOSOrchestrator:
         )
         
         try:
-            if plan.mode == OrchestrationMode.SEQUENTIAL:
+            if plan.mode is OrchestrationMode.SEQUENTIAL:
                 await self._execute_sequential(plan, context, result)
-            elif plan.mode == OrchestrationMode.PARALLEL:
+            elif plan.mode is OrchestrationMode.PARALLEL:
                 await self._execute_parallel(plan, context, result)
-            elif plan.mode == OrchestrationMode.ADAPTIVE:
+            elif plan.mode is OrchestrationMode.ADAPTIVE:
                 await self._execute_adaptive(plan, context, result)
-            elif plan.mode == OrchestrationMode.REAL_TIME:
+            elif plan.mode is OrchestrationMode.REAL_TIME:
                 await self._execute_real_time(plan, context, result)
                 
             result.status = PrimitiveStatus.COMPLETED
@@ -237,11 +404,22 @@ class VOSOrchestrator:
             if plan.id in self._active_plans:
                 del self._active_plans[plan.id]
                 
-            await self._emit_event('plan_completed', {
-                'plan_id': plan.id,
-                'status': result.status.value,
-                'duration_ms': result.duration_ms
-            })
+            if plan._created_at is not None:
+                await self._emit_event('plan_lifecycle', {
+                    'plan_id': plan.id,
+                    'mode': plan.mode.value,
+                    'primitive_count': len(plan.primitives),
+                    'created_at': plan._created_at,
+                    'completed_at': result.end_time,
+                    'status': result.status.value,
+                    'duration_ms': result.duration_ms
+                })
+            else:
+                await self._emit_event('plan_completed', {
+                    'plan_id': plan.id,
+                    'status': result.status.value,
+                    'duration_ms': result.duration_ms
+                })
             
         return result
         
@@ -251,104 +429,156 @@ class VOSOrchestrator:
             prim_result = await primitive.execute(context)
             result.primitive_results[primitive.name] = prim_result
             
-            if prim_result.status == PrimitiveStatus.FAILED:
+            if prim_result.status is PrimitiveStatus.FAILED:
                 raise ValidationError(f"Primitive {primitive.name} failed: {prim_result.errors}")
                 
     async def _execute_parallel(self, plan: OrchestrationPlan, context: PrimitiveContext, result: OrchestrationResult):
         """Execute primitives in parallel."""
-        tasks = []
-        for primitive in plan.primitives:
-            task = asyncio.create_task(primitive.execute(context))
-            tasks.append((primitive.name, task))
-            
-        for prim_name, task in tasks:
-            prim_result = await task
-            result.primitive_results[prim_name] = prim_result
+        prim_results = await asyncio.gather(*(p.execute(context) for p in plan.primitives))
+        result.primitive_results.update(zip([p.name for p in plan.primitives], prim_results))
             
     async def _execute_adaptive(self, plan: OrchestrationPlan, context: PrimitiveContext, result: OrchestrationResult):
         """Execute primitives adaptively based on results and dependencies."""
-        executed = set()
-        pending = set(p.name for p in plan.primitives)
-        
-        while pending:
-            # Find primitives that can be executed
-            ready = []
-            for prim in plan.primitives:
-                if prim.name in pending:
-                    deps = plan.dependencies.get(prim.name, [])
-                    if all(d in executed for d in deps):
-                        ready.append(prim)
-                        
-            if not ready:
-                raise ValidationError("Circular dependency detected in orchestration plan")
-                
-            # Execute ready primitives in parallel
-            tasks = [(p.name, asyncio.create_task(p.execute(context))) for p in ready]
+        if not plan.levels and plan.primitives:
+            plan.levels = _build_levels(plan.primitives, plan.dependencies)
             
-            for prim_name, task in tasks:
-                prim_result = await task
-                result.primitive_results[prim_name] = prim_result
-                executed.add(prim_name)
-                pending.remove(prim_name)
+        conditions = plan.conditions
+        timeout_ms = plan.timeout_ms or REAL_TIME_TIMEOUT_MS
+        for level in plan.levels:
+            if conditions:
+                level = [p for p in level if p.name not in conditions or conditions[p.name](result)]
                 
-                # Adapt based on results
-                if prim_result.status == PrimitiveStatus.FAILED and plan.retry_policy.get('enabled', False):
-                    # Implement retry logic
-                    retry_count = plan.retry_policy.get('max_retries', 3)
-                    for i in range(retry_count):
-                        self.logger.info(f"Retrying primitive {prim_name} (attempt {i+1}/{retry_count})")
-                        retry_result = await self.get_primitive(prim_name).execute(context)
-                        if retry_result.status == PrimitiveStatus.COMPLETED:
-                            result.primitive_results[prim_name] = retry_result
-                            break
-                            
+            # Each level only depends on earlier ones, so run it as one batch
+            level_results = await asyncio.gather(*(
+                self._execute_with_timeout(p, context, timeout_ms) if p.name in conditions else p.execute(context)
+                for p in level
+            ))
+            
+            result.primitive_results.update(zip([p.name for p in level], level_results))
+            failed = [p for p, r in zip(level, level_results) if r.status is PrimitiveStatus.FAILED]
+                    
+            # Adapt based on results: retry this level's failures concurrently
+            if failed and plan.retry_policy.get('enabled', False):
+                retry_results = await asyncio.gather(
+                    *(self._retry_primitive(p, context, plan.retry_policy) for p in failed)
+                )
+                for primitive, retry_result in zip(failed, retry_results):
+                    if retry_result is not None:
+                        result.primitive_results[primitive.name] = retry_result
+                        
+    async def _retry_primitive(self,
+                               primitive: VOSPrimitive,
+                               context: PrimitiveContext,
+                               retry_policy: Dict[str, Any]) -> Optional[PrimitiveResult]:
+        """
+        Retry a failed primitive with exponential backoff.
+        
+        Args:
+            primitive: Primitive to retry
+            context: Execution context
+            retry_policy: Plan retry policy (max_retries, backoff_seconds)
+            
+        Returns:
+            The first completed result, or None if every attempt failed
+        """
+        retry_count = retry_policy.get('max_retries', 3)
+        backoff = retry_policy.get('backoff_seconds', RETRY_BACKOFF_SECONDS)
+        for i in range(retry_count):
+            await asyncio.sleep(backoff * (2 ** i))
+            self.logger.info(f"Retrying primitive {primitive.name} (attempt {i+1}/{retry_count})")
+            retry_result = await primitive.execute(context)
+            if retry_result.status is PrimitiveStatus.COMPLETED:
+                return retry_result
+        return None
+        
     async def _execute_real_time(self, plan: OrchestrationPlan, context: PrimitiveContext, result: OrchestrationResult):
         """Execute primitives in real-time mode with streaming."""
         # Real-time execution with sub-100ms latency targets
-        timeout = plan.timeout_ms or 100  # Default 100ms timeout
+        timeout_ms = plan.timeout_ms or REAL_TIME_TIMEOUT_MS
+        prim_results = await asyncio.gather(
+            *(self._execute_with_timeout(p, context, timeout_ms) for p in plan.primitives)
+        )
+        result.primitive_results.update(zip([p.name for p in plan.primitives], prim_results))
         
-        async def execute_with_timeout(primitive: VOSPrimitive):
-            try:
-                return await asyncio.wait_for(
-                    primitive.execute(context),
-                    timeout=timeout/1000.0
-                )
-            except asyncio.TimeoutError:
-                return PrimitiveResult(
-                    status=PrimitiveStatus.FAILED,
-                    data=None,
-                    errors=[f"Timeout after {timeout}ms"]
-                )
-                
-        tasks = []
-        for primitive in plan.primitives:
-            task = asyncio.create_task(execute_with_timeout(primitive))
-            tasks.append((primitive.name, task))
-            
-        for prim_name, task in tasks:
-            result.primitive_results[prim_name] = await task
+    async def _execute_with_timeout(self,
+                                    primitive: VOSPrimitive,
+                                    context: PrimitiveContext,
+                                    timeout_ms: int) -> PrimitiveResult:
+        """Execute a primitive, turning a timeout into a FAILED result."""
+        try:
+            return await asyncio.wait_for(
+                primitive.execute(context),
+                timeout=timeout_ms/1000.0
+            )
+        except asyncio.TimeoutError:
+            return PrimitiveResult(
+                status=PrimitiveStatus.FAILED,
+                data=None,
+                errors=[f"Timeout after {timeout_ms}ms"]
+            )
             
     async def validate_agent(self, agent_id: str, validation_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Comprehensive agent validation using VOS pipeline."""
+        """
+        Comprehensive agent validation using VOS pipeline.
+        
+        Validations for the same agent run one at a time, in the order they
+        were requested (asyncio.Lock wakes waiters first in, first out), while
+        validations for different agents run concurrently. Each validation runs
+        in the caller's task, so the caller's contextvars apply. A validation
+        requested from inside a running validation of the same agent, e.g. by
+        a primitive or event handler, runs immediately instead of queueing
+        behind the validation that is waiting for it.
+        """
+        key = (id(self), agent_id)
+        if key in _validating_agents.get():
+            return await self._run_agent_validation(agent_id, validation_data)
+            
+        entry = self._agent_locks.get(agent_id)
+        if entry is None:
+            entry = self._agent_locks[agent_id] = [asyncio.Lock(), 0]
+        lock = entry[0]
+        entry[1] += 1
+        try:
+            async with lock:
+                token = _validating_agents.set(_validating_agents.get() | {key})
+                try:
+                    return await self._run_agent_validation(agent_id, validation_data)
+                finally:
+                    _validating_agents.reset(token)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._agent_locks[agent_id]
+                
+    async def _run_agent_validation(self, agent_id: str, validation_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build and execute the validation plan for a single agent."""
         context = PrimitiveContext(
             agent_id=agent_id,
             metadata=validation_data
         )
         
+        detection_primitives = ['hallucination_detection', 'intent_drift_detection', 'memory_drift_detection']
+        primitives = detection_primitives + ['uncertainty_quantification', 'trust_calculation']
+        dependencies = {
+            'trust_calculation': detection_primitives,
+            'uncertainty_quantification': ['hallucination_detection']
+        }
+        conditions = {}
+        
+        # Corrections run in the same plan, after detection and only if issues
+        # were found, under the real-time timeout they had as a separate plan
+        if 'correction_engine' in self._primitives:
+            primitives.append('correction_engine')
+            dependencies['correction_engine'] = detection_primitives
+            conditions['correction_engine'] = self._has_detected_issues
+            
         # Create adaptive validation plan
         plan = await self.create_plan(
-            primitives=[
-                'hallucination_detection',
-                'intent_drift_detection',
-                'memory_drift_detection',
-                'uncertainty_quantification',
-                'trust_calculation'
-            ],
+            primitives=primitives,
             mode=OrchestrationMode.ADAPTIVE,
-            dependencies={
-                'trust_calculation': ['hallucination_detection', 'intent_drift_detection', 'memory_drift_detection'],
-                'uncertainty_quantification': ['hallucination_detection']
-            }
+            dependencies=dependencies,
+            emit_created=False,
+            conditions=conditions
         )
         
         # Execute validation
@@ -362,30 +592,37 @@ class VOSOrchestrator:
             'detections': {},
             'corrections': {},
             'uncertainties': {},
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _cached_now_iso()
         }
         
-        # Extract results from primitives
+        # Extract results from primitives, routed by primitive type
+        prim_by_name = plan._prim_by_name
+        detections = validation_result['detections']
         for prim_name, prim_result in result.primitive_results.items():
-            if prim_result.status == PrimitiveStatus.COMPLETED:
-                if 'detection' in prim_name:
-                    validation_result['detections'][prim_name] = prim_result.data
-                elif 'trust' in prim_name:
+            if prim_result.status is PrimitiveStatus.COMPLETED:
+                prim_type = prim_by_name[prim_name].primitive_type
+                if prim_type is PrimitiveType.DETECTION:
+                    detections[prim_name] = prim_result.data
+                elif prim_type is PrimitiveType.TRUST:
                     validation_result['trust_score'] = prim_result.data.get('trust_score')
-                elif 'uncertainty' in prim_name:
+                elif prim_type is PrimitiveType.UNCERTAINTY:
                     validation_result['uncertainties'] = prim_result.data
                     
-        # Apply corrections if needed
-        if any(d.get('issues_found', False) for d in validation_result['detections'].values()):
-            correction_plan = await self.create_plan(
-                primitives=['correction_engine'],
-                mode=OrchestrationMode.REAL_TIME
-            )
-            correction_result = await self.execute_plan(correction_plan, context)
-            validation_result['corrections'] = correction_result.primitive_results.get('correction_engine', {}).data
+        correction = result.primitive_results.get('correction_engine')
+        if correction is not None:
+            validation_result['corrections'] = correction.data
             
         return validation_result
         
+    def _has_detected_issues(self, result: OrchestrationResult) -> bool:
+        """Check whether any completed detection primitive reported issues."""
+        return any(
+            prim_result.data.get('issues_found', False)
+            for prim_name, prim_result in result.primitive_results.items()
+            if prim_result.status is PrimitiveStatus.COMPLETED
+            and self._primitives[prim_name].primitive_type is PrimitiveType.DETECTION
+        )
+        
     async def monitor_multi_agent_system(self, agent_ids: List[str], monitoring_config: Dict[str, Any]) -> Dict[str, Any]:
         """Monitor a multi-agent system."""
         context = PrimitiveContext(
@@ -403,7 +640,8 @@ class VOSOrchestrator:
                 'handoff_validator',
                 'goal_alignment_validator'
             ],
-            mode=OrchestrationMode.PARALLEL
+            mode=OrchestrationMode.PARALLEL,
+            emit_created=False
         )
         
         # Execute monitoring
@@ -414,67 +652,94 @@ class VOSOrchestrator:
             'agent_count': len(agent_ids),
             'monitoring_results': {
                 name: res.data for name, res in result.primitive_results.items()
-                if res.status == PrimitiveStatus.COMPLETED
+                if res.status is PrimitiveStatus.COMPLETED
             },
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _cached_now_iso()
         }
         
     def register_event_handler(self, event_type: str, handler: Any):
         """Register an event handler."""
-        if event_type not in self._event_handlers:
-            self._event_handlers[event_type] = []
-        self._event_handlers[event_type].append(handler)
+        self._event_handlers.setdefault(event_type, []).append(handler)
+        
+        # Classify once here so dispatch needs no per-event introspection
+        if asyncio.iscoroutinefunction(handler):
+            self._async_handlers.setdefault(event_type, []).append(handler)
+        else:
+            self._sync_handlers.setdefault(event_type, []).append(handler)
         
     async def _emit_event(self, event_type: str, data: Dict[str, Any]):
         """Emit an event to registered handlers."""
-        await self._event_queue.put({
+        if not self._event_handlers.get(event_type):
+            return
+            
+        # The queue is unbounded, so enqueueing never needs to suspend
+        self._event_queue.put_nowait({
             'type': event_type,
             'data': data,
-            'timestamp': datetime.utcnow()
+            'timestamp': _cached_now()
         })
+        self._event_signal.set()
         
     async def _process_events(self):
         """Process events from the queue."""
         while self._running:
             try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
-                
-                handlers = self._event_handlers.get(event['type'], [])
-                for handler in handlers:
-                    try:
-                        if asyncio.iscoroutinefunction(handler):
-                            await handler(event)
-                        else:
-                            handler(event)
-                    except Exception as e:
-                        self.logger.error(f"Error in event handler: {e}")
-                        
-            except asyncio.TimeoutError:
+                event = self._event_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                # Sleep until the next emit (or shutdown) instead of polling
+                self._event_signal.clear()
+                await self._event_signal.wait()
                 continue
                 
+            # Drain everything queued so far and dispatch it in one pass
+            batch = [event]
+            while True:
+                try:
+                    batch.append(self._event_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+                    
+            loop = asyncio.get_running_loop()
+            for event in batch:
+                event_type = event['type']
+                # Sync handlers go to the default executor so slow ones cannot
+                # stall the loop; run_in_executor skips to_thread's context copy
+                pending = [
+                    loop.run_in_executor(None, handler, event)
+                    for handler in self._sync_handlers.get(event_type, ())
+                ]
+                pending.extend(handler(event) for handler in self._async_handlers.get(event_type, ()))
+                if not pending:
+                    continue
+                    
+                outcomes = await asyncio.gather(*pending, return_exceptions=True)
+                for outcome in outcomes:
+                    if isinstance(outcome, Exception):
+                        self.logger.error(f"Error in event handler: {outcome}")
+                        
     async def shutdown(self):
         """Shutdown the VOS orchestrator."""
         self.logger.info("Shutting down VOS Orchestrator")
         
         self._running = False
+        self._event_signal.set()
         
         # Shutdown all components
-        shutdown_tasks = []
-        
-        if self._runtime_monitor:
-            shutdown_tasks.append(self._runtime_monitor.shutdown())
-        if self._correction_engine:
-            shutdown_tasks.append(self._correction_engine.shutdown())
-        if self._uncertainty_quantifier:
-            shutdown_tasks.append(self._uncertainty_quantifier.shutdown())
-        if self._multi_agent_coordinator:
-            shutdown_tasks.append(self._multi_agent_coordinator.shutdown())
-        if self._hitl_gateway:
-            shutdown_tasks.append(self._hitl_gateway.shutdown())
-        if self._learning_system:
-            shutdown_tasks.append(self._learning_system.shutdown())
-            
-        await asyncio.gather(*shutdown_tasks, return_exceptions=True)
+        components = (
+            self._runtime_monitor,
+            self._correction_engine,
+            self._uncertainty_quantifier,
+            self._multi_agent_coordinator,
+            self._hitl_gateway,
+            self._learning_system
+        )
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(c.shutdown() for c in components if c is not None), return_exceptions=True),
+                timeout=SHUTDOWN_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Component shutdown did not finish within {SHUTDOWN_TIMEOUT_SECONDS}s")
         
         self._initialized = False
         self.logger.info("VOS Orchestrator shutdown complete")
@@ -499,7 +764,9 @@ class VOSOrchestrator:
         
     def _get_recent_executions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent execution summaries."""
-        recent = self._execution_history[-limit:]
+        # Walk from the newest end so only `limit` entries are touched
+        recent = list(islice(reversed(self._execution_history), limit))
+        recent.reverse()
         return [
             {
                 'plan_id': r.plan_id,
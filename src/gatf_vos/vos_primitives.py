@@ -1,494 +1,813 @@
-"""
-VOS Core API Primitives
-
-This module defines the fundamental building blocks of the VOS system.
-Each primitive represents a core capability that can be composed to create
-complex validation and monitoring workflows.
-"""
-
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Callable, Tuple
-from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
-import asyncio
-import uuid
-
-
-class PrimitiveType(Enum):
-    """Types of VOS primitives."""
-    DETECTION = "detection"
-    CORRECTION = "correction"
-    UNCERTAINTY = "uncertainty"
-    COORDINATION = "coordination"
-    TRUST = "trust"
-    MEMORY = "memory"
-    HANDOFF = "handoff"
-    WORKFLOW = "workflow"
-    COMPLIANCE = "compliance"
-    BENCHMARK = "benchmark"
-
-
-class PrimitiveStatus(Enum):
-    """Status of primitive execution."""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
-
-
-@dataclass
-class PrimitiveContext:
-    """Context for primitive execution."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    agent_id: Optional[str] = None
-    domain: Optional[str] = None
-    session_id: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    parent_context: Optional['PrimitiveContext'] = None
-    
-    def child_context(self) -> 'PrimitiveContext':
-        """Create a child context."""
-        return PrimitiveContext(
-            agent_id=self.agent_id,
-            domain=self.domain,
-            session_id=self.session_id,
-            metadata=self.metadata.copy(),
-            parent_context=self
-        )
-
-
-@dataclass
-class PrimitiveResult:
-    """Result from primitive execution."""
-    status: PrimitiveStatus
-    data: Any
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
-    metrics: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    duration_ms: Optional[float] = None
-
-
-class VOSPrimitive(ABC):
-    """
-    Base class for all VOS primitives.
-    
-    Primitives are the atomic units of functionality in VOS.
-    They can be composed and orchestrated to create complex behaviors.
-    """
-    
-    def __init__(self, name: str, primitive_type: PrimitiveType):
-        self.name = name
-        self.primitive_type = primitive_type
-        self._callbacks: Dict[str, List[Callable]] = {}
-        
-    @abstractmethod
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute the primitive."""
-        pass
-    
-    def register_callback(self, event: str, callback: Callable):
-        """Register a callback for an event."""
-        if event not in self._callbacks:
-            self._callbacks[event] = []
-        self._callbacks[event].append(callback)
-        
-    async def _trigger_callbacks(self, event: str, data: Any):
-        """Trigger registered callbacks for an event."""
-        if event in self._callbacks:
-            for callback in self._callbacks[event]:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(data)
-                else:
-                    callback(data)
-                    
-    def compose(self, other: 'VOSPrimitive') -> 'ComposedPrimitive':
-        """Compose this primitive with another."""
-        return ComposedPrimitive([self, other])
-
-
-class ComposedPrimitive(VOSPrimitive):
-    """A primitive composed of multiple primitives."""
-    
-    def __init__(self, primitives: List[VOSPrimitive]):
-        super().__init__(
-            name=f"Composed({', '.join(p.name for p in primitives)})",
-            primitive_type=PrimitiveType.WORKFLOW
-        )
-        self.primitives = primitives
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute all composed primitives in sequence."""
-        results = []
-        combined_metrics = {}
-        all_errors = []
-        all_warnings = []
-        
-        for primitive in self.primitives:
-            result = await primitive.execute(context, **kwargs)
-            results.append(result)
-            combined_metrics.update(result.metrics)
-            all_errors.extend(result.errors)
-            all_warnings.extend(result.warnings)
-            
-            if result.status == PrimitiveStatus.FAILED:
-                return PrimitiveResult(
-                    status=PrimitiveStatus.FAILED,
-                    data=results,
-                    errors=all_errors,
-                    warnings=all_warnings,
-                    metrics=combined_metrics
-                )
-                
-        return PrimitiveResult(
-            status=PrimitiveStatus.COMPLETED,
-            data=results,
-            errors=all_errors,
-            warnings=all_warnings,
-            metrics=combined_metrics
-        )
-
-
-class DetectionPrimitive(VOSPrimitive):
-    """Base class for detection primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.DETECTION)
-        
-    @abstractmethod
-    async def detect(self, input_data: Any, context: PrimitiveContext) -> Dict[str, Any]:
-        """Perform detection on input data."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute detection primitive."""
-        try:
-            start_time = datetime.utcnow()
-            detection_result = await self.detect(kwargs.get('input_data'), context)
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            
-            await self._trigger_callbacks('detection_complete', detection_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=detection_result,
-                duration_ms=duration_ms,
-                metrics={'detection_latency_ms': duration_ms}
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class CorrectionPrimitive(VOSPrimitive):
-    """Base class for correction primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.CORRECTION)
-        
-    @abstractmethod
-    async def correct(self, detection_result: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
-        """Perform correction based on detection result."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute correction primitive."""
-        try:
-            start_time = datetime.utcnow()
-            correction_result = await self.correct(kwargs.get('detection_result'), context)
-            duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            
-            await self._trigger_callbacks('correction_complete', correction_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=correction_result,
-                duration_ms=duration_ms,
-                metrics={'correction_latency_ms': duration_ms}
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class UncertaintyPrimitive(VOSPrimitive):
-    """Base class for uncertainty quantification primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.UNCERTAINTY)
-        
-    @abstractmethod
-    async def quantify(self, input_data: Any, context: PrimitiveContext) -> Dict[str, float]:
-        """Quantify uncertainty in input data."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute uncertainty primitive."""
-        try:
-            uncertainty_scores = await self.quantify(kwargs.get('input_data'), context)
-            
-            await self._trigger_callbacks('uncertainty_quantified', uncertainty_scores)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=uncertainty_scores,
-                metrics={'uncertainty_dimensions': len(uncertainty_scores)}
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class CoordinationPrimitive(VOSPrimitive):
-    """Base class for multi-agent coordination primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.COORDINATION)
-        
-    @abstractmethod
-    async def coordinate(self, agents: List[str], task: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
-        """Coordinate multiple agents for a task."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute coordination primitive."""
-        try:
-            coordination_result = await self.coordinate(
-                kwargs.get('agents', []),
-                kwargs.get('task', {}),
-                context
-            )
-            
-            await self._trigger_callbacks('coordination_complete', coordination_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=coordination_result,
-                metrics={'coordinated_agents': len(kwargs.get('agents', []))}
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class TrustPrimitive(VOSPrimitive):
-    """Base class for trust scoring primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.TRUST)
-        
-    @abstractmethod
-    async def calculate_trust(self, agent_id: str, validation_results: Dict[str, Any], context: PrimitiveContext) -> float:
-        """Calculate trust score for an agent."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute trust primitive."""
-        try:
-            trust_score = await self.calculate_trust(
-                kwargs.get('agent_id'),
-                kwargs.get('validation_results', {}),
-                context
-            )
-            
-            await self._trigger_callbacks('trust_calculated', {
-                'agent_id': kwargs.get('agent_id'),
-                'trust_score': trust_score
-            })
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data={'trust_score': trust_score},
-                metrics={'trust_score': trust_score}
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class MemoryPrimitive(VOSPrimitive):
-    """Base class for memory management primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.MEMORY)
-        
-    @abstractmethod
-    async def manage_memory(self, operation: str, data: Any, context: PrimitiveContext) -> Dict[str, Any]:
-        """Perform memory management operation."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute memory primitive."""
-        try:
-            memory_result = await self.manage_memory(
-                kwargs.get('operation', 'read'),
-                kwargs.get('data'),
-                context
-            )
-            
-            await self._trigger_callbacks('memory_operation_complete', memory_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=memory_result
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class HandoffPrimitive(VOSPrimitive):
-    """Base class for agent handoff primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.HANDOFF)
-        
-    @abstractmethod
-    async def validate_handoff(self, from_agent: str, to_agent: str, context_data: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
-        """Validate agent handoff."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute handoff primitive."""
-        try:
-            handoff_result = await self.validate_handoff(
-                kwargs.get('from_agent'),
-                kwargs.get('to_agent'),
-                kwargs.get('context_data', {}),
-                context
-            )
-            
-            await self._trigger_callbacks('handoff_validated', handoff_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=handoff_result
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class WorkflowPrimitive(VOSPrimitive):
-    """Base class for workflow validation primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.WORKFLOW)
-        
-    @abstractmethod
-    async def validate_workflow(self, workflow_definition: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
-        """Validate workflow definition and execution."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute workflow primitive."""
-        try:
-            workflow_result = await self.validate_workflow(
-                kwargs.get('workflow_definition', {}),
-                context
-            )
-            
-            await self._trigger_callbacks('workflow_validated', workflow_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=workflow_result
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class CompliancePrimitive(VOSPrimitive):
-    """Base class for compliance validation primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.COMPLIANCE)
-        
-    @abstractmethod
-    async def validate_compliance(self, data: Any, regulations: List[str], context: PrimitiveContext) -> Dict[str, Any]:
-        """Validate compliance with regulations."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute compliance primitive."""
-        try:
-            compliance_result = await self.validate_compliance(
-                kwargs.get('data'),
-                kwargs.get('regulations', []),
-                context
-            )
-            
-            await self._trigger_callbacks('compliance_validated', compliance_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=compliance_result
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
-
-
-class BenchmarkPrimitive(VOSPrimitive):
-    """Base class for benchmarking primitives."""
-    
-    def __init__(self, name: str):
-        super().__init__(name, PrimitiveType.BENCHMARK)
-        
-    @abstractmethod
-    async def run_benchmark(self, test_suite: str, target: Any, context: PrimitiveContext) -> Dict[str, Any]:
-        """Run benchmark test suite."""
-        pass
-        
-    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
-        """Execute benchmark primitive."""
-        try:
-            benchmark_result = await self.run_benchmark(
-                kwargs.get('test_suite'),
-                kwargs.get('target'),
-                context
-            )
-            
-            await self._trigger_callbacks('benchmark_complete', benchmark_result)
-            
-            return PrimitiveResult(
-                status=PrimitiveStatus.COMPLETED,
-                data=benchmark_result
-            )
-        except Exception as e:
-            return PrimitiveResult(
-                status=PrimitiveStatus.FAILED,
-                data=None,
-                errors=[str(e)]
-            )
\ No newline at end of file
+"""
+VOS Core API Primitives
+
+This module defines the fundamental building blocks of the VOS system.
+Each primitive represents a core capability that can be composed to create
+complex validation and monitoring workflows.
+"""
+
+from abc import ABC, abstractmethod
+from collections import ChainMap, OrderedDict
+from functools import wraps
+from typing import Dict, Any, Awaitable, List, Optional, Sequence, Union, Callable, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from time import perf_counter_ns
+import asyncio
+import hashlib
+import itertools
+import os
+import pickle
+import uuid
+import warnings
+
+# Rules for prange loops in vos_njit(parallel=True) kernels:
+# - only counted loops, ``for i in prange(n)``; no while loops or early break
+# - each iteration writes its own output slots (out[i] = ...), never a slot
+#   another iteration reads or writes
+# - scalar reductions (total += x[i]) are fine, Numba privatizes them
+# - without Numba, prange is plain range and the loop runs serially
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional accelerator
+    njit = None
+    prange = range
+
+# uvloop speeds up every await in primitive pipelines, but installing an event
+# loop policy is process-wide, so it is only done when explicitly requested
+if os.getenv("GATF_VOS_USE_UVLOOP", "") == "1":
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional accelerator
+        uvloop = None
+    else:
+        uvloop.install()
+
+
+class PrimitiveType(Enum):
+    """Types of VOS primitives."""
+    DETECTION = "detection"
+    CORRECTION = "correction"
+    UNCERTAINTY = "uncertainty"
+    COORDINATION = "coordination"
+    TRUST = "trust"
+    MEMORY = "memory"
+    HANDOFF = "handoff"
+    WORKFLOW = "workflow"
+    COMPLIANCE = "compliance"
+    BENCHMARK = "benchmark"
+
+
+# Context ids are a per-process random prefix plus a counter, which is unique
+# without a urandom read per context; GATF_VOS_ID_MODE=uuid restores uuid4 ids
+_CONTEXT_ID_PREFIX = uuid.uuid4().hex[:12]
+_context_ids = itertools.count()
+
+
+def _new_context_id() -> str:
+    """Return a fresh, process-unique context id."""
+    return f"{_CONTEXT_ID_PREFIX}-{next(_context_ids)}"
+
+
+def _new_uuid_context_id() -> str:
+    """Return a fresh uuid4 context id."""
+    return str(uuid.uuid4())
+
+
+_context_id_factory = (
+    _new_uuid_context_id if os.getenv("GATF_VOS_ID_MODE", "").lower() == "uuid" else _new_context_id
+)
+
+
+# Kernels decorated with vos_njit(warmup_args=...), compiled by VOSPrimitive.warmup()
+_jit_warmups: List[Tuple[Callable, Tuple]] = []
+_jit_fallback_warned = False
+
+
+def vos_njit(func: Optional[Callable] = None, *, parallel: bool = False, warmup_args: Optional[Tuple] = None):
+    """
+    JIT-compile a numeric kernel with Numba, falling back to plain Python.
+    
+    Meant for the float/array inner loops of calculate_trust, quantify and
+    similar primitive methods, not for the async methods themselves. Kernels
+    are compiled with ``njit(parallel=..., cache=True, nogil=True)``. With
+    parallel=True, loops written with ``prange`` (exported from this module)
+    run in parallel, following the prange rules at the top of this module.
+    
+    Kernels Numba cannot cache on disk (defined in a REPL, notebook or
+    exec'd code) are compiled without caching. Without Numba the kernel is
+    returned unchanged and a warning is emitted once per process.
+    
+    Args:
+        func: Kernel to compile (when used as a bare decorator)
+        parallel: Enable Numba's parallel transforms (for kernels using prange)
+        warmup_args: Sample arguments used by VOSPrimitive.warmup() to compile
+            the kernel ahead of the first real call
+    """
+    def decorator(kernel: Callable) -> Callable:
+        global _jit_fallback_warned
+        if njit is None:
+            if not _jit_fallback_warned:
+                _jit_fallback_warned = True
+                warnings.warn("numba is not installed; vos_njit kernels run as plain Python", RuntimeWarning, stacklevel=3)
+            compiled = kernel
+        else:
+            try:
+                compiled = njit(parallel=parallel, cache=True, nogil=True)(kernel)
+            except RuntimeError:
+                # "cannot cache function ...: no locator available"
+                compiled = njit(parallel=parallel, cache=False, nogil=True)(kernel)
+        if warmup_args is not None:
+            _jit_warmups.append((compiled, warmup_args))
+        return compiled
+        
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+# Longest ChainMap a child context's metadata may inherit before it is flattened
+_MAX_METADATA_CHAIN = 8
+
+
+class PrimitiveStatus(Enum):
+    """Status of primitive execution."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass(slots=True)
+class PrimitiveContext:
+    """Context for primitive execution."""
+    id: str = field(default_factory=_context_id_factory)
+    agent_id: Optional[str] = None
+    domain: Optional[str] = None
+    session_id: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    parent_context: Optional['PrimitiveContext'] = None
+    
+    def child_context(self) -> 'PrimitiveContext':
+        """
+        Create a child context.
+        
+        When the parent has metadata, the child's metadata is a copy-on-write
+        ChainMap view of it: writes land in the child only, reads fall through
+        to the parent, and inherited keys cannot be deleted from the child.
+        Use _materialize_metadata() wherever the metadata is persisted or
+        serialised.
+        """
+        if not self.metadata:
+            metadata = {}
+        elif isinstance(self.metadata, ChainMap) and len(self.metadata.maps) >= _MAX_METADATA_CHAIN:
+            # Flatten deep compositions so lookups stay bounded
+            metadata = ChainMap({}, self._materialize_metadata())
+        else:
+            metadata = ChainMap({}, self.metadata)
+        return PrimitiveContext(
+            agent_id=self.agent_id,
+            domain=self.domain,
+            session_id=self.session_id,
+            metadata=metadata,
+            parent_context=self
+        )
+        
+    def _materialize_metadata(self) -> Dict[str, Any]:
+        """Return the metadata as a plain dict, flattening a copy-on-write view."""
+        if isinstance(self.metadata, ChainMap):
+            return dict(self.metadata)
+        return self.metadata
+
+
+@dataclass(slots=True)
+class PrimitiveResult:
+    """Result from primitive execution."""
+    status: PrimitiveStatus
+    data: Any
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    duration_ms: Optional[float] = None
+
+
+def _primitive_execute(event: str,
+                       latency_metric: Optional[str] = None,
+                       callback_payload: Optional[Callable[[Any, Dict[str, Any]], Any]] = None):
+    """
+    Decorate a primitive's execute body with the shared result handling.
+    
+    The decorated coroutine returns ``(data, metrics)``. The wrapper fires the
+    ``event`` callbacks, builds the COMPLETED result and turns any exception
+    into a FAILED result.
+    
+    Args:
+        event: Callback event triggered with the data on success
+        latency_metric: If set, time the body and report it under this metric
+        callback_payload: Builds the callback payload from (data, kwargs)
+            instead of passing the data itself
+    """
+    def decorator(body):
+        @wraps(body, assigned=('__module__', '__name__', '__qualname__', '__doc__'))
+        async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
+            try:
+                if latency_metric is None:
+                    data, metrics = await body(self, context, **kwargs)
+                    duration_ms = None
+                else:
+                    start_ns = perf_counter_ns()
+                    data, metrics = await body(self, context, **kwargs)
+                    duration_ms = (perf_counter_ns() - start_ns) / 1e6
+                    metrics = dict(metrics or {}, **{latency_metric: duration_ms})
+                    
+                payload = data if callback_payload is None else callback_payload(data, kwargs)
+                pending = self._callbacks_awaitable(event, payload)
+                if pending is not None:
+                    await pending
+                
+                return PrimitiveResult(
+                    status=PrimitiveStatus.COMPLETED,
+                    data=data,
+                    duration_ms=duration_ms,
+                    metrics=metrics if metrics is not None else {}
+                )
+            except Exception as e:
+                return PrimitiveResult(
+                    status=PrimitiveStatus.FAILED,
+                    data=None,
+                    errors=[str(e)]
+                )
+        return execute
+    return decorator
+
+
+async def _dispatch_callbacks(callbacks: Tuple[Tuple[Callable, bool], ...], data: Any):
+    """
+    Run (callback, is_coroutine) pairs in registration order.
+    
+    Sync callbacks are called one at a time. Each run of consecutive coroutine
+    callbacks is awaited together; every callback in the run finishes before
+    the first exception, if any, is re-raised and later callbacks are skipped.
+    """
+    batch = []
+    for callback, is_coroutine in callbacks:
+        if is_coroutine:
+            batch.append(callback(data))
+            continue
+        if batch:
+            await _gather_callbacks(batch)
+            batch = []
+        callback(data)
+    if batch:
+        await _gather_callbacks(batch)
+
+
+async def _gather_callbacks(batch: List[Awaitable]):
+    """Await a run of coroutine callbacks concurrently, re-raising the first failure."""
+    if len(batch) == 1:
+        await batch[0]
+        return
+    for outcome in await asyncio.gather(*batch, return_exceptions=True):
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+
+async def _execute_each(primitive: 'VOSPrimitive',
+                        context: 'PrimitiveContext',
+                        input_key: str,
+                        inputs: Sequence[Any],
+                        kwargs: Dict[str, Any]) -> List['PrimitiveResult']:
+    """Run a primitive concurrently once per input, passing each as input_key."""
+    return list(await asyncio.gather(
+        *(primitive.execute(context, **{**kwargs, input_key: item}) for item in inputs)
+    ))
+
+
+class VOSPrimitive(ABC):
+    """
+    Base class for all VOS primitives.
+    
+    Primitives are the atomic units of functionality in VOS.
+    They can be composed and orchestrated to create complex behaviors.
+    """
+    
+    # Decorator for numeric kernels used by subclasses; see vos_njit
+    jit = staticmethod(vos_njit)
+    
+    def __init__(self, name: str, primitive_type: PrimitiveType):
+        self.name = name
+        self.primitive_type = primitive_type
+        # (callback, is_coroutine) pairs per event; tuples are replaced, never
+        # mutated, so dispatch can iterate them safely even if a callback
+        # registers another
+        self._callbacks: Dict[str, Tuple[Tuple[Callable, bool], ...]] = {}
+        
+    @abstractmethod
+    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
+        """Execute the primitive."""
+        pass
+        
+    @classmethod
+    def warmup(cls) -> int:
+        """
+        Compile every JIT kernel registered with warmup_args.
+        
+        Call once during system startup so the first validation does not pay
+        the kernel compilation cost.
+        
+        Returns:
+            Number of kernels warmed up
+        """
+        for kernel, args in _jit_warmups:
+            kernel(*args)
+        return len(_jit_warmups)
+    
+    def register_callback(self, event: str, callback: Callable):
+        """
+        Register a callback for an event.
+        
+        Callbacks run in registration order, with one exception: consecutive
+        coroutine callbacks are awaited concurrently, so they must not depend
+        on each other's side effects. Sync callbacks still work but are
+        deprecated; each one runs on its own, after the callbacks registered
+        before it have finished.
+        """
+        is_coroutine = asyncio.iscoroutinefunction(callback)
+        if not is_coroutine:
+            warnings.warn(
+                "Sync VOS primitive callbacks are deprecated; register a coroutine function instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
+        self._callbacks[event] = self._callbacks.get(event, ()) + ((callback, is_coroutine),)
+        
+    async def _trigger_callbacks(self, event: str, data: Any):
+        """Trigger registered callbacks for an event."""
+        pending = self._callbacks_awaitable(event, data)
+        if pending is not None:
+            await pending
+            
+    def _callbacks_awaitable(self, event: str, data: Any) -> Optional[Awaitable]:
+        """
+        Start the callbacks for an event without awaiting them.
+        
+        Returns an awaitable for the callbacks, or None when there is nothing
+        to await (no callbacks, or a single sync callback, which is called
+        here) so hot paths can skip the await entirely.
+        """
+        callbacks = self._callbacks.get(event)
+        if not callbacks:
+            return None
+        if len(callbacks) == 1:
+            callback, is_coroutine = callbacks[0]
+            pending = callback(data)
+            return pending if is_coroutine else None
+        return _dispatch_callbacks(callbacks, data)
+                    
+    def compose(self, other: 'VOSPrimitive') -> 'ComposedPrimitive':
+        """Compose this primitive with another."""
+        return ComposedPrimitive([self, other])
+
+
+@dataclass(slots=True)
+class ComposedResult:
+    """
+    Sub-results of a ComposedPrimitive, stored column by column.
+    
+    Each PrimitiveResult field is kept as its own list, so aggregation over
+    one field is a single pass. Indexing, slicing and iteration build
+    PrimitiveResult rows on demand, one row per access, so callers that
+    treated ``data`` as a list of results keep working. It is not a list
+    itself: use as_results() where a real list is needed, e.g. for
+    isinstance checks or JSON serialisation.
+    """
+    statuses: List[PrimitiveStatus] = field(default_factory=list)
+    datas: List[Any] = field(default_factory=list)
+    errors: List[List[str]] = field(default_factory=list)
+    warnings: List[List[str]] = field(default_factory=list)
+    metrics: List[Dict[str, Any]] = field(default_factory=list)
+    timestamps: List[datetime] = field(default_factory=list)
+    durations_ms: List[Optional[float]] = field(default_factory=list)
+    
+    @classmethod
+    def from_results(cls, results: Sequence[PrimitiveResult]) -> 'ComposedResult':
+        """Build the columns from a sequence of results."""
+        composed = cls()
+        for result in results:
+            composed.append(result)
+        return composed
+        
+    def append(self, result: PrimitiveResult):
+        """Add one sub-result to the columns."""
+        self.statuses.append(result.status)
+        self.datas.append(result.data)
+        self.errors.append(result.errors)
+        self.warnings.append(result.warnings)
+        self.metrics.append(result.metrics)
+        self.timestamps.append(result.timestamp)
+        self.durations_ms.append(result.duration_ms)
+        
+    def as_results(self) -> List[PrimitiveResult]:
+        """Materialize the columns as a plain list of PrimitiveResult rows."""
+        return [self._row(index) for index in range(len(self.statuses))]
+        
+    def _row(self, index: int) -> PrimitiveResult:
+        """Build the PrimitiveResult stored at one (possibly negative) index."""
+        return PrimitiveResult(
+            status=self.statuses[index],
+            data=self.datas[index],
+            errors=self.errors[index],
+            warnings=self.warnings[index],
+            metrics=self.metrics[index],
+            timestamp=self.timestamps[index],
+            duration_ms=self.durations_ms[index]
+        )
+        
+    def __len__(self) -> int:
+        return len(self.statuses)
+        
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self.statuses)))]
+        return self._row(index)
+        
+    def __iter__(self):
+        index = 0
+        while index < len(self.statuses):
+            yield self._row(index)
+            index += 1
+
+
+class ComposedPrimitive(VOSPrimitive):
+    """
+    A primitive composed of multiple primitives.
+    
+    By default the primitives run in sequence and stop at the first failure.
+    With parallel=True they are independent: all of them run concurrently and
+    the composition fails if any of them failed. The result's data is a
+    ComposedResult holding the sub-results.
+    """
+    
+    def __init__(self, primitives: List[VOSPrimitive], parallel: bool = False):
+        super().__init__(
+            name=f"Composed({', '.join(p.name for p in primitives)})",
+            primitive_type=PrimitiveType.WORKFLOW
+        )
+        self.primitives = primitives
+        self.parallel = parallel
+        
+    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
+        """Execute all composed primitives."""
+        if self.parallel:
+            return await self._execute_parallel(context, **kwargs)
+        if len(self.primitives) == 2:
+            return await self._execute_pair(context, **kwargs)
+            
+        composed = ComposedResult()
+        for primitive in self.primitives:
+            result = await primitive.execute(context, **kwargs)
+            composed.append(result)
+            if result.status is PrimitiveStatus.FAILED:
+                return self._combine(composed, PrimitiveStatus.FAILED)
+                
+        return self._combine(composed, PrimitiveStatus.COMPLETED)
+        
+    @staticmethod
+    def _combine(composed: ComposedResult, status: PrimitiveStatus) -> PrimitiveResult:
+        """Fold sub-results into one result, merging their columns in a single pass each."""
+        combined_metrics = {}
+        for metrics in composed.metrics:
+            if metrics:
+                combined_metrics.update(metrics)
+                
+        return PrimitiveResult(
+            status=status,
+            data=composed,
+            errors=list(itertools.chain.from_iterable(composed.errors)),
+            warnings=list(itertools.chain.from_iterable(composed.warnings)),
+            metrics=combined_metrics
+        )
+        
+    async def _execute_pair(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
+        """Sequential execution specialised for the two primitives built by compose()."""
+        first, second = self.primitives
+        first_result = await first.execute(context, **kwargs)
+        if first_result.status is PrimitiveStatus.FAILED:
+            return PrimitiveResult(
+                status=PrimitiveStatus.FAILED,
+                data=ComposedResult.from_results((first_result,)),
+                errors=list(first_result.errors),
+                warnings=list(first_result.warnings),
+                metrics=dict(first_result.metrics)
+            )
+            
+        second_result = await second.execute(context, **kwargs)
+        return PrimitiveResult(
+            status=PrimitiveStatus.FAILED if second_result.status is PrimitiveStatus.FAILED else PrimitiveStatus.COMPLETED,
+            data=ComposedResult.from_results((first_result, second_result)),
+            errors=first_result.errors + second_result.errors,
+            warnings=first_result.warnings + second_result.warnings,
+            metrics={**first_result.metrics, **second_result.metrics}
+        )
+        
+    async def _execute_parallel(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
+        """Execute all composed primitives concurrently and fold their results."""
+        composed = ComposedResult.from_results(
+            await asyncio.gather(*(p.execute(context, **kwargs) for p in self.primitives))
+        )
+        failed = PrimitiveStatus.FAILED in composed.statuses
+        return self._combine(composed, PrimitiveStatus.FAILED if failed else PrimitiveStatus.COMPLETED)
+
+
+class Memoizable:
+    """
+    Mixin that memoizes successful primitive results by input content.
+    
+    Place it before the primitive base class, e.g.
+    ``class MyDetector(Memoizable, DetectionPrimitive)``. The cache key covers
+    the primitive class, the execute kwargs and the context's agent_id, domain
+    and metadata; per-call fields (id, session_id, timestamp) are excluded so
+    hits carry across sessions. Only the primitive's own work is skipped on a
+    hit - callbacks do not fire again - and cached data is shared between the
+    results it is returned in.
+    
+    cache_policy (class attribute, or a ``cache_policy`` execute kwarg):
+        'write-through': serve hits, store misses (default)
+        'replace': always recompute and overwrite the cached entry
+        'skip': bypass the cache entirely
+    """
+    
+    cache_policy: str = 'write-through'
+    memo_size: int = 256
+    
+    async def execute(self, context: PrimitiveContext, **kwargs) -> PrimitiveResult:
+        """Execute the primitive, consulting the memo cache first."""
+        policy = kwargs.pop('cache_policy', self.cache_policy)
+        key = None if policy == 'skip' else self._memo_key(context, kwargs)
+        if key is None:
+            return await super().execute(context, **kwargs)
+            
+        memo = self.__dict__.get('_memo')
+        if memo is None:
+            memo = self._memo = OrderedDict()
+            
+        if policy != 'replace':
+            cached = memo.get(key)
+            if cached is not None:
+                memo.move_to_end(key)
+                data, metrics = cached
+                return PrimitiveResult(
+                    status=PrimitiveStatus.COMPLETED,
+                    data=data,
+                    metrics=dict(metrics, cache_hit=True)
+                )
+                
+        result = await super().execute(context, **kwargs)
+        if result.status is PrimitiveStatus.COMPLETED:
+            memo[key] = (result.data, dict(result.metrics))
+            memo.move_to_end(key)
+            if len(memo) > self.memo_size:
+                memo.popitem(last=False)
+        return result
+        
+    def _memo_key(self, context: PrimitiveContext, kwargs: Dict[str, Any]) -> Optional[bytes]:
+        """Hash the semantic inputs of a call, or None if they cannot be pickled."""
+        try:
+            payload = pickle.dumps(
+                (sorted(kwargs.items()), context.agent_id, context.domain, context._materialize_metadata()),
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except Exception:
+            return None
+        hasher = hashlib.blake2b(type(self).__qualname__.encode() + b'\0', digest_size=16)
+        hasher.update(payload)
+        return hasher.digest()
+
+
+class DetectionPrimitive(VOSPrimitive):
+    """Base class for detection primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.DETECTION)
+        
+    @abstractmethod
+    async def detect(self, input_data: Any, context: PrimitiveContext) -> Dict[str, Any]:
+        """Perform detection on input data."""
+        pass
+        
+    @_primitive_execute('detection_complete', latency_metric='detection_latency_ms')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute detection primitive."""
+        return await self.detect(kwargs.get('input_data'), context), None
+        
+    async def execute_batch(self, context: PrimitiveContext, inputs: Sequence[Any], **kwargs) -> List[PrimitiveResult]:
+        """
+        Execute detection for many inputs, one result per input.
+        
+        Each input is passed as ``input_data``; the default runs them concurrently.
+        Override with a vectorized implementation where one is available.
+        """
+        return await _execute_each(self, context, 'input_data', inputs, kwargs)
+
+
+class CorrectionPrimitive(VOSPrimitive):
+    """Base class for correction primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.CORRECTION)
+        
+    @abstractmethod
+    async def correct(self, detection_result: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
+        """Perform correction based on detection result."""
+        pass
+        
+    @_primitive_execute('correction_complete', latency_metric='correction_latency_ms')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute correction primitive."""
+        return await self.correct(kwargs.get('detection_result'), context), None
+
+
+class UncertaintyPrimitive(VOSPrimitive):
+    """Base class for uncertainty quantification primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.UNCERTAINTY)
+        
+    @abstractmethod
+    async def quantify(self, input_data: Any, context: PrimitiveContext) -> Dict[str, float]:
+        """Quantify uncertainty in input data."""
+        pass
+        
+    @_primitive_execute('uncertainty_quantified')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute uncertainty primitive."""
+        uncertainty_scores = await self.quantify(kwargs.get('input_data'), context)
+        return uncertainty_scores, {'uncertainty_dimensions': len(uncertainty_scores)}
+        
+    async def execute_batch(self, context: PrimitiveContext, inputs: Sequence[Any], **kwargs) -> List[PrimitiveResult]:
+        """
+        Execute uncertainty for many inputs, one result per input.
+        
+        Each input is passed as ``input_data``; the default runs them concurrently.
+        Override with a vectorized implementation where one is available.
+        """
+        return await _execute_each(self, context, 'input_data', inputs, kwargs)
+
+
+class CoordinationPrimitive(VOSPrimitive):
+    """Base class for multi-agent coordination primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.COORDINATION)
+        
+    @abstractmethod
+    async def coordinate(self, agents: List[str], task: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
+        """Coordinate multiple agents for a task."""
+        pass
+        
+    @_primitive_execute('coordination_complete')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute coordination primitive."""
+        agents = kwargs.get('agents', [])
+        coordination_result = await self.coordinate(agents, kwargs.get('task', {}), context)
+        return coordination_result, {'coordinated_agents': len(agents)}
+
+
+class TrustPrimitive(VOSPrimitive):
+    """Base class for trust scoring primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.TRUST)
+        
+    @abstractmethod
+    async def calculate_trust(self, agent_id: str, validation_results: Dict[str, Any], context: PrimitiveContext) -> float:
+        """Calculate trust score for an agent."""
+        pass
+        
+    @_primitive_execute(
+        'trust_calculated',
+        callback_payload=lambda data, kwargs: {
+            'agent_id': kwargs.get('agent_id'),
+            'trust_score': data['trust_score']
+        }
+    )
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute trust primitive."""
+        trust_score = await self.calculate_trust(
+            kwargs.get('agent_id'),
+            kwargs.get('validation_results', {}),
+            context
+        )
+        return {'trust_score': trust_score}, {'trust_score': trust_score}
+
+
+class MemoryPrimitive(VOSPrimitive):
+    """Base class for memory management primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.MEMORY)
+        
+    @abstractmethod
+    async def manage_memory(self, operation: str, data: Any, context: PrimitiveContext) -> Dict[str, Any]:
+        """Perform memory management operation."""
+        pass
+        
+    @_primitive_execute('memory_operation_complete')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute memory primitive."""
+        return await self.manage_memory(kwargs.get('operation', 'read'), kwargs.get('data'), context), None
+
+
+class HandoffPrimitive(VOSPrimitive):
+    """Base class for agent handoff primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.HANDOFF)
+        
+    @abstractmethod
+    async def validate_handoff(self, from_agent: str, to_agent: str, context_data: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
+        """Validate agent handoff."""
+        pass
+        
+    @_primitive_execute('handoff_validated')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute handoff primitive."""
+        return await self.validate_handoff(
+            kwargs.get('from_agent'),
+            kwargs.get('to_agent'),
+            kwargs.get('context_data', {}),
+            context
+        ), None
+
+
+class WorkflowPrimitive(VOSPrimitive):
+    """Base class for workflow validation primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.WORKFLOW)
+        
+    @abstractmethod
+    async def validate_workflow(self, workflow_definition: Dict[str, Any], context: PrimitiveContext) -> Dict[str, Any]:
+        """Validate workflow definition and execution."""
+        pass
+        
+    @_primitive_execute('workflow_validated')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute workflow primitive."""
+        return await self.validate_workflow(kwargs.get('workflow_definition', {}), context), None
+
+
+class CompliancePrimitive(VOSPrimitive):
+    """Base class for compliance validation primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.COMPLIANCE)
+        
+    @abstractmethod
+    async def validate_compliance(self, data: Any, regulations: List[str], context: PrimitiveContext) -> Dict[str, Any]:
+        """Validate compliance with regulations."""
+        pass
+        
+    @_primitive_execute('compliance_validated')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute compliance primitive."""
+        return await self.validate_compliance(kwargs.get('data'), kwargs.get('regulations', []), context), None
+        
+    async def execute_batch(self, context: PrimitiveContext, inputs: Sequence[Any], **kwargs) -> List[PrimitiveResult]:
+        """
+        Execute compliance for many inputs, one result per input.
+        
+        Each input is passed as ``data``; the default runs them concurrently.
+        Override with a vectorized implementation where one is available.
+        """
+        return await _execute_each(self, context, 'data', inputs, kwargs)
+
+
+class BenchmarkPrimitive(VOSPrimitive):
+    """Base class for benchmarking primitives."""
+    
+    def __init__(self, name: str):
+        super().__init__(name, PrimitiveType.BENCHMARK)
+        
+    @abstractmethod
+    async def run_benchmark(self, test_suite: str, target: Any, context: PrimitiveContext) -> Dict[str, Any]:
+        """Run benchmark test suite."""
+        pass
+        
+    @_primitive_execute('benchmark_complete')
+    async def execute(self, context: PrimitiveContext, **kwargs) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Execute benchmark primitive."""
+        return await self.run_benchmark(kwargs.get('test_suite'), kwargs.get('target'), context), None
+        
+    async def execute_batch(self, context: PrimitiveContext, inputs: Sequence[Any], **kwargs) -> List[PrimitiveResult]:
+        """
+        Execute benchmark for many inputs, one result per input.
+        
+        Each input is passed as ``target``; the default runs them concurrently.
+        Override with a vectorized implementation where one is available.
+        """
+        return await _execute_each(self, context, 'target', inputs, kwargs)
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Unit tests for the serialization utilities."""
+
+import datetime
+import math
+
+import numpy as np
+import pytest
+
+from gatf.utils import serialization
+from gatf.utils.serialization import DataSerializer, SerializationFormat, deserialize, serialize
+
+
+def _large_payload(**extra):
+    rows = [{"id": i, "score": i / 7, "label": f"row {i}"} for i in range(4000)]
+    return {"rows": rows, **extra}
+
+
+class TestJsonRoundTrip:
+    """JSON payloads decode the same on either side of the simdjson threshold."""
+
+    @pytest.mark.parametrize("use_simdjson", [True, False])
+    def test_large_payload(self, monkeypatch, use_simdjson):
+        if not use_simdjson:
+            monkeypatch.setattr(serialization, "simdjson", None)
+        elif serialization.simdjson is None:
+            pytest.skip("simdjson is not installed")
+        payload = _large_payload()
+        data = serialize(payload, SerializationFormat.JSON)
+        assert len(data) >= serialization.SIMDJSON_THRESHOLD
+        assert deserialize(data, SerializationFormat.JSON) == payload
+
+    @pytest.mark.parametrize("size", ["small", "large"])
+    def test_non_finite_floats(self, size):
+        extra = {"nan": float("nan"), "inf": float("inf"), "ninf": float("-inf")}
+        payload = _large_payload(**extra) if size == "large" else extra
+        data = serialize(payload, SerializationFormat.JSON)
+        assert (len(data) >= serialization.SIMDJSON_THRESHOLD) == (size == "large")
+
+        decoded = deserialize(data, SerializationFormat.JSON)
+        assert math.isnan(decoded["nan"])
+        assert decoded["inf"] == math.inf
+        assert decoded["ninf"] == -math.inf
+
+    def test_invalid_large_payload_still_fails(self):
+        data = b"[" + b"1," * serialization.SIMDJSON_THRESHOLD + b"]"
+        with pytest.raises(serialization.SerializationError):
+            deserialize(data, SerializationFormat.JSON)
+
+
+def _make_type(module):
+    return type("Point", (), {"__module__": module})
+
+
+class TestDataSerializerTypeNames:
+    """'_type' markers resolve by qualified name, then by first-registered bare name."""
+
+    def test_bare_name_keeps_first_registration(self):
+        serializer = DataSerializer()
+        first, second = _make_type("geo.a"), _make_type("geo.b")
+        serializer.register_type(first, lambda obj: {}, lambda obj: "first")
+        serializer.register_type(second, lambda obj: {}, lambda obj: "second")
+
+        assert serializer.deserialize({"_type": "Point"}) == "first"
+        assert serializer.deserialize({"_type": "geo.a.Point"}) == "first"
+        assert serializer.deserialize({"_type": "geo.b.Point"}) == "second"
+
+    def test_reregistering_a_type_replaces_its_deserializer(self):
+        serializer = DataSerializer()
+        point = _make_type("geo.a")
+        serializer.register_type(point, lambda obj: {}, lambda obj: "old")
+        serializer.register_type(_make_type("geo.b"), lambda obj: {}, lambda obj: "other")
+        serializer.register_type(point, lambda obj: {}, lambda obj: "new")
+
+        assert serializer.deserialize({"_type": "Point"}) == "new"
+        assert serializer.deserialize({"_type": "geo.a.Point"}) == "new"
+
+    def test_default_handlers_round_trip(self):
+        serializer = DataSerializer()
+        value = {"when": datetime.datetime(2024, 1, 2, 3, 4, 5), "array": np.arange(6).reshape(2, 3)}
+        restored = serializer.deserialize(serializer.serialize(value))
+        assert restored["when"] == value["when"]
+        assert np.array_equal(restored["array"], value["array"])
+
+    def test_unknown_markers_are_left_as_dicts(self):
+        assert DataSerializer().deserialize({"_type": "Unknown", "x": [1]}) == {"_type": "Unknown", "x": [1]}
@@ -0,0 +1,226 @@
+"""Unit tests for the quality validator."""
+
+import gc
+import random
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from gatf.validation.engines import quality_validator
+from gatf.validation.engines.quality_validator import QualityCheckConfig, QualityValidator
+
+
+def _reference_levenshtein(s1, s2):
+    """Textbook dynamic-programming edit distance."""
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (c1 != c2)))
+        previous = current
+    return previous[-1]
+
+
+def _random_strings(seed, count, max_length, alphabet="abcde \u00e9\u4e2d"):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_length)))
+        for _ in range(count)
+    ]
+
+
+class TestResultCache:
+    """Cached validate() results are copies and still update history."""
+
+    def _validator(self):
+        return QualityValidator(QualityCheckConfig(result_cache_size=16))
+
+    def test_mutated_result_does_not_leak_into_cache(self):
+        validator = self._validator()
+        first = validator.validate("the answer is 42", expected="the answer is 42")
+        for result in first:
+            result.passed = False
+            result.details["leaked"] = True
+            result.suggestions.append("leaked")
+
+        second = validator.validate("the answer is 42", expected="the answer is 42")
+        assert [r.check_name for r in second] == [r.check_name for r in first]
+        for result in second:
+            assert "leaked" not in result.details
+            assert "leaked" not in result.suggestions
+        assert second[0].passed
+
+    def test_cache_stats_and_clear(self):
+        validator = self._validator()
+        validator.validate("output")
+        validator.validate("output")
+        stats = validator.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+        validator.clear_cache()
+        assert validator.get_cache_stats()["size"] == 0
+        assert QualityValidator().get_cache_stats() == {}
+
+    def test_cache_hits_update_history(self):
+        validator = self._validator()
+        context = {"performance_metrics": {"response_time": 1.0, "tokens_processed": 50, "throughput": 50.0}}
+        for _ in range(3):
+            validator.validate("the answer", expected="the answer", context=context)
+
+        summary = validator.get_summary_metrics()
+        assert summary["total_validations"] == 3
+        assert summary["average_accuracy"] == 1.0
+        assert summary["average_response_time"] == 1.0
+
+
+class TestCheckThreadPool:
+    """Checks fanned out to a thread pool share history safely."""
+
+    def test_concurrent_validations_record_every_score(self):
+        validator = QualityValidator(QualityCheckConfig(max_workers=4))
+        with validator, ThreadPoolExecutor(max_workers=8) as callers:
+            list(callers.map(
+                lambda i: validator.validate(f"answer {i}", expected=f"answer {i}"),
+                range(200)
+            ))
+
+        summary = validator.get_summary_metrics()
+        assert summary["total_validations"] == 200
+        assert summary["average_accuracy"] == pytest.approx(1.0)
+        assert validator._recent_accuracy_sum == pytest.approx(sum(validator._recent_accuracy))
+
+    def test_context_manager_shuts_down_pool(self):
+        with QualityValidator(QualityCheckConfig(max_workers=2)) as validator:
+            validator.validate("output")
+        with pytest.raises(RuntimeError):
+            validator._executor.submit(print)
+
+    def test_dropped_validator_releases_pool(self):
+        validator = QualityValidator(QualityCheckConfig(max_workers=2))
+        executor = validator._executor
+        del validator
+        gc.collect()
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+class TestLevenshtein:
+    """Edit distance fallbacks agree with the textbook DP."""
+
+    @pytest.mark.parametrize("pattern, text", [
+        ("", ""), ("", "abc"), ("abc", ""), ("kitten", "sitting"),
+        ("flaw", "lawn"), ("a" * 64, "b" * 64), ("a" * 64, "a" * 63 + "b"),
+    ])
+    def test_bit_parallel_known_cases(self, pattern, text):
+        assert quality_validator._bit_parallel_levenshtein(pattern, text) == _reference_levenshtein(pattern, text)
+
+    def test_bit_parallel_matches_dp(self):
+        patterns = _random_strings(1, 200, quality_validator.BIT_PARALLEL_MAX_LENGTH)
+        texts = _random_strings(2, 200, 100)
+        for pattern, text in zip(patterns, texts):
+            assert quality_validator._bit_parallel_levenshtein(pattern, text) == _reference_levenshtein(pattern, text)
+
+    def test_fallback_distance_matches_dp(self, monkeypatch):
+        # Without rapidfuzz, short strings take the bit-parallel path and
+        # longer ones the two-row DP
+        monkeypatch.setattr(quality_validator, "_rf_levenshtein", None)
+        validator = QualityValidator()
+        lefts = _random_strings(3, 60, 150)
+        rights = _random_strings(4, 60, 150)
+        for left, right in zip(lefts, rights):
+            assert validator._levenshtein_distance(left, right) == _reference_levenshtein(left, right)
+
+
+@pytest.mark.skipif(quality_validator._levenshtein_batch_kernel is None, reason="numba not installed")
+class TestBatchLevenshtein:
+    """The Numba batch kernel agrees with the per-pair path."""
+
+    def test_kernel_matches_dp(self):
+        query = "kitten é中"
+        others = _random_strings(5, 50, 40) + [""]
+        lengths = np.array([len(o) for o in others], dtype=np.int64)
+        offsets = np.zeros(len(others) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        distances = quality_validator._levenshtein_batch_kernel(
+            quality_validator._code_points(query),
+            quality_validator._code_points("".join(others)),
+            offsets
+        )
+        assert distances.tolist() == [_reference_levenshtein(query, other) for other in others]
+
+    def test_batch_similarity_matches_per_pair(self):
+        validator = QualityValidator()
+        previous = ["  Kitten ", "sitting", "", "KITTEN", "mitten"] + _random_strings(6, 20, 30)
+        assert len(previous) >= quality_validator.BATCH_LEVENSHTEIN_MIN_SIZE
+
+        scores = validator._batch_string_similarity("Kitten", previous)
+        expected = [validator._calculate_similarity("Kitten", prev) for prev in previous]
+        assert scores.tolist() == pytest.approx(expected)
+
+    def test_small_or_mixed_batches_fall_back(self):
+        validator = QualityValidator()
+        small = ["a"] * (quality_validator.BATCH_LEVENSHTEIN_MIN_SIZE - 1)
+        assert validator._batch_string_similarity("a", small) is None
+        mixed = ["a"] * quality_validator.BATCH_LEVENSHTEIN_MIN_SIZE + [1]
+        assert validator._batch_string_similarity("a", mixed) is None
+
+
+class TestRunningStats:
+    """Welford's streaming moments match the statistics module."""
+
+    def test_matches_statistics(self):
+        rng = random.Random(7)
+        values = [rng.uniform(-1e3, 1e3) for _ in range(500)]
+        stats = quality_validator._RunningStats()
+        for value in values:
+            stats.push(value)
+
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.variance == pytest.approx(statistics.variance(values))
+
+    def test_degenerate_counts(self):
+        stats = quality_validator._RunningStats()
+        assert stats.variance == 0.0
+        stats.push(3.5)
+        assert stats.mean == 3.5
+        assert stats.variance == 0.0
+
+
+class TestValidateStatistics:
+    """Word repetition and diversity figures."""
+
+    def test_repetition_and_diversity(self):
+        result = QualityValidator().validate_statistics("spam " * 12 + "eggs")
+        assert result.details["statistical_issues"] == [
+            "High repetition detected (92.3%)",
+            "Low diversity (15.4% unique words)",
+        ]
+        assert result.score == pytest.approx(0.5)
+
+    def test_long_token_is_counted_once(self):
+        blob = "x" * 1_000_000
+        result = QualityValidator().validate_statistics(" ".join([blob] + [f"w{i}" for i in range(20)]))
+        assert result.passed
+        assert result.details["statistical_issues"] == []
+
+
+class _Unprintable:
+    def __str__(self):
+        raise RuntimeError("cannot render")
+
+
+class TestUnrenderableOutput:
+    """An output whose __str__ raises becomes check results, not an exception."""
+
+    def test_validate_records_render_failure(self):
+        results = QualityValidator().validate(_Unprintable(), context={"max_length": 10})
+        by_name = {result.check_name: result for result in results}
+
+        assert not by_name["format_validation"].passed
+        assert "cannot render" in by_name["format_validation"].message
+        assert "cannot render" in by_name["statistical_validation"].message
@@ -0,0 +1,155 @@
+"""Unit tests for the universal metrics."""
+
+import dataclasses
+import json
+import random
+import time
+from datetime import datetime
+
+import pytest
+
+from gatf.domains.base_domain import ValidationResult, ValidationSeverity
+from gatf.validation.metrics import universal_metrics
+from gatf.validation.metrics.universal_metrics import (
+    MetricDefinition,
+    MetricResult,
+    MetricType,
+    UniversalMetrics,
+)
+
+
+def _validation_results():
+    return [
+        ValidationResult("accuracy_validation", True, 0.9, ValidationSeverity.INFO, "ok"),
+        ValidationResult("format_validation", False, 0.4, ValidationSeverity.HIGH, "missing field"),
+        ValidationResult("completeness_validation", True, 0.8, ValidationSeverity.LOW, "ok"),
+    ]
+
+
+class TestMetricResult:
+    """MetricResult timestamps, passed in or derived from created_at."""
+
+    def test_explicit_timestamp_is_kept(self):
+        timestamp = datetime(2024, 1, 2, 3, 4, 5)
+        result = MetricResult("accuracy_score", 0.9, 0.9, timestamp=timestamp)
+        assert result.timestamp == timestamp
+        assert result.to_dict()["timestamp"] == timestamp.isoformat()
+
+    def test_positional_timestamp_is_kept(self):
+        timestamp = datetime(2024, 1, 2, 3, 4, 5)
+        result = MetricResult("accuracy_score", 0.9, 0.9, 1.0, None, {}, timestamp)
+        assert result.timestamp == timestamp
+
+    def test_default_timestamp_is_utc_creation_time(self):
+        before = time.time()
+        result = MetricResult("accuracy_score", 0.9, 0.9)
+        after = time.time()
+        assert before <= result.created_at <= after
+        assert result.timestamp == datetime.utcfromtimestamp(result.created_at)
+        assert result.timestamp is result.timestamp
+
+    def test_replace_and_asdict_see_timestamp(self):
+        result = MetricResult("accuracy_score", 0.9, 0.9)
+        assert dataclasses.asdict(result)["timestamp"] == result.timestamp
+        assert dataclasses.replace(result).timestamp == result.timestamp
+        timestamp = datetime(2024, 1, 2)
+        assert dataclasses.replace(result, timestamp=timestamp).timestamp == timestamp
+
+
+class TestCalculateMetricsCache:
+    """Memoized calculate_metrics results must not share state between calls."""
+
+    def test_mutated_result_does_not_leak_into_next_call(self):
+        calculator = UniversalMetrics(cache_size=8)
+        expected = UniversalMetrics().calculate_metrics(_validation_results())
+
+        first = calculator.calculate_metrics(_validation_results())
+        for result in first.values():
+            result.value = -1.0
+            result.metadata["leaked"] = True
+
+        second = calculator.calculate_metrics(_validation_results())
+        assert second.keys() == expected.keys()
+        for metric_id, result in second.items():
+            assert result is not first[metric_id]
+            assert result.value == expected[metric_id].value
+            assert "leaked" not in result.metadata
+
+    def test_cache_hit_has_fresh_timestamp(self):
+        calculator = UniversalMetrics(cache_size=8)
+        first = calculator.calculate_metrics(_validation_results())
+        second = calculator.calculate_metrics(_validation_results())
+        for metric_id, result in second.items():
+            assert result.created_at >= first[metric_id].created_at
+
+
+class TestBatchToJson:
+    """batch_to_json rows match to_dict, with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_rows_match_to_dict(self, monkeypatch, use_orjson):
+        if not use_orjson:
+            monkeypatch.setattr(universal_metrics, "orjson", None)
+        elif universal_metrics.orjson is None:
+            pytest.skip("orjson is not installed")
+        results = [
+            MetricResult("accuracy_score", 0.9, 0.9, metadata={"n": 3}, timestamp=datetime(2024, 1, 2, 3, 4, 5, 678)),
+            MetricResult("error_rate", 0.1, 0.9, sample_size=10),
+        ]
+        rows = json.loads(MetricResult.batch_to_json(results))
+        assert rows == [result.to_dict() for result in results]
+
+
+@pytest.mark.skipif(universal_metrics._aggregate_kernel is None, reason="numba not installed")
+class TestAggregateKernel:
+    """The Numba aggregation kernel agrees with the pure-Python path."""
+
+    def _runs(self, metric_ids):
+        rng = random.Random(11)
+        return [
+            {
+                metric_id: MetricResult(
+                    metric_id,
+                    rng.uniform(0, 2),
+                    rng.random(),
+                    confidence=rng.random(),
+                    sample_size=rng.choice([None, 5])
+                )
+                for metric_id in metric_ids
+            }
+            for _ in range(40)
+        ]
+
+    def test_kernel_matches_pure_path(self, monkeypatch):
+        calculator = UniversalMetrics()
+        metric_ids = []
+        for method in ("mean", "median", "min", "max", "sum"):
+            metric_ids.append(f"custom_{method}")
+            calculator.register_metric(MetricDefinition(
+                metric_id=f"custom_{method}",
+                name=method,
+                type=MetricType.PERFORMANCE,
+                description=method,
+                aggregation_method=method
+            ))
+        metric_ids.append("unregistered_metric")
+        runs = self._runs(metric_ids)
+
+        monkeypatch.setattr(universal_metrics, "AGGREGATION_KERNEL_MIN_SIZE", 1)
+        kernel = calculator.aggregate_metrics(runs)
+        monkeypatch.setattr(universal_metrics, "_aggregate_kernel", None)
+        pure = calculator.aggregate_metrics(runs)
+
+        assert kernel.keys() == pure.keys()
+        for metric_id, expected in pure.items():
+            result = kernel[metric_id]
+            assert result.value == pytest.approx(expected.value)
+            assert result.normalized_value == pytest.approx(expected.normalized_value)
+            assert result.confidence == pytest.approx(expected.confidence)
+            assert result.sample_size == expected.sample_size
+            assert result.metadata == pytest.approx(expected.metadata)
+
+    def test_single_run_has_zero_std_dev(self, monkeypatch):
+        monkeypatch.setattr(universal_metrics, "AGGREGATION_KERNEL_MIN_SIZE", 1)
+        aggregated = UniversalMetrics().aggregate_metrics(self._runs(["accuracy_score"])[:1])
+        assert aggregated["accuracy_score"].metadata["std_dev"] == 0.0
@@ -0,0 +1,229 @@
+"""Unit tests for the validation orchestrator."""
+
+import asyncio
+import copy
+import hashlib
+import pickle
+
+import pytest
+
+from gatf.core.exceptions import DependencyError
+from gatf.validation.orchestrators.validation_orchestrator import (
+    ValidationOrchestrator,
+    ValidationPipeline,
+    ValidationStage,
+    ValidationStatus,
+    ValidationTask,
+    _fingerprint,
+)
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = ValidationOrchestrator(cache_enabled=False)
+    yield orchestrator
+    orchestrator.shutdown()
+
+
+def _tasks(graph):
+    return {
+        task_id: ValidationTask(task_id=task_id, name=task_id, dependencies=set(dependencies))
+        for task_id, dependencies in graph.items()
+    }
+
+
+class TestBuildSchedule:
+    """Kahn scheduling: ready roots, dependency counters and cycle detection."""
+
+    def test_roots_and_counters(self, orchestrator):
+        tasks = _tasks({"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"], "e": []})
+        ready, dependents = orchestrator._build_schedule(tasks)
+
+        assert list(ready) == ["a", "e"]
+        assert sorted(dependents["a"]) == ["b", "c"]
+        assert dependents["b"] == ["d"] and dependents["c"] == ["d"]
+        assert {task_id: task.remaining for task_id, task in tasks.items()} == {
+            "a": 0, "b": 1, "c": 1, "d": 2, "e": 0
+        }
+
+    def test_pipeline_runs_tasks_after_their_dependencies(self, orchestrator):
+        context = orchestrator.validate("output")
+        assert any(task.dependencies for task in context.tasks.values())
+        for task in context.tasks.values():
+            for dependency in task.dependencies:
+                assert context.tasks[dependency].end_ns <= task.start_ns
+
+    @pytest.mark.parametrize("graph", [
+        {"a": ["b"], "b": ["a"]},
+        {"a": [], "b": ["a", "c"], "c": ["b"]},
+        {"a": ["a"]},
+        {"a": ["missing"]},
+    ])
+    def test_unschedulable_graphs_raise(self, orchestrator, graph):
+        with pytest.raises(DependencyError):
+            orchestrator._build_schedule(_tasks(graph))
+
+
+class _Unpicklable:
+    def __reduce__(self):
+        raise TypeError("not picklable")
+
+    def __repr__(self):
+        return "<unpicklable>"
+
+
+class TestFingerprint:
+    """Cache-key digests are stable, typed and match a materialized pickle."""
+
+    @pytest.mark.parametrize("value", ["text", b"raw", {"a": [1, 2.5, None]}, (1, "x")])
+    def test_deterministic_16_byte_digest(self, value):
+        digest = _fingerprint(value)
+        assert len(digest) == 16
+        assert digest == _fingerprint(copy.deepcopy(value))
+
+    def test_types_are_tagged(self):
+        assert len({_fingerprint("1"), _fingerprint(1), _fingerprint(b"1")}) == 3
+        assert _fingerprint(b"1") == _fingerprint(bytearray(b"1")) == _fingerprint(memoryview(b"1"))
+
+    def test_streamed_pickle_matches_dumps(self):
+        value = {"rows": [{"id": i, "text": "x" * i} for i in range(500)]}
+        expected = hashlib.blake2b(
+            b"p:" + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), digest_size=16
+        ).digest()
+        assert _fingerprint(value) == expected
+
+    def test_unpicklable_falls_back_to_repr(self):
+        value = [1, _Unpicklable()]
+        expected = hashlib.blake2b(b"r:" + repr(value).encode(), digest_size=16).digest()
+        assert _fingerprint(value) == expected
+
+    def test_lone_surrogates_hash(self):
+        assert _fingerprint("\ud800") != _fingerprint("\ud801")
+
+
+def _summary(context):
+    return (
+        [(r.check_name, r.passed, r.score, r.severity) for r in context.results],
+        {task.name: task.status for task in context.tasks.values()},
+        sorted(context.metrics),
+    )
+
+
+class TestAvalidate:
+    """The event-loop pipeline matches the blocking one."""
+
+    @pytest.mark.parametrize("output, expected", [
+        ("the answer is 42", "the answer is 42"),
+        ({"answer": 42, "unit": None}, {"answer": 41, "unit": "m"}),
+        ("", None),
+    ])
+    def test_matches_validate(self, orchestrator, output, expected):
+        blocking = orchestrator.validate(output, expected_output=expected)
+        awaited = asyncio.run(orchestrator.avalidate(output, expected_output=expected))
+        assert _summary(awaited) == _summary(blocking)
+
+    def test_concurrent_calls_share_one_loop(self, orchestrator):
+        async def run_all():
+            return await asyncio.gather(*(
+                orchestrator.avalidate(f"answer {i}", expected_output=f"answer {i}")
+                for i in range(8)
+            ))
+
+        contexts = asyncio.run(run_all())
+        assert len({context.request_id for context in contexts}) == 8
+        for context in contexts:
+            assert all(task.is_complete for task in context.tasks.values())
+        assert not orchestrator._running_contexts
+
+    def test_failed_parallel_task_does_not_block_dependents(self, orchestrator):
+        pipeline = orchestrator._get_pipeline(None)
+        context = orchestrator._create_context("output", None, None, None, {})
+
+        def fail():
+            raise ValueError("boom")
+
+        stage = next(iter(pipeline.parallel_stages))
+        failing = ValidationTask(task_id="a", name="a", stage=stage, validator_func=fail, max_retries=0)
+        after = ValidationTask(task_id="b", name="b", dependencies={"a"}, validator_func=lambda: "done")
+        context.tasks = {"a": failing, "b": after}
+
+        asyncio.run(orchestrator._aexecute_tasks(context, pipeline, orchestrator._build_schedule(context.tasks)))
+        assert failing.status == ValidationStatus.FAILED
+        assert isinstance(failing.error, ValueError)
+        assert after.status == ValidationStatus.COMPLETED
+        assert after.output_data == "done"
+
+
+class TestResultCache:
+    """Cached validations expire, are invalidated and never share state."""
+
+    @pytest.fixture
+    def cached(self):
+        orchestrator = ValidationOrchestrator(cache_enabled=True)
+        yield orchestrator
+        orchestrator.shutdown()
+
+    def test_hits_are_isolated_copies(self, cached):
+        first = cached.validate("the answer", expected_output="the answer")
+        first.results[0].details["leaked"] = True
+        first.results.clear()
+        first.metadata["leaked"] = True
+
+        second = cached.validate("the answer", expected_output="the answer")
+        assert second.request_id == first.request_id
+        assert second.results and all("leaked" not in r.details for r in second.results)
+        assert "leaked" not in second.metadata
+        second.metrics.clear()
+
+        third = cached.validate("the answer", expected_output="the answer")
+        assert third.metrics
+
+    def test_uncacheable_inputs_hit_the_cache_manager(self, cached):
+        first = cached.validate({"answer": 42})
+        first.results.clear()
+        second = cached.validate({"answer": 42})
+        assert second.request_id == first.request_id
+        assert second.results
+
+    def test_entries_expire_after_ttl(self):
+        orchestrator = ValidationOrchestrator(cache_enabled=True, cache_ttl=0)
+        try:
+            first = orchestrator.validate("the answer")
+            second = orchestrator.validate("the answer")
+            assert second.request_id != first.request_id
+        finally:
+            orchestrator.shutdown()
+
+    def test_register_pipeline_clears_inproc_entries(self, cached):
+        cached.validate("the answer")
+        assert cached._inproc_cache
+        cached.register_pipeline(ValidationPipeline(name="default_pipeline"))
+        assert not cached._inproc_cache
+
+    def test_clear_cache(self, cached):
+        first = cached.validate("the answer")
+        cached.clear_cache()
+        assert not cached._inproc_cache
+        assert cached.validate("the answer").request_id != first.request_id
+
+
+class TestPipelineInfo:
+    """Pipeline descriptions are memoized but handed out as copies."""
+
+    def test_mutating_info_does_not_leak(self, orchestrator):
+        info = orchestrator.get_pipeline_info()
+        expected = copy.deepcopy(info)
+        info["name"] = "changed"
+        info["stages"].clear()
+        info["stage_timeouts"]["initialization"] = -1
+
+        assert orchestrator.get_pipeline_info() == expected
+
+    def test_reregistering_rebuilds_info(self, orchestrator):
+        pipeline = ValidationPipeline(name="custom", stages=[ValidationStage.INITIALIZATION])
+        orchestrator.register_pipeline(pipeline)
+        assert orchestrator.get_pipeline_info("custom")["stages"] == ["initialization"]
+
+        pipeline.stages.append(ValidationStage.FINALIZATION)
+        orchestrator.register_pipeline(pipeline)
+        assert orchestrator.get_pipeline_info("custom")["stages"] == ["initialization", "finalization"]
@@ -0,0 +1,300 @@
+"""Unit tests for the VOS orchestrator."""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from gatf_vos.core import vos_orchestrator
+from gatf_vos.core.vos_orchestrator import VOSOrchestrator
+from gatf_vos.vos_primitives import (
+    CorrectionPrimitive,
+    DetectionPrimitive,
+    PrimitiveContext,
+    PrimitiveStatus,
+    TrustPrimitive,
+    UncertaintyPrimitive,
+)
+
+
+class _StaticDetector(DetectionPrimitive):
+    """Detection primitive reporting a fixed issues_found flag."""
+
+    def __init__(self, name, issues_found):
+        super().__init__(name)
+        self.issues_found = issues_found
+
+    async def detect(self, input_data, context):
+        return {'issues_found': self.issues_found}
+
+
+class _StaticUncertainty(UncertaintyPrimitive):
+    def __init__(self):
+        super().__init__('uncertainty_quantification')
+
+    async def quantify(self, input_data, context):
+        return {'epistemic': 0.1}
+
+
+class _StaticTrust(TrustPrimitive):
+    def __init__(self):
+        super().__init__('trust_calculation')
+
+    async def calculate_trust(self, agent_id, validation_results, context):
+        return 0.9
+
+
+class _SlowCorrector(CorrectionPrimitive):
+    """Correction primitive that takes delay seconds and counts its runs."""
+
+    def __init__(self, delay=0.0):
+        super().__init__('correction_engine')
+        self.delay = delay
+        self.calls = 0
+
+    async def correct(self, detection_result, context):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {'corrected': True}
+
+
+def _orchestrator(issues_found, corrector):
+    orchestrator = VOSOrchestrator(config=None)
+    for name in ('hallucination_detection', 'intent_drift_detection', 'memory_drift_detection'):
+        orchestrator.register_primitive(_StaticDetector(name, issues_found and name == 'hallucination_detection'))
+    orchestrator.register_primitive(_StaticUncertainty())
+    orchestrator.register_primitive(_StaticTrust())
+    orchestrator.register_primitive(corrector)
+    return orchestrator
+
+
+class TestValidateAgentCorrections:
+    """The conditional correction step of validate_agent."""
+
+    def test_correction_skipped_without_issues(self):
+        corrector = _SlowCorrector()
+        orchestrator = _orchestrator(False, corrector)
+        result = asyncio.run(orchestrator.validate_agent('agent-1', {}))
+
+        assert corrector.calls == 0
+        assert result['corrections'] == {}
+        assert result['trust_score'] == 0.9
+        assert 'correction_engine' not in orchestrator._execution_history[-1].primitive_results
+
+    def test_correction_runs_when_issues_found(self):
+        corrector = _SlowCorrector()
+        orchestrator = _orchestrator(True, corrector)
+        result = asyncio.run(orchestrator.validate_agent('agent-1', {}))
+
+        assert corrector.calls == 1
+        assert result['corrections'] == {'corrected': True}
+
+    def test_correction_runs_under_real_time_timeout(self):
+        corrector = _SlowCorrector(delay=1.0)
+        orchestrator = _orchestrator(True, corrector)
+        result = asyncio.run(orchestrator.validate_agent('agent-1', {}))
+
+        correction = orchestrator._execution_history[-1].primitive_results['correction_engine']
+        assert correction.errors == ["Timeout after 100ms"]
+        assert result['corrections'] is None
+        assert result['trust_score'] == 0.9
+
+
+class TestAgentLocks:
+    """Per-agent serialization of validate_agent calls."""
+
+    def _recording_orchestrator(self, events):
+        orchestrator = VOSOrchestrator(config=None)
+
+        async def run(agent_id, validation_data):
+            events.append(('start', agent_id, validation_data['n']))
+            await asyncio.sleep(0.01)
+            events.append(('end', agent_id, validation_data['n']))
+            return validation_data['n']
+
+        orchestrator._run_agent_validation = run
+        return orchestrator
+
+    def test_same_agent_runs_fifo(self):
+        events = []
+        orchestrator = self._recording_orchestrator(events)
+
+        async def main():
+            return await asyncio.gather(*(orchestrator.validate_agent('a', {'n': n}) for n in range(4)))
+
+        assert asyncio.run(main()) == [0, 1, 2, 3]
+        assert events == [(kind, 'a', n) for n in range(4) for kind in ('start', 'end')]
+
+    def test_different_agents_run_concurrently(self):
+        events = []
+        orchestrator = self._recording_orchestrator(events)
+
+        async def main():
+            return await asyncio.gather(*(orchestrator.validate_agent(f'agent-{n}', {'n': n}) for n in range(3)))
+
+        assert asyncio.run(main()) == [0, 1, 2]
+        # Every agent starts before any of them finishes
+        assert [kind for kind, _, _ in events[:3]] == ['start'] * 3
+
+    def test_idle_locks_are_released(self):
+        orchestrator = self._recording_orchestrator([])
+
+        async def main():
+            await asyncio.gather(*(orchestrator.validate_agent(f'agent-{n}', {'n': n}) for n in range(50)))
+            assert orchestrator._agent_locks == {}
+            # A later request for the same agent takes a fresh lock
+            return await orchestrator.validate_agent('agent-0', {'n': 7})
+
+        assert asyncio.run(main()) == 7
+        assert orchestrator._agent_locks == {}
+
+    def test_failure_does_not_block_later_requests(self):
+        orchestrator = VOSOrchestrator(config=None)
+
+        async def run(agent_id, validation_data):
+            if validation_data['n'] == 0:
+                raise RuntimeError('boom')
+            return validation_data['n']
+
+        orchestrator._run_agent_validation = run
+
+        async def main():
+            return await asyncio.gather(
+                *(orchestrator.validate_agent('a', {'n': n}) for n in range(3)),
+                return_exceptions=True
+            )
+
+        first, *rest = asyncio.run(main())
+        assert isinstance(first, RuntimeError)
+        assert rest == [1, 2]
+        assert orchestrator._agent_locks == {}
+
+    def test_nested_request_for_same_agent_runs_inline(self):
+        orchestrator = VOSOrchestrator(config=None)
+
+        async def run(agent_id, validation_data):
+            depth = validation_data['depth']
+            if depth == 0:
+                return 0
+
+            # Like a primitive run by the plan, in a child task
+            async def nested():
+                return await orchestrator.validate_agent(agent_id, {'depth': depth - 1})
+
+            return 1 + await asyncio.create_task(nested())
+
+        orchestrator._run_agent_validation = run
+        assert asyncio.run(asyncio.wait_for(orchestrator.validate_agent('a', {'depth': 3}), 1.0)) == 3
+
+    def test_runs_in_callers_context(self):
+        request_id = contextvars.ContextVar('request_id', default=None)
+        orchestrator = VOSOrchestrator(config=None)
+
+        async def run(agent_id, validation_data):
+            await asyncio.sleep(0)
+            return request_id.get()
+
+        orchestrator._run_agent_validation = run
+
+        async def call(n):
+            request_id.set(f'req-{n}')
+            return await orchestrator.validate_agent('a', {})
+
+        async def main():
+            return await asyncio.gather(*(call(n) for n in range(3)))
+
+        assert asyncio.run(main()) == ['req-0', 'req-1', 'req-2']
+
+
+class TestBuildLevels:
+    """Kahn layering of plan primitives."""
+
+    def _primitives(self, *names):
+        return [_StaticDetector(name, False) for name in names]
+
+    def _names(self, levels):
+        return [[p.name for p in level] for level in levels]
+
+    def test_layers_in_plan_order(self):
+        primitives = self._primitives('d', 'c', 'b', 'a', 'e')
+        dependencies = {'a': [], 'b': ['a'], 'c': ['a'], 'd': ['b', 'c']}
+        levels = vos_orchestrator._build_levels(primitives, dependencies)
+        assert self._names(levels) == [['a', 'e'], ['c', 'b'], ['d']]
+
+    def test_no_dependencies_is_one_level(self):
+        primitives = self._primitives('x', 'y', 'z')
+        assert self._names(vos_orchestrator._build_levels(primitives, {})) == [['x', 'y', 'z']]
+        assert vos_orchestrator._build_levels([], {}) == []
+
+    @pytest.mark.parametrize('dependencies', [
+        {'a': ['b'], 'b': ['a']},
+        {'a': ['a']},
+        {'a': [], 'b': ['c'], 'c': ['b']},
+        {'a': ['outside_plan']},
+    ])
+    def test_unsatisfiable_dependencies_raise(self, dependencies):
+        with pytest.raises(vos_orchestrator.ValidationError):
+            vos_orchestrator._build_levels(self._primitives('a', 'b', 'c'), dependencies)
+
+
+class _FlakyDetector(DetectionPrimitive):
+    """Detection primitive whose first `failures` calls raise."""
+
+    def __init__(self, failures):
+        super().__init__('flaky_detection')
+        self.failures = failures
+        self.calls = 0
+
+    async def detect(self, input_data, context):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError(f'failure {self.calls}')
+        return {'issues_found': False}
+
+
+class TestRetryPrimitive:
+    """Exponential backoff retries of failed primitives."""
+
+    @pytest.fixture
+    def delays(self, monkeypatch):
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def record(delay):
+            delays.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(vos_orchestrator.asyncio, 'sleep', record)
+        return delays
+
+    def _retry(self, primitive, retry_policy):
+        orchestrator = VOSOrchestrator(config=None)
+        return asyncio.run(orchestrator._retry_primitive(primitive, PrimitiveContext(), retry_policy))
+
+    def test_returns_first_completed_result(self, delays):
+        primitive = _FlakyDetector(failures=2)
+        result = self._retry(primitive, {'max_retries': 5, 'backoff_seconds': 0.5})
+
+        assert result.status is PrimitiveStatus.COMPLETED
+        assert primitive.calls == 3
+        assert delays == [0.5, 1.0, 2.0]
+
+    def test_returns_none_when_every_attempt_fails(self, delays):
+        primitive = _FlakyDetector(failures=10)
+        assert self._retry(primitive, {'max_retries': 3}) is None
+        assert primitive.calls == 3
+        backoff = vos_orchestrator.RETRY_BACKOFF_SECONDS
+        assert delays == [backoff, 2 * backoff, 4 * backoff]
+
+    def test_adaptive_plan_replaces_failed_result(self, delays):
+        primitive = _FlakyDetector(failures=1)
+        plan = vos_orchestrator.OrchestrationPlan(
+            mode=vos_orchestrator.OrchestrationMode.ADAPTIVE,
+            primitives=[primitive],
+            retry_policy={'enabled': True}
+        )
+        orchestrator = VOSOrchestrator(config=None)
+        result = asyncio.run(orchestrator.execute_plan(plan, PrimitiveContext()))
+
+        assert result.primitive_results[primitive.name].status is PrimitiveStatus.COMPLETED
+        assert primitive.calls == 2
@@ -0,0 +1,430 @@
+"""Unit tests for the VOS primitives."""
+
+import asyncio
+import json
+import warnings
+
+import pytest
+
+from gatf_vos import vos_primitives
+from gatf_vos.vos_primitives import (
+    BenchmarkPrimitive,
+    CompliancePrimitive,
+    ComposedResult,
+    DetectionPrimitive,
+    Memoizable,
+    PrimitiveContext,
+    PrimitiveResult,
+    PrimitiveStatus,
+    UncertaintyPrimitive,
+    VOSPrimitive,
+    vos_njit,
+)
+
+
+class _EchoDetector(DetectionPrimitive):
+    """Detection primitive that reports its input back."""
+
+    def __init__(self):
+        super().__init__("echo")
+
+    async def detect(self, input_data, context):
+        return {'input': input_data}
+
+
+def _results(count):
+    return [
+        PrimitiveResult(
+            status=PrimitiveStatus.COMPLETED if i % 2 == 0 else PrimitiveStatus.FAILED,
+            data={'index': i},
+            errors=[f"error {i}"],
+            metrics={'value': i},
+            duration_ms=float(i)
+        )
+        for i in range(count)
+    ]
+
+
+class TestComposedResult:
+    """ComposedResult must behave like the list of results it replaced."""
+
+    def test_len_matches_list(self):
+        results = _results(5)
+        assert len(ComposedResult.from_results(results)) == len(results)
+        assert len(ComposedResult()) == 0
+
+    def test_indexing_matches_list(self):
+        results = _results(5)
+        composed = ComposedResult.from_results(results)
+        for index in range(-len(results), len(results)):
+            assert composed[index] == results[index]
+        assert composed[1:4] == results[1:4]
+        assert composed[::-2] == results[::-2]
+
+    def test_index_out_of_range_raises(self):
+        composed = ComposedResult.from_results(_results(2))
+        try:
+            composed[2]
+        except IndexError:
+            pass
+        else:
+            raise AssertionError("expected IndexError")
+
+    def test_iteration_matches_list(self):
+        results = _results(4)
+        composed = ComposedResult.from_results(results)
+        assert list(composed) == results
+        assert composed.as_results() == results
+
+    def test_iteration_is_lazy(self):
+        composed = ComposedResult.from_results(_results(3))
+        rows = iter(composed)
+        assert next(rows).data == {'index': 0}
+        composed.append(_results(4)[3])
+        assert [row.data['index'] for row in rows] == [1, 2, 3]
+
+
+class TestTriggerCallbacks:
+    """Callback dispatch with no, one and many registered callbacks."""
+
+    def _register(self, primitive, count, seen):
+        for i in range(count):
+            async def callback(data, i=i):
+                seen.append((i, data))
+            primitive.register_callback('detection_complete', callback)
+
+    def test_trigger_callbacks_is_awaitable_without_callbacks(self):
+        primitive = _EchoDetector()
+        assert asyncio.run(primitive._trigger_callbacks('detection_complete', {})) is None
+
+    def test_no_callbacks(self):
+        primitive = _EchoDetector()
+        assert primitive._callbacks_awaitable('detection_complete', {}) is None
+        result = asyncio.run(primitive.execute(PrimitiveContext(), input_data=1))
+        assert result.status is PrimitiveStatus.COMPLETED
+        assert result.data == {'input': 1}
+
+    def test_one_callback(self):
+        primitive, seen = _EchoDetector(), []
+        self._register(primitive, 1, seen)
+        asyncio.run(primitive._trigger_callbacks('detection_complete', 'direct'))
+        result = asyncio.run(primitive.execute(PrimitiveContext(), input_data=1))
+        assert result.status is PrimitiveStatus.COMPLETED
+        assert seen == [(0, 'direct'), (0, {'input': 1})]
+
+    def test_many_callbacks(self):
+        primitive, seen = _EchoDetector(), []
+        self._register(primitive, 3, seen)
+        asyncio.run(primitive._trigger_callbacks('detection_complete', 'direct'))
+        assert sorted(seen) == [(0, 'direct'), (1, 'direct'), (2, 'direct')]
+        seen.clear()
+        asyncio.run(primitive.execute(PrimitiveContext(), input_data=1))
+        assert sorted(i for i, _ in seen) == [0, 1, 2]
+
+
+class TestCallbackDispatch:
+    """Sync callback deprecation and dispatch order."""
+
+    def test_sync_callback_is_deprecated(self):
+        primitive = _EchoDetector()
+        with pytest.warns(DeprecationWarning):
+            primitive.register_callback('detection_complete', lambda data: None)
+
+    def test_dispatch_follows_registration_order(self):
+        primitive, order = _EchoDetector(), []
+
+        async def slow(data):
+            await asyncio.sleep(0.01)
+            order.append('slow')
+
+        async def fast(data):
+            order.append('fast')
+
+        with pytest.warns(DeprecationWarning):
+            primitive.register_callback('detection_complete', lambda data: order.append('sync-1'))
+            primitive.register_callback('detection_complete', lambda data: order.append('sync-2'))
+            primitive.register_callback('detection_complete', slow)
+            primitive.register_callback('detection_complete', fast)
+            primitive.register_callback('detection_complete', lambda data: order.append('sync-3'))
+
+        asyncio.run(primitive._trigger_callbacks('detection_complete', None))
+        # Consecutive coroutine callbacks run concurrently; sync ones wait for them
+        assert order == ['sync-1', 'sync-2', 'fast', 'slow', 'sync-3']
+
+    def test_failing_callback_lets_its_batch_finish(self):
+        primitive, finished = _EchoDetector(), []
+
+        async def failing(data):
+            raise RuntimeError("callback failed")
+
+        async def slow(data):
+            await asyncio.sleep(0.01)
+            finished.append('slow')
+
+        async def later(data):
+            finished.append('later')
+
+        primitive.register_callback('detection_complete', failing)
+        primitive.register_callback('detection_complete', slow)
+        with pytest.warns(DeprecationWarning):
+            primitive.register_callback('detection_complete', lambda data: finished.append('sync'))
+        primitive.register_callback('detection_complete', later)
+
+        result = asyncio.run(primitive.execute(PrimitiveContext(), input_data=1))
+        assert result.status is PrimitiveStatus.FAILED
+        assert result.errors == ["callback failed"]
+        assert finished == ['slow']
+
+
+class TestChildContext:
+    """Copy-on-write metadata of child contexts."""
+
+    def test_empty_parent_metadata_gives_plain_dict(self):
+        child = PrimitiveContext().child_context()
+        assert type(child.metadata) is dict
+
+    def test_child_writes_do_not_reach_parent(self):
+        parent = PrimitiveContext(metadata={'source': 'parent'})
+        child = parent.child_context()
+        child.metadata['step'] = 1
+        assert child.metadata['source'] == 'parent'
+        assert parent.metadata == {'source': 'parent'}
+
+    def test_materialized_metadata_is_plain_and_serialisable(self):
+        child = PrimitiveContext(metadata={'source': 'parent'}).child_context()
+        child.metadata['step'] = 1
+        metadata = child._materialize_metadata()
+        assert type(metadata) is dict
+        assert json.loads(json.dumps(metadata)) == {'source': 'parent', 'step': 1}
+
+    def test_deep_compositions_stay_bounded(self):
+        context = PrimitiveContext(metadata={'depth': 0})
+        for depth in range(1, 50):
+            context = context.child_context()
+            context.metadata['depth'] = depth
+        assert len(context.metadata.maps) <= 8
+        assert context.metadata['depth'] == 49
+
+
+def _dot(values, weights):
+    total = 0.0
+    for i in vos_primitives.prange(len(values)):
+        total += values[i] * weights[i]
+    return total
+
+
+class TestVosNjit:
+    """vos_njit fallback and kernel warmup."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_registry(self, monkeypatch):
+        monkeypatch.setattr(vos_primitives, '_jit_warmups', [])
+        monkeypatch.setattr(vos_primitives, '_jit_fallback_warned', False)
+
+    def test_fallback_returns_original_function(self, monkeypatch):
+        monkeypatch.setattr(vos_primitives, 'njit', None)
+        with pytest.warns(RuntimeWarning, match="numba is not installed"):
+            kernel = vos_njit(_dot)
+        assert kernel is _dot
+        assert VOSPrimitive.jit(parallel=True)(_dot) is _dot
+        assert kernel([1.0, 2.0], [3.0, 4.0]) == 11.0
+
+    def test_fallback_warns_once(self, monkeypatch):
+        monkeypatch.setattr(vos_primitives, 'njit', None)
+        with pytest.warns(RuntimeWarning):
+            vos_njit(_dot)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            vos_njit(_dot)
+
+    def test_warmup_runs_registered_kernels(self, monkeypatch):
+        monkeypatch.setattr(vos_primitives, 'njit', None)
+        calls = []
+
+        def kernel(x, y):
+            calls.append((x, y))
+            return x + y
+
+        with pytest.warns(RuntimeWarning):
+            vos_njit(kernel, warmup_args=(1.0, 2.0))
+        vos_njit(_dot)
+        assert VOSPrimitive.warmup() == 1
+        assert calls == [(1.0, 2.0)]
+
+    def test_warmup_compiles_with_njit(self, monkeypatch):
+        compiled = []
+
+        def fake_njit(**options):
+            def compile_kernel(kernel):
+                def compiled_kernel(*args):
+                    compiled.append((options, args))
+                    return kernel(*args)
+                return compiled_kernel
+            return compile_kernel
+
+        monkeypatch.setattr(vos_primitives, 'njit', fake_njit)
+        kernel = vos_njit(parallel=True, warmup_args=([1.0], [2.0]))(_dot)
+        assert kernel is not _dot
+        assert VOSPrimitive.warmup() == 1
+        assert compiled == [({'parallel': True, 'cache': True, 'nogil': True}, ([1.0], [2.0]))]
+
+    @pytest.mark.skipif(vos_primitives.njit is None, reason="numba not installed")
+    def test_uncacheable_kernel_compiles_without_cache(self):
+        namespace = {}
+        exec("def add_one(x):\n    return x + 1.0\n", namespace)
+        kernel = vos_njit(namespace['add_one'])
+        assert kernel(1.0) == 2.0
+        assert kernel is not namespace['add_one']
+
+
+class _CountingDetector(Memoizable, DetectionPrimitive):
+    """Memoized detector that counts detect calls and fails on 'bad' input."""
+
+    memo_size = 2
+
+    def __init__(self):
+        super().__init__("counting")
+        self.calls = 0
+
+    async def detect(self, input_data, context):
+        self.calls += 1
+        if input_data == 'bad':
+            raise ValueError("bad input")
+        return {'input': input_data, 'call': self.calls}
+
+
+class TestMemoizable:
+    """Memoized primitives skip work on hits and honour the cache policy."""
+
+    def _run(self, detector, *inputs, context=None, **kwargs):
+        context = context or PrimitiveContext(agent_id='agent-1')
+
+        async def run_all():
+            return [await detector.execute(context, input_data=item, **kwargs) for item in inputs]
+
+        return asyncio.run(run_all())
+
+    def test_hit_skips_work(self):
+        detector = _CountingDetector()
+        first, second = self._run(detector, 'x', 'x')
+        assert detector.calls == 1
+        assert second.status is PrimitiveStatus.COMPLETED
+        assert second.data == first.data
+        assert second.metrics['cache_hit'] is True
+        assert 'cache_hit' not in first.metrics
+
+    def test_key_ignores_per_call_context_fields(self):
+        detector = _CountingDetector()
+        self._run(detector, 'x', context=PrimitiveContext(agent_id='agent-1', session_id='s1'))
+        self._run(detector, 'x', context=PrimitiveContext(agent_id='agent-1', session_id='s2'))
+        assert detector.calls == 1
+        self._run(detector, 'x', context=PrimitiveContext(agent_id='agent-2'))
+        assert detector.calls == 2
+
+    def test_replace_recomputes_and_overwrites(self):
+        detector = _CountingDetector()
+        self._run(detector, 'x')
+        replaced, = self._run(detector, 'x', cache_policy='replace')
+        cached, = self._run(detector, 'x')
+        assert detector.calls == 2
+        assert replaced.data['call'] == 2
+        assert cached.data['call'] == 2
+
+    def test_skip_bypasses_cache(self):
+        detector = _CountingDetector()
+        self._run(detector, 'x', 'x', cache_policy='skip')
+        assert detector.calls == 2
+        assert detector.__dict__.get('_memo') is None
+
+    def test_lru_eviction(self):
+        detector = _CountingDetector()
+        self._run(detector, 'a', 'b', 'a', 'c')
+        assert detector.calls == 3
+        # 'b' was least recently used when 'c' went in
+        self._run(detector, 'a', 'c')
+        assert detector.calls == 3
+        self._run(detector, 'b')
+        assert detector.calls == 4
+
+    def test_failures_are_not_cached(self):
+        detector = _CountingDetector()
+        first, second = self._run(detector, 'bad', 'bad')
+        assert first.status is second.status is PrimitiveStatus.FAILED
+        assert detector.calls == 2
+
+    def test_unpicklable_inputs_are_not_cached(self):
+        detector = _CountingDetector()
+        self._run(detector, lambda: None, lambda: None)
+        assert detector.calls == 2
+
+
+class _SlowEchoDetector(DetectionPrimitive):
+    """Detector whose later inputs finish first."""
+
+    def __init__(self):
+        super().__init__("slow_echo")
+
+    async def detect(self, input_data, context):
+        if input_data == 'bad':
+            raise ValueError("bad input")
+        await asyncio.sleep(0.001 * (10 - input_data))
+        return {'input': input_data}
+
+
+class _EchoCompliance(CompliancePrimitive):
+    def __init__(self):
+        super().__init__("echo_compliance")
+
+    async def validate_compliance(self, data, regulations, context):
+        return {'data': data, 'regulations': regulations}
+
+
+class _EchoBenchmark(BenchmarkPrimitive):
+    def __init__(self):
+        super().__init__("echo_benchmark")
+
+    async def run_benchmark(self, test_suite, target, context):
+        return {'suite': test_suite, 'target': target}
+
+
+class _EchoUncertainty(UncertaintyPrimitive):
+    def __init__(self):
+        super().__init__("echo_uncertainty")
+
+    async def quantify(self, input_data, context):
+        return {'value': float(input_data)}
+
+
+class TestExecuteBatch:
+    """execute_batch returns one result per input, in input order."""
+
+    def _batch(self, primitive, inputs, **kwargs):
+        return asyncio.run(primitive.execute_batch(PrimitiveContext(), inputs, **kwargs))
+
+    def test_results_follow_input_order(self):
+        results = self._batch(_SlowEchoDetector(), list(range(10)))
+        assert [r.data['input'] for r in results] == list(range(10))
+        assert all(r.status is PrimitiveStatus.COMPLETED for r in results)
+
+    def test_failures_stay_in_place(self):
+        results = self._batch(_SlowEchoDetector(), [1, 'bad', 2])
+        assert [r.status for r in results] == [
+            PrimitiveStatus.COMPLETED, PrimitiveStatus.FAILED, PrimitiveStatus.COMPLETED
+        ]
+        assert results[1].errors == ["bad input"]
+
+    def test_empty_batch(self):
+        assert self._batch(_SlowEchoDetector(), []) == []
+
+    def test_input_keys_and_shared_kwargs(self):
+        compliance = self._batch(_EchoCompliance(), ['a', 'b'], regulations=['GDPR'])
+        assert [r.data for r in compliance] == [
+            {'data': 'a', 'regulations': ['GDPR']}, {'data': 'b', 'regulations': ['GDPR']}
+        ]
+        benchmark = self._batch(_EchoBenchmark(), ['m1', 'm2'], test_suite='smoke')
+        assert [r.data for r in benchmark] == [
+            {'suite': 'smoke', 'target': 'm1'}, {'suite': 'smoke', 'target': 'm2'}
+        ]
+        uncertainty = self._batch(_EchoUncertainty(), [1, 2])
+        assert [r.data for r in uncertainty] == [{'value': 1.0}, {'value': 2.0}]
+        assert uncertainty[0].metrics['uncertainty_dimensions'] == 1